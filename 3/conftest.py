@@ -0,0 +1,17 @@
+"""
+pytest配置
+test_system.py 中的测试函数以返回 True/False 表示结果（便于直接运行脚本汇总），
+pytest默认忽略返回值，这里把返回 False 视为失败
+"""
+
+import pytest
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_pyfunc_call(pyfuncitem):
+    """调用测试函数并检查返回值"""
+    funcargs = pyfuncitem.funcargs
+    testargs = {name: funcargs[name] for name in pyfuncitem._fixtureinfo.argnames}
+    result = pyfuncitem.obj(**testargs)
+    assert result is not False, f"{pyfuncitem.name} 返回 False"
+    return True
@@ -0,0 +1,70 @@
+#使用方法：python3 dfg_files/batch.py verilogcode/某.v ... -t <top1> -t <top2> [-j 8] [--timeout 600] [-o dfg_files/batch]
+#或用JSON任务文件为每个顶层模块指定各自的源文件：
+# python3 dfg_files/batch.py --jobs jobs.json -j 8
+# jobs.json: [{"topmodule": "alu", "verilog_files": ["verilogcode/4004.v"]}, ...]
+#各模块在独立进程中并行分析，输出 <输出目录>/<模块>.txt 及 manifest.json
+
+import sys
+import os
+import json
+import argparse
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from batch_frontend import BatchFrontend, BatchConfig, ModuleJob
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='批量Verilog前端：并行分析多个顶层模块')
+    parser.add_argument('verilog', nargs='*', help='输入 Verilog 源文件（所有 -t 模块共用）')
+    parser.add_argument('-t', '--top', action='append', default=[], help='顶层模块名称，可多次指定')
+    parser.add_argument('--jobs', help='JSON任务文件，每项含 topmodule、verilog_files，可选 name')
+    parser.add_argument('-o', '--output-dir', default='dfg_files/batch', help='输出目录')
+    parser.add_argument('-j', '--workers', type=int, default=os.cpu_count() or 1, help='并行进程数')
+    parser.add_argument('--timeout', type=float, default=600.0, help='每个模块的超时（秒）')
+    parser.add_argument('-I', '--include', action='append', default=[], help='预处理 include 路径，可多次指定')
+    parser.add_argument('-D', '--define', action='append', default=[], help='预处理宏定义 (NAME 或 NAME=VALUE)，可多次指定')
+    parser.add_argument('--cache-dir', default='.cache/pyverilog', help='PLY解析表与预处理缓存目录')
+    parser.add_argument('--no-cache', action='store_true', help='不使用解析表与预处理缓存')
+    parser.add_argument('--dot', action='store_true', help='同时输出 DOT')
+    parser.add_argument('--png', action='store_true', help='同时输出 PNG')
+    parser.add_argument('--graph-cache', help='将各模块的分区图写入图缓存目录')
+    parser.add_argument('--expand-operators', action='store_true', help='将嵌套运算符展开为独立节点')
+    args = parser.parse_args(argv)
+
+    jobs = [ModuleJob(topmodule=top, verilog_files=args.verilog) for top in args.top]
+    if args.jobs:
+        with open(args.jobs, 'r', encoding='utf-8') as f:
+            jobs += [ModuleJob(**entry) for entry in json.load(f)]
+    if not jobs or any(not job.verilog_files for job in jobs):
+        parser.error('需要 -t 与 Verilog 源文件，或 --jobs 任务文件')
+
+    batch = BatchFrontend(BatchConfig(
+        output_dir=args.output_dir,
+        num_workers=args.workers,
+        timeout=args.timeout,
+        include_paths=args.include,
+        defines=args.define,
+        emit_dot=args.dot,
+        emit_png=args.png,
+        graph_cache=args.graph_cache,
+        cache_dir=None if args.no_cache else args.cache_dir,
+        expand_operators=args.expand_operators
+    ))
+    try:
+        result = batch.run(jobs)
+    except Exception as e:
+        print(f'Error: {e}')
+        return 1
+
+    for module in result.modules:
+        detail = f'{module.num_nodes} 个节点' if module.status == 'ok' else module.error
+        print(f'{module.name}: {module.status} ({module.timings.get("total", 0.0):.2f}s) {detail}')
+    print(f'manifest: {result.manifest_path}')
+    print(f'{len(result.succeeded)}/{len(result.modules)} 个模块成功, 总耗时 {result.total_time:.2f}s')
+    return 0 if not result.failed else 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,80 @@
+#使用方法：python3 dfg_files/frontend.py verilogcode/某.v -t <topmodule> [--text 某.txt] [--dot 某.dot] [--png 某.png] [--graph]
+#只做一次Verilog解析与数据流分析，按需同时输出文本DFG、DOT、PNG和分区器使用的图
+#例如同时生成4004的文本DFG和数据流图：
+# python3 dfg_files/frontend.py verilogcode/4004.v -t alu --text dfg_files/4004.txt --dot img/4004/4004.dot --png img/4004/4004.png
+
+import sys
+import os
+import argparse
+from typing import List, Optional
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from dfg_parser import DFGParser
+from graph_cache import GraphCache, CompiledGraph
+from verilog_frontend import VerilogFrontend, FrontendConfig, DotOptions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description='Verilog前端：一次分析，输出文本DFG / DOT / PNG / 分区图')
+    parser.add_argument('verilog', nargs='+', help='输入 Verilog 源文件')
+    parser.add_argument('-t', '--top', required=True, help='Top 模块名称')
+    parser.add_argument('-I', '--include', action='append', default=[], help='预处理 include 路径，可多次指定')
+    parser.add_argument('-D', '--define', action='append', default=[], help='预处理宏定义 (NAME 或 NAME=VALUE)，可多次指定')
+    parser.add_argument('--cache-dir', default='.cache/pyverilog', help='PLY解析表与预处理缓存目录')
+    parser.add_argument('--no-cache', action='store_true', help='不使用解析表与预处理缓存')
+    parser.add_argument('--text', help='输出文本DFG路径')
+    parser.add_argument('--dot', help='输出 DOT 文件路径')
+    parser.add_argument('--png', help='输出 PNG 文件路径')
+    parser.add_argument('--graph', action='store_true', help='构建分区器使用的图并打印统计')
+    parser.add_argument('--graph-cache', help='将构建的图写入图缓存目录（需同时指定 --text，之后 main.py --dfg 直接命中）')
+    parser.add_argument('--expand-operators', action='store_true', help='将嵌套运算符展开为独立节点')
+    parser.add_argument('-s', '--signal', action='append', default=[], help='DOT目标信号 (可多次指定)。默认使用顶层所有信号')
+    parser.add_argument('--walk', action='store_true', help='沿连续信号步进遍历')
+    parser.add_argument('--identical', action='store_true', help='相同叶子复用标记')
+    parser.add_argument('--step', type=int, default=1, help='遍历步数')
+    parser.add_argument('--reorder', action='store_true', help='对树做重排')
+    parser.add_argument('--delay', action='store_true', help='插入延迟结点以遍历寄存器')
+    args = parser.parse_args(argv)
+
+    if args.graph_cache and not args.text:
+        parser.error('--graph-cache 需要同时指定 --text')
+    if not (args.text or args.dot or args.png or args.graph):
+        parser.error('至少指定 --text / --dot / --png / --graph 之一')
+
+    frontend = VerilogFrontend(FrontendConfig(include_paths=args.include, defines=args.define,
+                                              cache_dir=None if args.no_cache else args.cache_dir))
+    dfg_parser = DFGParser(expand_operators=args.expand_operators) if args.graph or args.graph_cache else None
+    try:
+        result = frontend.analyze(args.verilog, args.top)
+        outputs = frontend.emit(
+            result,
+            dfg_text_file=args.text,
+            dot_file=args.dot,
+            png_file=args.png,
+            dot_options=DotOptions(signals=args.signal, walk=args.walk, identical=args.identical,
+                                   step=args.step, reorder=args.reorder, delay=args.delay),
+            parser=dfg_parser
+        )
+    except Exception as e:
+        print(f'Error: {e}')
+        return 1
+
+    for view in ('text', 'dot', 'png'):
+        if view in outputs:
+            print(f'{view} generated: {outputs[view]}')
+    if 'graph' in outputs:
+        graph = outputs['graph']
+        print(f'graph: {len(graph.nodes)} 个节点, {len(graph.edges)} 条边, 线性程度 '
+              f'{dfg_parser.get_linearity_analysis()["linearity_ratio"]:.2%}')
+        if args.graph_cache:
+            cache = GraphCache(args.graph_cache)
+            key = cache.key(args.text, dfg_parser.cache_options())
+            cache.save(key, CompiledGraph.from_networkx(graph), source=os.path.abspath(args.text))
+            print(f'graph cached: {cache.path(key)}')
+    print('耗时: ' + ', '.join(f'{step} {seconds:.3f}s' for step, seconds in outputs['timings'].items()))
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -10,10 +10,10 @@ from optparse import OptionParser
 
 # the next line can be removed after installation
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
 
 import pyverilog
-from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
-from pyverilog.dataflow.graphgen import VerilogGraphGenerator
+from verilog_frontend import VerilogFrontend, FrontendConfig
 
 
 def main():
@@ -57,32 +57,10 @@ def main():
         os.makedirs(output_dir)
     output_path = os.path.join(output_dir, options.outputfile)
 
-    analyzer = VerilogDataflowAnalyzer(filelist, options.topmodule,
-                                       preprocess_include=options.include,
-                                       preprocess_define=options.define)
-    analyzer.generate()
-    terms = analyzer.getTerms()
-    binddict = analyzer.getBinddict()
-
-    # 输出数据流分析文本结果到文件
-    with open(output_path, 'w') as fout:
-        fout.write('Directive:\n')
-        if hasattr(analyzer, 'get_directives'):
-            for dr in sorted(analyzer.get_directives(), key=lambda x: str(x)):
-                fout.write(str(dr) + '\n')
-
-        fout.write('Instance:\n')
-        for module, instname in sorted(analyzer.getInstances(), key=lambda x: str(x[1])):
-            fout.write(str((module, instname)) + '\n')
-
-        fout.write('Term:\n')
-        for tk, tv in sorted(terms.items(), key=lambda x: str(x[0])):
-            fout.write(tv.tostr() + '\n')
-
-        fout.write('Bind:\n')
-        for bk, bv in sorted(binddict.items(), key=lambda x: str(x[0])):
-            for bvi in bv:
-                fout.write(bvi.tostr() + '\n')
+    # 分析与文本输出由统一前端完成（frontend.py 可在同一次分析中同时输出DOT/PNG）
+    frontend = VerilogFrontend(FrontendConfig(include_paths=options.include, defines=options.define))
+    result = frontend.analyze(filelist, options.topmodule)
+    frontend.write_dfg_text(result, output_path)
     print(f"Dataflow analysis result saved to {output_path}")
 
 if __name__ == '__main__':
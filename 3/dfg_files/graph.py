@@ -9,10 +9,10 @@ import argparse
 import shutil
 from typing import List, Optional, Tuple, Dict, Any
 import json
-from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
-from pyverilog.dataflow.optimizer         import VerilogDataflowOptimizer
-from pyverilog.dataflow.graphgen          import VerilogGraphGenerator
-from pyverilog.controlflow.controlflow_analyzer import VerilogControlflowAnalyzer
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from verilog_frontend import VerilogFrontend, FrontendConfig, DotOptions
 
 
 def parse_defines(define_args: List[str]) -> Tuple[List[str], List[Tuple[str, str]]]:
@@ -56,8 +56,7 @@ def generate_dataflow_graph(verilog_file: str,
                             step: int = 1,
                             reorder: bool = False,
                             delay: bool = False) -> Optional[str]:
-    # 1) 解析 AST 并建立数据流表
-    filelist = [verilog_file]
+    # 解析、数据流分析与DOT生成由统一前端完成（frontend.py 可在同一次分析中同时输出文本DFG）
     include_paths = include_paths or []
     macros = macros or []
     macrodefs = macrodefs or []
@@ -67,102 +66,15 @@ def generate_dataflow_graph(verilog_file: str,
     define_list = list(macros)
     define_list += [f"{k}={v}" for (k, v) in macrodefs]
 
-    analyzer = VerilogDataflowAnalyzer(
-        filelist,
-        topmodule,
-        preprocess_include=include_paths,
-        preprocess_define=define_list or None,
-    )
-
-    analyzer.generate()
-    terms    = analyzer.getTerms()
-    binddict = analyzer.getBinddict()
-
-    # 2) 优化并解析常量，得到 resolved_* 与 constlist
-    optimizer = VerilogDataflowOptimizer(terms, binddict)
-    optimizer.resolveConstant()
-    resolved_terms    = optimizer.getResolvedTerms()
-    resolved_binddict = optimizer.getResolvedBinddict()
-    constlist         = optimizer.getConstlist()
-
-    # 3) 构建图，并对目标信号生成节点关系
-    generator = VerilogGraphGenerator(topmodule, terms, binddict,
-                                      resolved_terms, resolved_binddict,
-                                      constlist, verilog_file)
-
-    # 提升可读性：设置图、节点、边的样式
-    try:
-        g = generator.graph
-        g.graph_attr.update(rankdir='LR', splines='spline', concentrate='true', bgcolor='white')
-        g.node_attr.update(shape='box', style='rounded,filled', fillcolor='white', color='black', fontname='Helvetica', fontsize='10')
-        g.edge_attr.update(color='#555555', arrowsize='0.6')
-    except Exception:
-        pass
-
-    # 若未指定目标信号，则默认对解析到的所有顶层信号生成
-    if not target_signals:
-        # 选择所有绑定表的左值符号作为默认目标（通常是输出或被赋值的寄存器/线网）
-        try:
-            lhs_terms = list(binddict.keys())
-        except Exception:
-            lhs_terms = []
-        # 过滤掉参数、局部参数、genvar、函数等非常量信号
-        try:
-            from pyverilog.utils import signaltype
-            filtered = []
-            for t in lhs_terms:
-                term = terms.get(t)
-                if term is None:
-                    continue
-                tt = term.termtype
-                if signaltype.isParameter(tt) or signaltype.isLocalparam(tt) or signaltype.isGenvar(tt) or signaltype.isFunction(tt):
-                    continue
-                if (signaltype.isWire(tt) or signaltype.isReg(tt) or signaltype.isInput(tt) or
-                    signaltype.isOutput(tt) or signaltype.isInout(tt) or signaltype.isInteger(tt)):
-                    filtered.append(str(t))
-            target_signals = filtered if filtered else [str(t) for t in lhs_terms]
-        except Exception:
-            target_signals = [str(t) for t in lhs_terms]
-
-    # 规范化信号名：若未带作用域，则加上顶层模块前缀（t0 -> spaghetti_combo.t0）
-    def _qualify_signal_name(name: str) -> str:
-        if not name:
-            return name
-        return name if ('.' in name) else f"{topmodule}.{name}"
-
-    target_signals = [_qualify_signal_name(s) for s in target_signals]
-
-    for sig in target_signals:
-        generator.generate(sig, walk=walk, identical=identical,
-                           step=step, do_reorder=reorder, delay=delay)
-
-    ensure_parent_dir(output_dot)
-    # 4) 写出 DOT（直接从 pygraphviz 的 AGraph 导出）
-    generator.graph.write(output_dot)
+    frontend = VerilogFrontend(FrontendConfig(include_paths=include_paths, defines=define_list))
+    result = frontend.analyze([verilog_file], topmodule)
+    dot_text = frontend.write_dot(result, output_dot, output_img, DotOptions(
+        signals=target_signals or [], walk=walk, identical=identical,
+        step=step, reorder=reorder, delay=delay))
     print(f'DOT file generated: {output_dot}')
-    # 同时返回文本（若需要）
-    dot_text = None
-    try:
-        dot_text = generator.graph.string()
-    except Exception:
-        pass
-
-    # 已移除JSON输出逻辑
-
-    # 6) 可选：转换为 PNG
-    if output_img:
-        if shutil.which('dot') is None:
-            print('Warning: graphviz 未安装或找不到 dot，可通过 `sudo apt install graphviz` 安装。')
-        else:
-            ensure_parent_dir(output_img)
-            try:
-                generator.graph.layout(prog='dot')
-                generator.graph.draw(output_img)
-                print(f'Image file generated: {output_img}')
-            except Exception as e:
-                print(f'Warning: 生成 PNG 失败: {e}')
+    if output_img and shutil.which('dot') is not None and os.path.exists(output_img):
+        print(f'Image file generated: {output_img}')
     return dot_text
-    # 注意：后续控制流图处理在返回前已完成
 
 
 def main(argv: Optional[List[str]] = None) -> int:
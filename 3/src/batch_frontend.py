@@ -0,0 +1,252 @@
+"""
+批量Verilog前端模块
+将多个相互独立的顶层模块分配到工作进程中并行分析，每个模块有单独的超时，
+输出各模块的文本DFG（可选DOT/PNG与图缓存）并写出清单（manifest），
+下游可一次读取全部模块的产物与耗时
+"""
+
+import os
+import json
+import time
+import multiprocessing
+from multiprocessing.connection import wait
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field, asdict
+
+
+MANIFEST_VERSION = 1
+
+
+@dataclass
+class ModuleJob:
+    """单个顶层模块的分析任务"""
+    topmodule: str
+    verilog_files: List[str]
+    name: Optional[str] = None  # 输出文件名，默认为顶层模块名
+
+    @property
+    def output_name(self) -> str:
+        return self.name or self.topmodule
+
+
+@dataclass
+class BatchConfig:
+    """批量前端配置参数"""
+    output_dir: str = 'dfg_files/batch'
+    num_workers: int = 4
+    timeout: float = 600.0            # 每个模块的超时（秒）
+    include_paths: List[str] = field(default_factory=list)
+    defines: List[str] = field(default_factory=list)
+    emit_dot: bool = False
+    emit_png: bool = False
+    graph_cache: Optional[str] = None  # 图缓存目录，设置时同时构建分区图并写入缓存
+    cache_dir: Optional[str] = '.cache/pyverilog'  # PLY解析表与预处理缓存目录
+    expand_operators: bool = False
+
+
+@dataclass
+class ModuleResult:
+    """单个模块的分析结果（清单中的一项）"""
+    name: str
+    topmodule: str
+    verilog_files: List[str]
+    status: str                        # 'ok' / 'timeout' / 'error'
+    outputs: Dict[str, str] = field(default_factory=dict)
+    timings: Dict[str, float] = field(default_factory=dict)
+    num_nodes: Optional[int] = None
+    num_edges: Optional[int] = None
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchResult:
+    """批量分析结果"""
+    modules: List[ModuleResult]
+    manifest_path: str
+    total_time: float
+
+    @property
+    def succeeded(self) -> List[ModuleResult]:
+        return [module for module in self.modules if module.status == 'ok']
+
+    @property
+    def failed(self) -> List[ModuleResult]:
+        return [module for module in self.modules if module.status != 'ok']
+
+
+def analyze_module(job: ModuleJob, config: BatchConfig) -> Dict[str, Any]:
+    """在当前进程中分析一个模块并写出产物（工作进程入口，返回可序列化的结果）"""
+    from dfg_parser import DFGParser
+    from graph_cache import GraphCache, CompiledGraph
+    from verilog_frontend import VerilogFrontend, FrontendConfig
+
+    start_time = time.time()
+    base = os.path.join(config.output_dir, job.output_name)
+    frontend = VerilogFrontend(FrontendConfig(include_paths=config.include_paths, defines=config.defines,
+                                              cache_dir=config.cache_dir))
+    parser = DFGParser(expand_operators=config.expand_operators)
+
+    result = frontend.analyze(job.verilog_files, job.topmodule)
+    produced = frontend.emit(
+        result,
+        dfg_text_file=base + '.txt',
+        dot_file=base + '.dot' if config.emit_dot or config.emit_png else None,
+        png_file=base + '.png' if config.emit_png else None,
+        parser=parser
+    )
+    outputs = {view: produced[view] for view in ('text', 'dot', 'png') if view in produced}
+    graph = produced['graph']
+
+    if config.graph_cache:
+        cache = GraphCache(config.graph_cache)
+        key = cache.key(outputs['text'], parser.cache_options())
+        cache.save(key, CompiledGraph.from_networkx(graph), source=os.path.abspath(outputs['text']))
+        outputs['graph_cache'] = cache.path(key)
+
+    timings = dict(produced['timings'])
+    timings['total'] = time.time() - start_time
+    return {
+        'outputs': outputs,
+        'timings': timings,
+        'num_nodes': graph.number_of_nodes(),
+        'num_edges': graph.number_of_edges()
+    }
+
+
+def _worker(job: ModuleJob, config: BatchConfig, connection):
+    """子进程：分析模块并通过管道回传结果或异常信息"""
+    try:
+        connection.send(('ok', analyze_module(job, config)))
+    except BaseException as e:
+        connection.send(('error', f"{type(e).__name__}: {e}"))
+    finally:
+        connection.close()
+
+
+class BatchFrontend:
+    """并行批量前端
+
+    每个模块在独立子进程中运行，超时的子进程被直接终止，
+    不会像进程池中的任务那样一直占用工作进程
+    """
+
+    def __init__(self, config: BatchConfig = None):
+        self.config = config or BatchConfig()
+
+    def run(self, jobs: List[ModuleJob]) -> BatchResult:
+        """并行分析全部模块并写出清单"""
+        start_time = time.time()
+        os.makedirs(self.config.output_dir, exist_ok=True)
+        self._check_names(jobs)
+        self._prepare_tables()
+
+        context = multiprocessing.get_context()
+        pending = list(enumerate(jobs))
+        running: Dict[Any, tuple] = {}  # 管道 -> (序号, 任务, 进程, 开始时间)
+        results: Dict[int, ModuleResult] = {}
+
+        while pending or running:
+            # 补足工作进程
+            while pending and len(running) < max(1, self.config.num_workers):
+                index, job = pending.pop(0)
+                receiver, sender = context.Pipe(duplex=False)
+                process = context.Process(target=_worker, args=(job, self.config, sender), daemon=True)
+                process.start()
+                sender.close()
+                running[receiver] = (index, job, process, time.time())
+
+            # 等待任一模块完成或最近的超时到期
+            now = time.time()
+            next_deadline = min(started + self.config.timeout for _, _, _, started in running.values())
+            for receiver in wait(list(running), timeout=max(0.0, next_deadline - now)):
+                index, job, process, started = running.pop(receiver)
+                try:
+                    status, payload = receiver.recv()
+                except EOFError:
+                    status, payload = 'error', f"工作进程异常退出 (exitcode={process.exitcode})"
+                receiver.close()
+                process.join()
+                results[index] = self._module_result(job, status, payload, time.time() - started)
+
+            # 终止超时的模块
+            now = time.time()
+            for receiver, (index, job, process, started) in list(running.items()):
+                if now - started >= self.config.timeout:
+                    process.terminate()
+                    process.join()
+                    receiver.close()
+                    del running[receiver]
+                    results[index] = self._module_result(
+                        job, 'timeout', f"超过 {self.config.timeout:g} 秒", now - started)
+
+        modules = [results[index] for index in range(len(jobs))]
+        manifest_path = self.write_manifest(modules, time.time() - start_time)
+        return BatchResult(modules=modules, manifest_path=manifest_path, total_time=time.time() - start_time)
+
+    def _module_result(self, job: ModuleJob, status: str, payload, elapsed: float) -> ModuleResult:
+        result = ModuleResult(name=job.output_name, topmodule=job.topmodule,
+                              verilog_files=list(job.verilog_files), status=status)
+        if status == 'ok':
+            result.outputs = payload['outputs']
+            result.timings = payload['timings']
+            result.num_nodes = payload['num_nodes']
+            result.num_edges = payload['num_edges']
+        else:
+            result.error = payload
+            result.timings = {'total': elapsed}
+        return result
+
+    def _prepare_tables(self):
+        """在主进程中预先生成PLY解析表，工作进程只读取缓存"""
+        from verilog_frontend import PYVERILOG_AVAILABLE
+        if self.config.cache_dir and PYVERILOG_AVAILABLE:
+            from frontend_cache import FrontendCache
+            FrontendCache(self.config.cache_dir).ensure_tables()
+
+    @staticmethod
+    def _check_names(jobs: List[ModuleJob]):
+        names = [job.output_name for job in jobs]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"输出名重复，请为任务指定不同的name: {duplicates}")
+
+    def write_manifest(self, modules: List[ModuleResult], total_time: float) -> str:
+        """写出清单：各模块的状态、产物路径、节点数与耗时"""
+        path = os.path.join(self.config.output_dir, 'manifest.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': MANIFEST_VERSION,
+                'created': time.strftime('%Y-%m-%d %H:%M:%S'),
+                'num_workers': self.config.num_workers,
+                'timeout': self.config.timeout,
+                'total_time': total_time,
+                'modules': [asdict(module) for module in modules]
+            }, f, indent=2, ensure_ascii=False)
+        return path
+
+
+def load_manifest(path: str, only_ok: bool = True) -> List[ModuleResult]:
+    """读取清单，默认只返回分析成功的模块"""
+    with open(path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    if data.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"不支持的清单版本: {data.get('version')}")
+    modules = [ModuleResult(**entry) for entry in data.get('modules', [])]
+    return [module for module in modules if module.status == 'ok'] if only_ok else modules
+
+
+def main():
+    """测试函数"""
+    jobs = [ModuleJob(topmodule='alu', verilog_files=['verilogcode/4004.v'])]
+    batch = BatchFrontend(BatchConfig(output_dir='/tmp/batch_frontend_demo', num_workers=2, timeout=120))
+    result = batch.run(jobs)
+
+    print("批量前端结果:")
+    for module in result.modules:
+        print(f"  {module.name}: {module.status}, 节点 {module.num_nodes}, "
+              f"耗时 {module.timings.get('total', 0.0):.2f}秒 {module.error or ''}")
+    print(f"  清单: {result.manifest_path}, 总耗时 {result.total_time:.2f}秒")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Bind树解析模块
+对pyverilog Bind树文本（tostr格式）做一遍分词和自顶向下语法分析，
+时间与文本长度成线性，运算符嵌套与操作数结构完整保留：
+  节点 := '(' 类型 [值] 字段* ')'
+  字段 := 标签':' 节点 (',' 节点)*
+例如 (Operator Plus Next:(Terminal top.a),(IntConst 1))
+"""
+
+import re
+from typing import Dict, List, Optional, Iterator
+from dataclasses import dataclass, field
+
+
+# 词法单元：括号、逗号和其余连续字符（标签以':'结尾）
+TOKEN_PATTERN = re.compile(r'[(),]|[^\s(),]+')
+
+# 叶节点类型
+LEAF_KINDS = {'Terminal', 'IntConst', 'FloatConst', 'StringConst'}
+
+
+class TreeSyntaxError(ValueError):
+    """Bind树文本不符合语法"""
+
+
+@dataclass
+class TreeNode:
+    """Bind树节点"""
+    kind: str                    # Operator / Terminal / IntConst / Partselect / Pointer / Concat / Branch ...
+    value: Optional[str] = None  # 运算符名、终端名或常量值
+    fields: Dict[str, List['TreeNode']] = field(default_factory=dict)  # 标签 -> 子节点
+
+    @property
+    def label(self) -> str:
+        """运算符节点为运算符名，其余为节点类型"""
+        return self.value if self.kind == 'Operator' and self.value else self.kind
+
+    @property
+    def is_leaf(self) -> bool:
+        return self.kind in LEAF_KINDS
+
+    @property
+    def children(self) -> List['TreeNode']:
+        """按字段顺序排列的子节点"""
+        return [child for children in self.fields.values() for child in children]
+
+    def walk(self) -> Iterator['TreeNode']:
+        """先序遍历（显式栈，不受递归深度限制）"""
+        stack = [self]
+        while stack:
+            node = stack.pop()
+            yield node
+            stack.extend(reversed(node.children))
+
+    def leaves(self) -> Iterator['TreeNode']:
+        """先序排列的叶节点"""
+        return (node for node in self.walk() if node.is_leaf)
+
+
+def parse_bind_tree(text: str) -> TreeNode:
+    """解析Bind树文本，返回根节点"""
+    tokens = TOKEN_PATTERN.findall(text)
+    stack: List[List] = []  # [节点, 当前字段标签]
+    root = None
+    position = 0
+
+    while position < len(tokens):
+        token = tokens[position]
+        position += 1
+
+        if token == '(':
+            if root is not None or position >= len(tokens) or tokens[position] in '(),':
+                raise TreeSyntaxError(f"位置{position}处缺少节点类型: {text[:80]}")
+            node = TreeNode(kind=tokens[position])
+            position += 1
+            if stack:
+                parent, label = stack[-1]
+                if label is None:
+                    raise TreeSyntaxError(f"子节点缺少字段标签: {text[:80]}")
+                parent.fields[label].append(node)
+            stack.append([node, None])
+
+        elif token == ')':
+            if not stack:
+                raise TreeSyntaxError(f"括号不匹配: {text[:80]}")
+            node, _ = stack.pop()
+            if not stack:
+                root = node
+
+        elif token == ',':
+            if not stack or stack[-1][1] is None:
+                raise TreeSyntaxError(f"逗号不在字段列表中: {text[:80]}")
+
+        elif token.endswith(':') and stack and not stack[-1][0].is_leaf:
+            label = token[:-1]
+            stack[-1][1] = label
+            stack[-1][0].fields.setdefault(label, [])
+
+        else:
+            if not stack or stack[-1][1] is not None:
+                raise TreeSyntaxError(f"意外的值 {token}: {text[:80]}")
+            node = stack[-1][0]
+            node.value = token if node.value is None else f"{node.value} {token}"
+
+    if stack or root is None:
+        raise TreeSyntaxError(f"括号不匹配: {text[:80]}")
+    return root
+
+
+def main():
+    """测试函数"""
+    text = ("(Operator Unot Next:(Operator And Next:(Operator Or Next:(Terminal top.a),"
+            "(Operator Plus Next:(Terminal top.b),(IntConst 1))),"
+            "(Partselect Var:(Terminal top.c) MSB:(IntConst 3) LSB:(IntConst 0))))")
+    root = parse_bind_tree(text)
+
+    print("Bind树解析结果:")
+    print(f"  根运算符: {root.label}")
+    print(f"  运算符节点: {[node.label for node in root.walk() if not node.is_leaf]}")
+    print(f"  叶节点: {[(node.kind, node.value) for node in root.leaves()]}")
+
+
+if __name__ == "__main__":
+    main()
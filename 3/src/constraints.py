@@ -0,0 +1,270 @@
+"""
+资源约束模块
+将config.json中的ONN面积/功耗预算与电子面积预算作为硬约束：
+按域维护节点权重与加权度数的累加量，移动节点时只更新受影响的域，
+超出预算的移动在计算完整成本之前即被拒绝；
+在化简图上搜索时，超节点的用量为其成员在原图上的用量之和，与展开后的分区一致
+"""
+
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Optional, Iterable, Any
+from dataclasses import dataclass
+
+from cost_function import CostFunction
+from graph_reduction import ReducedGraph
+
+
+@dataclass
+class ResourceBudgets:
+    """资源预算（按域分别约束，None表示不限制）"""
+    onn_area: Optional[float] = None         # 每个ONN核面积上限 (mm²)
+    onn_power: Optional[float] = None        # 每个ONN核功耗上限 (mW)
+    electronic_area: Optional[float] = None  # 每个电子域面积上限 (mm²)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> 'ResourceBudgets':
+        """从配置中的 onn_parameters / electronic_parameters 读取预算"""
+        onn = config.get('onn_parameters', {}) or {}
+        electronic = config.get('electronic_parameters', {}) or {}
+        return cls(
+            onn_area=onn.get('area_constraint'),
+            onn_power=onn.get('power_budget'),
+            electronic_area=electronic.get('area_constraint')
+        )
+
+    def is_unlimited(self) -> bool:
+        return self.onn_area is None and self.onn_power is None and self.electronic_area is None
+
+
+@dataclass
+class ConstraintViolation:
+    """单项预算违反"""
+    domain: int
+    resource: str
+    usage: float
+    budget: float
+
+
+class ConstraintChecker:
+    """基于累加量的资源预算检查器"""
+
+    def __init__(self, graph: nx.DiGraph, cost_function: CostFunction = None,
+                 budgets: ResourceBudgets = None, reduction: ReducedGraph = None):
+        self.cost_function = cost_function or CostFunction()
+        self.domains = self.cost_function.domains
+        self.budgets = budgets or ResourceBudgets()
+
+        # 每个节点对资源的贡献：权重（电子面积）与权重×度数（ONN面积和功耗）
+        original = reduction.original if reduction is not None and reduction.graph is graph else None
+        source = original if original is not None else graph
+        node_weights = {node: float(self.cost_function._node_weight(source, node)) for node in source.nodes()}
+        node_loads = {node: node_weights[node] * source.degree(node) for node in source.nodes()}
+
+        num_domains = self.domains.num_domains
+        # 化简时剪除的节点固定在 pruned_partition 域，作为该域的基础用量
+        self.base_weight = np.zeros(num_domains)
+        self.base_load = np.zeros(num_domains)
+        self.base_count = np.zeros(num_domains, dtype=np.int64)
+        if original is None:
+            self.weights = node_weights
+            self.loads = node_loads
+            self.counts = {node: 1 for node in graph.nodes()}
+        else:
+            members = {node: reduction.members.get(node, [node]) for node in graph.nodes()}
+            self.weights = {node: sum(node_weights[member] for member in group) for node, group in members.items()}
+            self.loads = {node: sum(node_loads[member] for member in group) for node, group in members.items()}
+            self.counts = {node: len(group) for node, group in members.items()}
+            for node in reduction.pruned:
+                self.base_weight[reduction.pruned_partition] += node_weights[node]
+                self.base_load[reduction.pruned_partition] += node_loads[node]
+                self.base_count[reduction.pruned_partition] += 1
+
+        self.domain_weight = np.zeros(num_domains)
+        self.domain_load = np.zeros(num_domains)
+        self.domain_count = np.zeros(num_domains, dtype=np.int64)
+        self.partition: Optional[Dict[str, int]] = None
+
+        self.checked_moves = 0
+        self.rejected_moves = 0
+
+    def set_partition(self, partition: Dict[str, int]):
+        """按完整分区重新计算各域累加量（缺失节点视为域0）"""
+        self.partition = {node: partition.get(node, 0) for node in self.weights}
+        self.domain_weight[:] = self.base_weight
+        self.domain_load[:] = self.base_load
+        self.domain_count[:] = self.base_count
+        for node, part in self.partition.items():
+            self.domain_weight[part] += self.weights[node]
+            self.domain_load[part] += self.loads[node]
+            self.domain_count[part] += self.counts[node]
+
+    def allows(self, partition: Dict[str, int], nodes: Iterable[str]) -> bool:
+        """判断从当前分区移动nodes到partition中的域是否满足预算
+
+        超出预算的域只允许不增加超出量的移动，使不可行的起点也能逐步回到可行区域
+        """
+        if self.partition is None:
+            self.set_partition(partition)
+        self.checked_moves += 1
+        if self._allows_changes(self._changes(partition, nodes)):
+            return True
+        self.rejected_moves += 1
+        return False
+
+    def commit(self, partition: Dict[str, int], nodes: Iterable[str]):
+        """接受移动：只更新受影响域的累加量"""
+        if self.partition is None:
+            self.set_partition(partition)
+            return
+        for node, target in self._changes(partition, nodes).items():
+            self._apply(node, target)
+
+    def is_feasible(self, partition: Optional[Dict[str, int]] = None) -> bool:
+        """判断分区（默认为当前分区）是否满足全部预算"""
+        return not self.violations(partition)
+
+    def violations(self, partition: Optional[Dict[str, int]] = None) -> List[ConstraintViolation]:
+        """列出分区中超出预算的项"""
+        if partition is not None:
+            self.set_partition(partition)
+        if self.partition is None:
+            return []
+
+        violations = []
+        for domain in range(self.domains.num_domains):
+            for resource, usage, budget in self._usage(domain, self.domain_weight[domain],
+                                                       self.domain_load[domain], self.domain_count[domain]):
+                if budget is not None and usage > budget:
+                    violations.append(ConstraintViolation(domain, resource, usage, budget))
+        return violations
+
+    def repair(self, partition: Dict[str, int]) -> Dict[str, int]:
+        """贪心修复：将超预算域中负载最大的节点依次移到仍有余量的域
+
+        无法完全修复时返回尽量接近可行的分区，调用方可用 is_feasible 判断
+        """
+        self.set_partition(partition)
+        repaired = dict(partition)
+        repaired.update(self.partition)
+
+        for domain in range(self.domains.num_domains):
+            if self._excess(domain) <= 0:
+                continue
+            if self.domains.is_onn(domain):
+                targets = self.domains.electronic_domains()
+                resource = self.loads
+            else:
+                targets = self.domains.onn_domains()
+                resource = self.weights
+
+            members = sorted((node for node, part in self.partition.items() if part == domain),
+                             key=lambda node: resource[node], reverse=True)
+            for node in members:
+                if self._excess(domain) <= 0:
+                    break
+                for target in targets:
+                    if self._allows_changes({node: target}):
+                        self._apply(node, target)
+                        repaired[node] = target
+                        break
+        return repaired
+
+    def _changes(self, partition: Dict[str, int], nodes: Iterable[str]) -> Dict[str, int]:
+        """移动涉及的节点中域发生变化的部分"""
+        return {node: partition[node] for node in dict.fromkeys(nodes)
+                if node in self.partition and partition.get(node, self.partition[node]) != self.partition[node]}
+
+    def _allows_changes(self, changes: Dict[str, int]) -> bool:
+        if not changes:
+            return True
+
+        delta = {}
+        for node, target in changes.items():
+            source = self.partition[node]
+            for domain, sign in ((source, -1.0), (target, 1.0)):
+                entry = delta.setdefault(domain, [0.0, 0.0, 0])
+                entry[0] += sign * self.weights[node]
+                entry[1] += sign * self.loads[node]
+                entry[2] += int(sign) * self.counts[node]
+
+        for domain, (weight, load, count) in delta.items():
+            new_excess = self._excess(domain, self.domain_weight[domain] + weight,
+                                      self.domain_load[domain] + load, self.domain_count[domain] + count)
+            if new_excess > 0 and new_excess > self._excess(domain) + 1e-12:
+                return False
+        return True
+
+    def _apply(self, node: str, target: int):
+        source = self.partition[node]
+        self.partition[node] = target
+        self.domain_weight[source] -= self.weights[node]
+        self.domain_load[source] -= self.loads[node]
+        self.domain_count[source] -= self.counts[node]
+        self.domain_weight[target] += self.weights[node]
+        self.domain_load[target] += self.loads[node]
+        self.domain_count[target] += self.counts[node]
+
+    def _usage(self, domain: int, weight: float, load: float, count: int):
+        """域的资源用量 (名称, 用量, 预算)，空域不占用资源"""
+        if count <= 0:
+            return []
+        if self.domains.is_onn(domain):
+            return [('onn_area', float(self.cost_function._onn_tile_area(load)), self.budgets.onn_area),
+                    ('onn_power', float(self.cost_function._onn_tile_power(load)), self.budgets.onn_power)]
+        return [('electronic_area', float(self.cost_function._electronic_area_per_weight() * weight),
+                 self.budgets.electronic_area)]
+
+    def _excess(self, domain: int, weight: Optional[float] = None, load: Optional[float] = None,
+                count: Optional[int] = None) -> float:
+        """域超出预算的总量（未给出用量时取当前累加量）"""
+        if weight is None:
+            weight, load, count = self.domain_weight[domain], self.domain_load[domain], self.domain_count[domain]
+        return sum(max(0.0, usage - budget) for _, usage, budget in self._usage(domain, weight, load, count)
+                   if budget is not None)
+
+    def analyze(self) -> Dict[str, Any]:
+        """统计各域资源用量与拒绝次数"""
+        usage = {}
+        for domain in range(self.domains.num_domains):
+            usage[domain] = {resource: value for resource, value, _ in
+                             self._usage(domain, self.domain_weight[domain],
+                                         self.domain_load[domain], self.domain_count[domain])}
+        return {
+            'feasible': self.is_feasible(),
+            'usage': usage,
+            'checked_moves': self.checked_moves,
+            'rejected_moves': self.rejected_moves
+        }
+
+
+def main():
+    """测试函数"""
+    # 星形图：中心节点度数高，放入ONN后功耗超出预算
+    graph = nx.DiGraph()
+    graph.add_edges_from([('hub', f'n{i}') for i in range(8)] + [('a', 'b')])
+
+    cost_func = CostFunction()
+    budgets = ResourceBudgets(onn_area=10.0, onn_power=13.0, electronic_area=5.0)
+    checker = ConstraintChecker(graph, cost_func, budgets)
+
+    partition = {node: 0 for node in graph.nodes()}
+    partition.update({'a': 1, 'b': 1})
+    checker.set_partition(partition)
+
+    print("资源约束结果:")
+    print(f"  初始分区可行: {checker.is_feasible()}")
+    moved = dict(partition, hub=1)
+    print(f"  将hub移入ONN: {'允许' if checker.allows(moved, ['hub']) else '拒绝'}")
+    moved = dict(partition, n0=1)
+    print(f"  将n0移入ONN: {'允许' if checker.allows(moved, ['n0']) else '拒绝'}")
+
+    infeasible = {node: 1 for node in graph.nodes()}
+    print(f"  全部ONN时违反项: {[(v.resource, round(v.usage, 2)) for v in checker.violations(infeasible)]}")
+    repaired = checker.repair(infeasible)
+    print(f"  修复后ONN节点: {sorted(n for n, p in repaired.items() if p == 1)}")
+    print(f"  统计: {checker.analyze()}")
+
+
+if __name__ == "__main__":
+    main()
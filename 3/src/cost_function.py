@@ -5,8 +5,11 @@
 
 import numpy as np
 import networkx as nx
-from typing import Dict, List, Tuple, Any
-from dataclasses import dataclass
+from typing import Dict, List, Tuple, Optional, Any
+from dataclasses import dataclass, field
+
+from dfg_parser import graph_version
+from cost_terms import CostTerm, TermContext, TERM_REGISTRY, BUILTIN_TERM_NAMES, create_term
 
 
 @dataclass
@@ -19,6 +22,35 @@ class CostWeights:
     interface_weight: float = 0.1
 
 
+@dataclass
+class PartitionDomains:
+    """分区域定义：分区取值即域编号，默认两路分区中0为电子部分、1为ONN"""
+    kinds: List[str] = field(default_factory=lambda: ['electronic', 'onn'])
+    capacities: Optional[List[Optional[float]]] = None  # 各域容量（按节点权重计），None表示不限
+    
+    @property
+    def num_domains(self) -> int:
+        return len(self.kinds)
+    
+    def is_onn(self, domain: int) -> bool:
+        """判断域是否为ONN核"""
+        return 0 <= domain < len(self.kinds) and self.kinds[domain] == 'onn'
+    
+    def is_electronic(self, domain: int) -> bool:
+        """判断域是否为电子岛"""
+        return 0 <= domain < len(self.kinds) and self.kinds[domain] == 'electronic'
+    
+    def onn_domains(self) -> List[int]:
+        return [d for d, kind in enumerate(self.kinds) if kind == 'onn']
+    
+    def electronic_domains(self) -> List[int]:
+        return [d for d, kind in enumerate(self.kinds) if kind == 'electronic']
+
+
+# 多目标模式下的目标（均为越小越好）
+OBJECTIVE_NAMES = ('area_cost', 'delay_cost', 'error_cost', 'interface_cost')
+
+
 @dataclass
 class CostMetrics:
     """成本指标"""
@@ -28,13 +60,30 @@ class CostMetrics:
     complexity_cost: float
     interface_cost: float
     total_cost: float
+    extra_costs: Dict[str, float] = field(default_factory=dict)  # 注册的扩展成本项
+    
+    def objective_vector(self, names: Tuple[str, ...] = OBJECTIVE_NAMES) -> np.ndarray:
+        """按目标名称返回目标向量"""
+        return np.array([getattr(self, name) for name in names], dtype=float)
 
 
 class CostFunction:
     """成本函数计算器"""
     
-    def __init__(self, weights: CostWeights = None):
+    def __init__(self, weights: CostWeights = None, domains: PartitionDomains = None):
         self.weights = weights or CostWeights()
+        self.domains = domains or PartitionDomains()
+        
+        # 线网模型（可选）：启用后割与接口按线网连通度减一计算
+        self.net_model = None
+        
+        # 成本项日志（可选）：记录每次评估的成本项向量，供更换权重后重新排序
+        self.term_log = None
+        
+        # 注册的扩展成本项及其权重，以及按图缓存的稠密评估上下文
+        self.extra_terms: List[Tuple[CostTerm, float]] = []
+        self._builtin_terms = [TERM_REGISTRY[name]() for name in BUILTIN_TERM_NAMES]
+        self._term_context: Optional[TermContext] = None
         
         # ONN面积估算参数（基于Lightelligence和Lightmatter架构）
         self.onn_area_params = {
@@ -50,6 +99,12 @@ class CostFunction:
             'reg_area': 0.0005,  # 寄存器面积
             'routing_factor': 1.2  # 布线因子
         }
+        
+        # ONN功耗估算参数（每个ONN核：激光器与控制电路静态功耗 + 每条加权连接的调制/探测功耗）
+        self.onn_power_params = {
+            'base_power': 10.0,          # 静态功耗 (mW)
+            'per_connection_power': 0.5  # 每条连接功耗 (mW)
+        }
     
     def calculate_total_cost(self, 
                            graph: nx.DiGraph,
@@ -74,14 +129,29 @@ class CostFunction:
             self.weights.interface_weight * interface_cost
         )
         
-        return CostMetrics(
+        # 注册的扩展成本项
+        extra_costs = {}
+        if self.extra_terms:
+            context = self.term_context(graph)
+            parts = context.dense(partition)
+            for term, weight in self.extra_terms:
+                extra_costs[term.name] = term.evaluate(context, parts)
+                total_cost += weight * extra_costs[term.name]
+        
+        metrics = CostMetrics(
             area_cost=area_cost,
             delay_cost=delay_cost,
             error_cost=error_cost,
             complexity_cost=complexity_cost,
             interface_cost=interface_cost,
-            total_cost=total_cost
+            total_cost=total_cost,
+            extra_costs=extra_costs
         )
+        
+        if self.term_log is not None:
+            self.term_log.record(partition, metrics)
+        
+        return metrics
     
     def _calculate_area_cost(self, graph: nx.DiGraph, partition: Dict[str, int]) -> float:
         """计算面积成本"""
@@ -93,34 +163,55 @@ class CostFunction:
         return total_area / 100.0  # 假设100mm²为基准
     
     def _estimate_onn_area(self, graph: nx.DiGraph, partition: Dict[str, int]) -> float:
-        """估算ONN面积"""
-        onn_nodes = [node for node, part in partition.items() if part == 1]
-        
-        if not onn_nodes:
-            return 0.0
-        
-        # 计算矩阵大小（基于节点数量和连接度）
-        matrix_size = len(onn_nodes)
-        avg_degree = np.mean([graph.degree(node) for node in onn_nodes])
-        
-        # 基于Lightelligence架构的面积模型
-        area = (self.onn_area_params['base_area'] +
-                self.onn_area_params['matrix_size_factor'] * matrix_size * avg_degree +
-                self.onn_area_params['wavelength_factor'] * 1.55 +  # 1550nm波长
-                self.onn_area_params['power_factor'] * 0.1)  # 假设100mW功耗
+        """估算ONN面积（每个ONN核分别计算后求和）"""
+        area = 0.0
+        for domain in self.domains.onn_domains():
+            onn_nodes = [node for node, part in partition.items() if part == domain]
+            
+            if not onn_nodes:
+                continue
+            
+            # 计算矩阵大小（基于节点数量和连接度，超节点按权重计）
+            node_weights = [self._node_weight(graph, node) for node in onn_nodes]
+            matrix_size = sum(node_weights)
+            avg_degree = np.average([graph.degree(node) for node in onn_nodes], weights=node_weights)
+            
+            # 基于Lightelligence架构的面积模型
+            area += (self.onn_area_params['base_area'] +
+                     self.onn_area_params['matrix_size_factor'] * matrix_size * avg_degree +
+                     self.onn_area_params['wavelength_factor'] * 1.55 +  # 1550nm波长
+                     self.onn_area_params['power_factor'] * 0.1)  # 假设100mW功耗
         
         return area
     
+    def _onn_tile_area(self, load: float) -> float:
+        """单个ONN核面积，load为核内节点按权重加权的度数之和"""
+        return (self.onn_area_params['base_area'] +
+                self.onn_area_params['matrix_size_factor'] * load +
+                self.onn_area_params['wavelength_factor'] * 1.55 +
+                self.onn_area_params['power_factor'] * 0.1)
+    
+    def _onn_tile_power(self, load: float) -> float:
+        """单个ONN核功耗 (mW)，load含义同 _onn_tile_area"""
+        return self.onn_power_params['base_power'] + self.onn_power_params['per_connection_power'] * load
+    
+    def _electronic_area_per_weight(self) -> float:
+        """电子部分每单位节点权重的面积（LUT与寄存器按8:2，含布线开销）"""
+        return ((0.8 * self.electronic_area_params['lut6_area'] +
+                 0.2 * self.electronic_area_params['reg_area']) *
+                self.electronic_area_params['routing_factor'])
+    
     def _estimate_electronic_area(self, graph: nx.DiGraph, partition: Dict[str, int]) -> float:
         """估算电子部分面积"""
-        electronic_nodes = [node for node, part in partition.items() if part == 0]
+        electronic_nodes = [node for node, part in partition.items() if self.domains.is_electronic(part)]
         
         if not electronic_nodes:
             return 0.0
         
         # 基于LUT6的面积估算
-        lut_count = len(electronic_nodes) * 0.8  # 假设80%的节点需要LUT
-        reg_count = len(electronic_nodes) * 0.2  # 假设20%的节点是寄存器
+        electronic_size = sum(self._node_weight(graph, node) for node in electronic_nodes)
+        lut_count = electronic_size * 0.8  # 假设80%的节点需要LUT
+        reg_count = electronic_size * 0.2  # 假设20%的节点是寄存器
         
         area = (lut_count * self.electronic_area_params['lut6_area'] +
                 reg_count * self.electronic_area_params['reg_area'])
@@ -181,15 +272,17 @@ class CostFunction:
     
     def _calculate_dependency_error(self, graph: nx.DiGraph, partition: Dict[str, int]) -> float:
         """计算数据依赖误差"""
-        # 计算跨分区边数
-        cross_partition_edges = 0
-        total_edges = len(graph.edges())
+        net_model = self._synced_net_model(graph, partition)
+        if net_model is not None:
+            if net_model.total_multiplicity == 0:
+                return 0.0
+            return net_model.cut_count / net_model.total_multiplicity * 0.1
         
-        for edge in graph.edges():
-            src, dst = edge
-            if src in partition and dst in partition:
-                if partition[src] != partition[dst]:
-                    cross_partition_edges += 1
+        # 计算跨分区边数
+        arrays = self._edge_arrays(graph)
+        cut = self._cut_mask(arrays, partition)
+        cross_partition_edges = float(arrays['multiplicity'][cut].sum())
+        total_edges = float(arrays['multiplicity'].sum())
         
         if total_edges == 0:
             return 0.0
@@ -199,19 +292,35 @@ class CostFunction:
     
     def _calculate_complexity_cost(self, graph: nx.DiGraph, partition: Dict[str, int]) -> float:
         """计算复杂度成本"""
-        # 基于分区平衡性计算复杂度
-        onn_count = sum(1 for part in partition.values() if part == 1)
-        electronic_count = len(partition) - onn_count
-        
         if len(partition) == 0:
             return 0.0
         
+        # 基于各域权重的平衡性计算复杂度
+        domain_weights = self._domain_weights(graph, partition)
+        if domain_weights.max() == 0:
+            return 0.0
+        
         # 分区越不平衡，复杂度越高
-        balance_ratio = min(onn_count, electronic_count) / max(onn_count, electronic_count)
+        balance_ratio = domain_weights.min() / domain_weights.max()
         complexity = 1.0 - balance_ratio
         
+        # 超出ONN核或电子岛容量的部分按总权重比例计入
+        if self.domains.capacities:
+            total_weight = domain_weights.sum()
+            for domain, capacity in enumerate(self.domains.capacities):
+                if capacity is not None and domain < len(domain_weights):
+                    complexity += max(0.0, domain_weights[domain] - capacity) / total_weight
+        
         return complexity
     
+    def _domain_weights(self, graph: nx.DiGraph, partition: Dict[str, int]) -> np.ndarray:
+        """各域的节点权重计数（超出域编号范围的取值不计）"""
+        domain_weights = np.zeros(self.domains.num_domains)
+        for node, part in partition.items():
+            if 0 <= part < len(domain_weights):
+                domain_weights[part] += self._node_weight(graph, node)
+        return domain_weights
+    
     def _calculate_interface_cost(self, graph: nx.DiGraph, partition: Dict[str, int], 
                                 onn_outputs: List[str], electronic_outputs: List[str]) -> float:
         """计算接口成本"""
@@ -219,45 +328,232 @@ class CostFunction:
         interface_signals = len(onn_outputs) + len(electronic_outputs)
         
         # 计算跨分区数据传输
-        cross_partition_data = 0
-        for edge in graph.edges():
-            src, dst = edge
-            if src in partition and dst in partition:
-                if partition[src] != partition[dst]:
-                    # 估算数据位宽
-                    src_node = graph.nodes[src]
-                    dst_node = graph.nodes[dst]
-                    bit_width = getattr(src_node, 'bit_width', 1) or 1
-                    cross_partition_data += bit_width
+        net_model = self._synced_net_model(graph, partition)
+        if net_model is not None:
+            # 每个驱动只转换一次，与扇出数无关
+            cross_partition_data = net_model.cut_width
+        else:
+            # 按驱动位宽汇总跨分区边的数据量
+            arrays = self._edge_arrays(graph)
+            cross_partition_data = float(arrays['edge_widths'][self._cut_mask(arrays, partition)].sum())
         
         # 归一化处理
         total_cost = (interface_signals * 0.1 + cross_partition_data * 0.01) / 100.0
         return min(total_cost, 1.0)
     
-    def optimize_weights(self, sample_partitions: List[Dict[str, int]], 
-                        target_metrics: Dict[str, float]) -> CostWeights:
-        """优化权重参数"""
-        # 使用梯度下降优化权重
-        learning_rate = 0.01
-        iterations = 100
-        
-        weights = CostWeights()
-        
-        for _ in range(iterations):
-            for partition in sample_partitions:
-                # 计算当前成本
-                metrics = self.calculate_total_cost(
-                    graph=nx.DiGraph(),  # 简化处理
-                    partition=partition,
-                    onn_outputs=[],
-                    electronic_outputs=[]
-                )
-                
-                # 计算梯度并更新权重
-                # 这里简化实现，实际可以使用更复杂的优化算法
-                pass
-        
-        return weights
+    def add_term(self, term, weight: float = 1.0, **params) -> CostTerm:
+        """以给定权重启用扩展成本项（已注册的名称或CostTerm实例），同名项会被替换"""
+        if isinstance(term, str):
+            term = create_term(term, **params)
+        if term.name in BUILTIN_TERM_NAMES:
+            raise ValueError(f"{term.name} 为内置成本项，请通过cost_weights设置权重")
+        self.extra_terms = [(t, w) for t, w in self.extra_terms if t.name != term.name]
+        self.extra_terms.append((term, weight))
+        return term
+    
+    def term_context(self, graph: nx.DiGraph) -> TermContext:
+        """返回图的稠密评估上下文（图不变时复用）"""
+        if self._term_context is None or not self._term_context.covers(graph):
+            self._term_context = TermContext.build(graph, self)
+        return self._term_context
+    
+    def term_names(self) -> List[str]:
+        """成本项矩阵的列名：内置成本项在前，扩展成本项在后"""
+        return list(BUILTIN_TERM_NAMES) + [term.name for term, _ in self.extra_terms]
+    
+    def term_weights(self) -> np.ndarray:
+        """与 term_names 对应的权重向量"""
+        builtin = [getattr(self.weights, name.replace('_cost', '_weight')) for name in BUILTIN_TERM_NAMES]
+        return np.array(builtin + [weight for _, weight in self.extra_terms], dtype=float)
+    
+    def term_matrix(self, graph: nx.DiGraph, nodes: List[str], samples: np.ndarray) -> np.ndarray:
+        """批量计算成本项矩阵 (B, T)，samples为按nodes顺序排列的域编号矩阵
+
+        按边计算（不使用线网模型），ONN域中的节点即ONN输出
+        """
+        context = self.term_context(graph)
+        parts = self._dense_batch(context, nodes, samples)
+        terms = self._builtin_terms + [term for term, _ in self.extra_terms]
+        return np.column_stack([term.batch(context, parts) for term in terms])
+    
+    def batch_total_cost(self, graph: nx.DiGraph, nodes: List[str], samples: np.ndarray) -> np.ndarray:
+        """批量计算总成本，可直接作为分布估计的 batch_cost_function"""
+        samples = np.asarray(samples)
+        # 线网模型与成本项日志依赖逐个评估
+        if self.net_model is not None or self.term_log is not None:
+            costs = np.empty(len(samples))
+            for i, row in enumerate(samples):
+                partition = dict(zip(nodes, row.tolist()))
+                onn_outputs = [node for node, part in partition.items() if self.domains.is_onn(part)]
+                electronic_outputs = [node for node, part in partition.items() if self.domains.is_electronic(part)]
+                costs[i] = self.calculate_total_cost(graph, partition, onn_outputs, electronic_outputs).total_cost
+            return costs
+        return self.term_matrix(graph, nodes, samples) @ self.term_weights()
+    
+    def delta_cost(self, graph: nx.DiGraph, partition: Dict[str, int], changes: Dict[str, int]) -> float:
+        """将changes中的节点移到指定域后的加权成本增量（按边计算）"""
+        context = self.term_context(graph)
+        parts = context.dense(partition)
+        moved = [(context.node_index[node], part) for node, part in changes.items() if node in context.node_index]
+        if not moved:
+            return 0.0
+        nodes = np.array([i for i, _ in moved], dtype=np.int64)
+        targets = np.array([part for _, part in moved], dtype=np.int64)
+        terms = self._builtin_terms + [term for term, _ in self.extra_terms]
+        return float(sum(weight * term.delta(context, parts, nodes, targets)
+                         for term, weight in zip(terms, self.term_weights()) if weight != 0))
+    
+    @staticmethod
+    def _dense_batch(context: TermContext, nodes: List[str], samples: np.ndarray) -> np.ndarray:
+        """将按nodes排列的样本矩阵转为上下文节点顺序（缺失节点为-1）"""
+        samples = np.asarray(samples, dtype=np.int64)
+        if list(nodes) == context.nodes:
+            return samples
+        parts = np.full((len(samples), len(context.nodes)), -1, dtype=np.int64)
+        columns = [i for i, node in enumerate(nodes) if node in context.node_index]
+        parts[:, [context.node_index[nodes[i]] for i in columns]] = samples[:, columns]
+        return parts
+    
+    def set_term_log(self, term_log):
+        """设置成本项日志，传入None时停止记录"""
+        self.term_log = term_log
+    
+    def set_net_model(self, net_model):
+        """设置线网模型，传入None时恢复按边计算"""
+        self.net_model = net_model
+    
+    def _synced_net_model(self, graph: nx.DiGraph, partition: Dict[str, int]):
+        """返回与当前分区同步的线网模型；不适用时返回None"""
+        if self.net_model is None or not self.net_model.covers(graph, partition):
+            return None
+        self.net_model.sync(partition)
+        return self.net_model
+    
+    def _node_weight(self, graph: nx.DiGraph, node: str) -> float:
+        """节点权重（图化简后的超节点为其成员数）"""
+        if node in graph:
+            return graph.nodes[node].get('weight', 1)
+        return 1
+    
+    def _edge_bit_width(self, graph: nx.DiGraph, src: str, dst: str) -> int:
+        """估算跨分区边的数据位宽（取驱动节点位宽）"""
+        return graph.nodes[src].get('bit_width') or 1
+    
+    def _edge_arrays(self, graph: nx.DiGraph) -> Dict[str, Any]:
+        """边端点编号、重数与位宽的稠密数组，首次计算后缓存在图属性中（图版本号变化时重建）"""
+        num_nodes, num_edges = graph.number_of_nodes(), graph.number_of_edges()
+        version = graph_version(graph)
+        arrays = graph.graph.get('edge_arrays')
+        if (arrays is not None and arrays['version'] == version and
+                arrays['num_nodes'] == num_nodes and arrays['num_edges'] == num_edges):
+            return arrays
+        
+        # 优先使用解析器生成的节点编号与位宽数组
+        node_ids = graph.graph.get('node_ids')
+        bit_widths = graph.graph.get('bit_widths')
+        if node_ids is None or bit_widths is None or len(node_ids) != num_nodes:
+            node_ids = {node: i for i, node in enumerate(graph.nodes())}
+            bit_widths = np.array([graph.nodes[node].get('bit_width') or 1 for node in graph.nodes()], dtype=float)
+        
+        edges = list(graph.edges(data='multiplicity', default=1))
+        src = np.array([node_ids[u] for u, _, _ in edges], dtype=np.int64)
+        dst = np.array([node_ids[v] for _, v, _ in edges], dtype=np.int64)
+        multiplicity = np.array([m for _, _, m in edges], dtype=float)
+        
+        arrays = {
+            'version': version,
+            'num_nodes': num_nodes,
+            'num_edges': num_edges,
+            'nodes': list(node_ids),
+            'src': src,
+            'dst': dst,
+            'multiplicity': multiplicity,
+            'edge_widths': bit_widths[src] * multiplicity
+        }
+        graph.graph['edge_arrays'] = arrays
+        return arrays
+    
+    @staticmethod
+    def _cut_mask(arrays: Dict[str, Any], partition: Dict[str, int]) -> np.ndarray:
+        """跨分区边的布尔掩码（端点不在分区中的边不计）"""
+        parts = np.fromiter((partition.get(node, -1) for node in arrays['nodes']),
+                            dtype=np.int64, count=len(arrays['nodes']))
+        src_parts, dst_parts = parts[arrays['src']], parts[arrays['dst']]
+        return (src_parts >= 0) & (dst_parts >= 0) & (src_parts != dst_parts)
+    
+    def optimize_weights(self, graph: nx.DiGraph, sample_partitions: List[Dict[str, int]],
+                        measured_costs: List[float], method: str = 'least_squares') -> CostWeights:
+        """以带实测值的参考分区标定权重（详见 weight_calibration 模块）"""
+        from weight_calibration import WeightCalibrator, CalibrationConfig
+        
+        calibrator = WeightCalibrator(CalibrationConfig(method=method), self)
+        return calibrator.fit(graph, sample_partitions, measured_costs).weights
+
+
+class PartitionCost:
+    """按分区计算总成本的可调用对象
+
+    与闭包不同，可以序列化传给种群退火的工作进程；工作进程中的评估记录在
+    成本函数的副本上，不会写入主进程的成本项日志。
+    给出化简结果时，化简图上的分区先展开到原图再计算，超节点的度数、输出数和
+    被剪除的节点都按原图计入，成本与展开后的分区在原图上的成本一致
+    """
+    
+    def __init__(self, cost_function: CostFunction, reduction=None):
+        self.cost_function = cost_function
+        self.reduction = reduction  # graph_reduction.ReducedGraph，None表示不化简
+    
+    def __call__(self, graph: nx.DiGraph, partition: Dict[str, int]) -> float:
+        return self.metrics(graph, partition).total_cost
+    
+    def metrics(self, graph: nx.DiGraph, partition: Dict[str, int]) -> CostMetrics:
+        """分区的全部成本指标"""
+        if self._is_reduced(graph):
+            graph, partition = self.reduction.original, self.reduction.expand_partition(partition)
+        domains = self.cost_function.domains
+        onn_outputs = [node for node, part in partition.items() if domains.is_onn(part)]
+        electronic_outputs = [node for node, part in partition.items() if domains.is_electronic(part)]
+        return self.cost_function.calculate_total_cost(
+            graph=graph,
+            partition=partition,
+            onn_outputs=onn_outputs,
+            electronic_outputs=electronic_outputs
+        )
+    
+    def batch(self, graph: nx.DiGraph, nodes: List[str], samples: np.ndarray) -> np.ndarray:
+        """批量计算总成本，可直接作为分布估计的 batch_cost_function"""
+        if not self._is_reduced(graph):
+            return self.cost_function.batch_total_cost(graph, nodes, samples)
+        
+        # 样本矩阵的列从超节点展开到原图节点，被剪除的节点取固定分区
+        samples = np.asarray(samples)
+        column = {node: i for i, node in enumerate(nodes)}
+        original_nodes = list(self.reduction.original.nodes())
+        sources = np.array([column.get(self.reduction.representative.get(node), -1) for node in original_nodes],
+                           dtype=np.int64)
+        expanded = np.full((len(samples), len(original_nodes)), self.reduction.pruned_partition, dtype=samples.dtype)
+        mapped = sources >= 0
+        expanded[:, mapped] = samples[:, sources[mapped]]
+        return self.cost_function.batch_total_cost(self.reduction.original, original_nodes, expanded)
+    
+    def delta(self, graph: nx.DiGraph, partition: Dict[str, int], changes: Dict[str, int]) -> Optional[float]:
+        """将changes中的节点移到指定域后的总成本增量，供模拟退火逐步评估
+
+        增量按成本项的稠密数组计算，与完整评估一致；线网模型（按线网计算割）或
+        成本项日志（需记录每次评估）启用时返回None，由调用方改为完整评估
+        """
+        cost_function = self.cost_function
+        if cost_function.net_model is not None or cost_function.term_log is not None:
+            return None
+        if self._is_reduced(graph):
+            changes = {member: part for node, part in changes.items()
+                       for member in self.reduction.members.get(node, [node])}
+            graph, partition = self.reduction.original, self.reduction.expand_partition(partition)
+        return cost_function.delta_cost(graph, partition, changes)
+    
+    def _is_reduced(self, graph: nx.DiGraph) -> bool:
+        return (self.reduction is not None and self.reduction.original is not None and
+                graph is self.reduction.graph)
 
 
 def main():
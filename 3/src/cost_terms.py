@@ -0,0 +1,489 @@
+"""
+成本项注册模块
+每个成本项在稠密分区向量上实现完整评估、增量更新和批量（NumPy）评估，
+按名称注册后即可在配置中以权重启用；按边或按节点线性的成本项只需给出
+系数数组，三种评估方式均自动向量化，无需再逐边扫描图；
+内置成本项由各域的权重/负载/节点数与割的累加量算出，增量评估只更新移动节点及其关联边
+"""
+
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Optional, Tuple, Type, Any
+from dataclasses import dataclass, field
+
+from dfg_parser import graph_version
+
+
+# 成本项注册表：名称 -> 成本项类
+TERM_REGISTRY: Dict[str, Type['CostTerm']] = {}
+
+# CostFunction内置的成本项（与CostMetrics字段同名）
+BUILTIN_TERM_NAMES = ('area_cost', 'delay_cost', 'error_cost', 'complexity_cost', 'interface_cost')
+
+
+def register_term(cls: Type['CostTerm']) -> Type['CostTerm']:
+    """注册成本项类（以类属性name为键），可作为类装饰器使用"""
+    if not cls.name:
+        raise ValueError(f"成本项 {cls.__name__} 未定义name")
+    TERM_REGISTRY[cls.name] = cls
+    return cls
+
+
+def create_term(name: str, **params) -> 'CostTerm':
+    """按名称创建已注册的成本项"""
+    if name not in TERM_REGISTRY:
+        raise KeyError(f"未注册的成本项: {name}（可用: {sorted(TERM_REGISTRY)}）")
+    return TERM_REGISTRY[name](**params)
+
+
+@dataclass
+class TermContext:
+    """成本项评估上下文：图的稠密数组表示，对同一张图只构建一次"""
+    graph: nx.DiGraph
+    cost_function: Any
+    nodes: List[str]
+    node_index: Dict[str, int]
+    src: np.ndarray
+    dst: np.ndarray
+    multiplicity: np.ndarray
+    edge_widths: np.ndarray
+    weights: np.ndarray
+    loads: np.ndarray  # 节点权重 × 度数
+    incident_ptr: np.ndarray  # 节点关联边的CSR索引
+    incident_edges: np.ndarray
+    cache: Dict[Any, Any] = field(default_factory=dict)
+    version: int = 0  # 构建时的图版本号
+
+    @classmethod
+    def build(cls, graph: nx.DiGraph, cost_function) -> 'TermContext':
+        arrays = cost_function._edge_arrays(graph)
+        nodes = arrays['nodes']
+        node_index = {node: i for i, node in enumerate(nodes)}
+        weights = np.array([cost_function._node_weight(graph, node) for node in nodes], dtype=float)
+        degrees = np.array([graph.degree(node) for node in nodes], dtype=float)
+
+        # 每个节点关联的边（出边与入边）按节点编号排序为CSR
+        endpoints = np.concatenate([arrays['src'], arrays['dst']])
+        edge_ids = np.tile(np.arange(arrays['num_edges']), 2)
+        order = np.argsort(endpoints, kind='stable')
+        incident_ptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(np.bincount(endpoints, minlength=len(nodes)), out=incident_ptr[1:])
+
+        return cls(
+            graph=graph,
+            cost_function=cost_function,
+            nodes=nodes,
+            node_index=node_index,
+            src=arrays['src'],
+            dst=arrays['dst'],
+            multiplicity=arrays['multiplicity'],
+            edge_widths=arrays['edge_widths'],
+            weights=weights,
+            loads=weights * degrees,
+            incident_ptr=incident_ptr,
+            incident_edges=edge_ids[order],
+            version=arrays['version']
+        )
+
+    @property
+    def domains(self):
+        return self.cost_function.domains
+
+    def covers(self, graph: nx.DiGraph) -> bool:
+        """判断上下文是否仍与图一致（同一张图且版本号未变）"""
+        return (graph is self.graph and graph_version(graph) == self.version and
+                graph.number_of_nodes() == len(self.nodes) and graph.number_of_edges() == len(self.src))
+
+    def dense(self, partition: Dict[str, int]) -> np.ndarray:
+        """字典分区转为稠密域编号向量（缺失节点为-1，不计入任何域）"""
+        return np.fromiter((partition.get(node, -1) for node in self.nodes), dtype=np.int64,
+                           count=len(self.nodes))
+
+    def incident(self, nodes: np.ndarray) -> np.ndarray:
+        """给定节点编号关联的边编号（去重）"""
+        pieces = [self.incident_edges[self.incident_ptr[i]:self.incident_ptr[i + 1]] for i in nodes]
+        if not pieces:
+            return np.zeros(0, dtype=np.int64)
+        return np.unique(np.concatenate(pieces))
+
+    def cut_matrix(self, parts: np.ndarray) -> np.ndarray:
+        """批量分区 (B, N) 的跨分区边掩码 (B, E)"""
+        src_parts, dst_parts = parts[:, self.src], parts[:, self.dst]
+        return (src_parts >= 0) & (dst_parts >= 0) & (src_parts != dst_parts)
+
+    def domain_totals(self, parts: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """批量分区中各域的节点值之和 (B, k)"""
+        return np.stack([(parts == domain) @ values for domain in range(self.domains.num_domains)], axis=1)
+
+    def kind_mask(self, parts: np.ndarray, kind: str) -> np.ndarray:
+        """批量分区中属于某类域（'onn'/'electronic'）的节点掩码"""
+        domains = [d for d, k in enumerate(self.domains.kinds) if k == kind]
+        return np.isin(parts, domains)
+
+    def totals(self, parts: np.ndarray, with_cut: bool = True) -> 'DomainTotals':
+        """批量分区 (B, N) 的各域累加量与割的总量（with_cut为False时不计算割）"""
+        cut = self.cut_matrix(parts) if with_cut else None
+        return DomainTotals(
+            weight=self.domain_totals(parts, self.weights),
+            load=self.domain_totals(parts, self.loads),
+            count=self.domain_totals(parts, np.ones(len(self.nodes))),
+            cut_multiplicity=cut @ self.multiplicity if with_cut else None,
+            cut_width=cut @ self.edge_widths if with_cut else None
+        )
+
+    def domain_state(self, parts: np.ndarray) -> 'DomainState':
+        """与parts同步的增量累加量（在上下文中只保留一份，各成本项共用）"""
+        state = self.cache.get('domain_state')
+        if state is None:
+            state = DomainState(self, parts)
+            self.cache['domain_state'] = state
+        else:
+            state.sync(parts)
+        return state
+
+
+@dataclass
+class DomainTotals:
+    """一批分区的各域累加量 (B, k) 与割的总量 (B,)"""
+    weight: np.ndarray
+    load: np.ndarray
+    count: np.ndarray
+    cut_multiplicity: Optional[np.ndarray]
+    cut_width: Optional[np.ndarray]
+
+
+class DomainState:
+    """单个分区的各域累加量与割状态
+
+    数组多留一列，缺失节点（域-1）的累加量落在末列而不计入任何域；
+    分区变化时只按变化节点及其关联边更新，变化节点过多时整体重算
+    """
+
+    def __init__(self, context: TermContext, parts: np.ndarray):
+        self.context = context
+        self._rebuild(parts)
+
+    def _rebuild(self, parts: np.ndarray):
+        context = self.context
+        num_slots = context.domains.num_domains + 1
+        self.parts = parts.copy()
+        self.weight = self._sums(parts, context.weights, num_slots)
+        self.load = self._sums(parts, context.loads, num_slots)
+        self.count = self._sums(parts, np.ones(len(parts)), num_slots)
+        self.cut = self._cut(np.arange(len(context.src)))
+        self.cut_multiplicity = float(context.multiplicity @ self.cut)
+        self.cut_width = float(context.edge_widths @ self.cut)
+
+    @staticmethod
+    def _sums(parts: np.ndarray, values: np.ndarray, num_slots: int) -> np.ndarray:
+        sums = np.zeros(num_slots)
+        np.add.at(sums, parts, values)
+        return sums
+
+    def _cut(self, edges: np.ndarray) -> np.ndarray:
+        src, dst = self.parts[self.context.src[edges]], self.parts[self.context.dst[edges]]
+        return (src >= 0) & (dst >= 0) & (src != dst)
+
+    def sync(self, parts: np.ndarray):
+        """同步到parts：比较稠密向量找出变化节点（向量化），再按变化节点增量更新"""
+        changed = np.flatnonzero(self.parts != parts)
+        if len(changed) == 0:
+            return
+        if len(changed) * 4 > len(parts):
+            self._rebuild(parts)
+            return
+        self.weight, self.load, self.count = self._moved_sums(changed, parts[changed])
+        self.parts[changed] = parts[changed]
+        edges = self.context.incident(changed)
+        cut = self._cut(edges)
+        change = cut.astype(float) - self.cut[edges]
+        self.cut_multiplicity += float(self.context.multiplicity[edges] @ change)
+        self.cut_width += float(self.context.edge_widths[edges] @ change)
+        self.cut[edges] = cut
+
+    def _moved_sums(self, nodes: np.ndarray, targets: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        context = self.context
+        sources = self.parts[nodes]
+        sums = []
+        for current, values in ((self.weight, context.weights), (self.load, context.loads),
+                                (self.count, None)):
+            moved = current.copy()
+            node_values = np.ones(len(nodes)) if values is None else values[nodes]
+            np.subtract.at(moved, sources, node_values)
+            np.add.at(moved, targets, node_values)
+            sums.append(moved)
+        return tuple(sums)
+
+    def totals(self) -> DomainTotals:
+        """当前分区的累加量（形状为单行批量）"""
+        return self._totals(self.weight, self.load, self.count, self.cut_multiplicity, self.cut_width)
+
+    def moved(self, nodes: np.ndarray, targets: np.ndarray) -> DomainTotals:
+        """将nodes移动到targets后的累加量（不修改当前状态），只访问移动节点的关联边"""
+        # 重复的节点以最后一次为准，与 parts[nodes] = targets 一致
+        reverse_unique, index = np.unique(nodes[::-1], return_index=True)
+        nodes, targets = reverse_unique, np.asarray(targets)[::-1][index]
+        weight, load, count = self._moved_sums(nodes, targets)
+
+        edges = self.context.incident(nodes)
+        sources = self.parts[nodes]
+        self.parts[nodes] = targets
+        cut = self._cut(edges)
+        self.parts[nodes] = sources
+        change = cut.astype(float) - self.cut[edges]
+        return self._totals(weight, load, count,
+                            self.cut_multiplicity + float(self.context.multiplicity[edges] @ change),
+                            self.cut_width + float(self.context.edge_widths[edges] @ change))
+
+    @staticmethod
+    def _totals(weight, load, count, cut_multiplicity, cut_width) -> DomainTotals:
+        # 去掉缺失节点所在的末列
+        return DomainTotals(weight=weight[None, :-1], load=load[None, :-1], count=count[None, :-1],
+                            cut_multiplicity=np.array([cut_multiplicity]), cut_width=np.array([cut_width]))
+
+
+class CostTerm:
+    """成本项基类
+
+    子类至少实现 evaluate 或 batch 之一：默认的 evaluate 取单行批量结果，
+    默认的 batch 逐行调用 evaluate，默认的 delta 为移动前后两次完整评估之差
+    """
+    name: str = ''
+
+    def __init__(self, **params):
+        self.params = params
+
+    def evaluate(self, context: TermContext, parts: np.ndarray) -> float:
+        """完整评估单个稠密分区"""
+        return float(self.batch(context, parts[None, :])[0])
+
+    def batch(self, context: TermContext, parts: np.ndarray) -> np.ndarray:
+        """批量评估 (B, N) 分区矩阵，返回长度为B的成本数组"""
+        return np.array([self.evaluate(context, row) for row in parts], dtype=float)
+
+    def delta(self, context: TermContext, parts: np.ndarray, nodes: np.ndarray, targets: np.ndarray) -> float:
+        """将nodes移动到targets后的成本增量"""
+        moved = parts.copy()
+        moved[nodes] = targets
+        return self.evaluate(context, moved) - self.evaluate(context, parts)
+
+    def _cached(self, context: TermContext, key: str, compute):
+        """按上下文缓存成本项的系数数组"""
+        cache_key = (id(self), key)
+        if cache_key not in context.cache:
+            context.cache[cache_key] = compute()
+        return context.cache[cache_key]
+
+
+class EdgeTerm(CostTerm):
+    """按跨分区边线性累加的成本项：cost = Σ c_e · [边e跨分区]"""
+
+    def edge_costs(self, context: TermContext) -> np.ndarray:
+        raise NotImplementedError
+
+    def _coefficients(self, context: TermContext) -> np.ndarray:
+        return self._cached(context, 'edge_costs', lambda: np.asarray(self.edge_costs(context), dtype=float))
+
+    def evaluate(self, context: TermContext, parts: np.ndarray) -> float:
+        return float(self._coefficients(context) @ context.cut_matrix(parts[None, :])[0])
+
+    def batch(self, context: TermContext, parts: np.ndarray) -> np.ndarray:
+        return context.cut_matrix(parts) @ self._coefficients(context)
+
+    def delta(self, context: TermContext, parts: np.ndarray, nodes: np.ndarray, targets: np.ndarray) -> float:
+        # 只有移动节点的关联边会改变割状态
+        edges = context.incident(nodes)
+        if len(edges) == 0:
+            return 0.0
+        moved = parts.copy()
+        moved[nodes] = targets
+        src, dst = context.src[edges], context.dst[edges]
+        before = (parts[src] >= 0) & (parts[dst] >= 0) & (parts[src] != parts[dst])
+        after = (moved[src] >= 0) & (moved[dst] >= 0) & (moved[src] != moved[dst])
+        coefficients = self._coefficients(context)[edges]
+        return float(coefficients @ (after.astype(float) - before))
+
+
+class NodeTerm(CostTerm):
+    """按节点所在域线性累加的成本项：cost = Σ c[v, 域(v)]"""
+
+    def node_costs(self, context: TermContext) -> np.ndarray:
+        """形状为 (N, k) 的节点-域成本表"""
+        raise NotImplementedError
+
+    def _table(self, context: TermContext) -> np.ndarray:
+        # 末列补零，使缺失节点（域-1）不计成本
+        return self._cached(context, 'node_costs', lambda: np.hstack([
+            np.asarray(self.node_costs(context), dtype=float), np.zeros((len(context.nodes), 1))]))
+
+    def evaluate(self, context: TermContext, parts: np.ndarray) -> float:
+        return float(self._table(context)[np.arange(len(parts)), parts].sum())
+
+    def batch(self, context: TermContext, parts: np.ndarray) -> np.ndarray:
+        return self._table(context)[np.arange(parts.shape[1]), parts].sum(axis=1)
+
+    def delta(self, context: TermContext, parts: np.ndarray, nodes: np.ndarray, targets: np.ndarray) -> float:
+        nodes, index = np.unique(nodes, return_index=True)
+        table = self._table(context)
+        return float(table[nodes, np.asarray(targets)[index]].sum() - table[nodes, parts[nodes]].sum())
+
+
+class DomainTerm(CostTerm):
+    """由各域累加量与割的总量计算的成本项：批量评估与增量评估共用 cost()
+
+    增量评估只更新移动节点的域累加量与其关联边的割状态，不调用完整评估
+    """
+    uses_cut = False
+
+    def cost(self, context: TermContext, totals: DomainTotals) -> np.ndarray:
+        raise NotImplementedError
+
+    def batch(self, context: TermContext, parts: np.ndarray) -> np.ndarray:
+        return self.cost(context, context.totals(parts, self.uses_cut))
+
+    def delta(self, context: TermContext, parts: np.ndarray, nodes: np.ndarray, targets: np.ndarray) -> float:
+        state = context.domain_state(parts)
+        return float(self.cost(context, state.moved(nodes, targets))[0] - self.cost(context, state.totals())[0])
+
+
+def _kind_domains(context: TermContext, kind: str) -> List[int]:
+    return [d for d, k in enumerate(context.domains.kinds) if k == kind]
+
+
+# ---------------- 内置成本项（与CostFunction中的按边计算一致，不含线网模型） ----------------
+
+@register_term
+class AreaTerm(DomainTerm):
+    """面积成本：各ONN核面积与电子面积之和，以100mm²归一化"""
+    name = 'area_cost'
+
+    def cost(self, context: TermContext, totals: DomainTotals) -> np.ndarray:
+        cost_function = context.cost_function
+        area = np.zeros(len(totals.weight))
+        for domain in _kind_domains(context, 'onn'):
+            tile_area = cost_function._onn_tile_area(totals.load[:, domain])
+            area += np.where(totals.count[:, domain] > 0, tile_area, 0.0)
+
+        electronic_size = totals.weight[:, _kind_domains(context, 'electronic')].sum(axis=1)
+        params = cost_function.electronic_area_params
+        area += (electronic_size * 0.8 * params['lut6_area'] +
+                 electronic_size * 0.2 * params['reg_area']) * params['routing_factor']
+        return area / 100.0
+
+
+@register_term
+class DelayTerm(CostTerm):
+    """延迟成本：与分区无关，每张图只计算一次"""
+    name = 'delay_cost'
+
+    def _delay(self, context: TermContext) -> float:
+        return self._cached(context, 'delay',
+                            lambda: context.cost_function._calculate_delay_cost(context.graph, {}))
+
+    def batch(self, context: TermContext, parts: np.ndarray) -> np.ndarray:
+        return np.full(len(parts), self._delay(context))
+
+    def delta(self, context: TermContext, parts: np.ndarray, nodes: np.ndarray, targets: np.ndarray) -> float:
+        return 0.0
+
+
+@register_term
+class ErrorTerm(DomainTerm):
+    """误差成本：ONN输出误差与跨分区依赖误差，上限为1（ONN节点即ONN输出）"""
+    name = 'error_cost'
+    uses_cut = True
+
+    def cost(self, context: TermContext, totals: DomainTotals) -> np.ndarray:
+        onn_outputs = totals.count[:, _kind_domains(context, 'onn')].sum(axis=1)
+        total_edges = context.multiplicity.sum()
+        dependency = (totals.cut_multiplicity / total_edges * 0.1
+                      if total_edges > 0 else np.zeros(len(onn_outputs)))
+        error = np.minimum(onn_outputs * 0.01 + dependency, 1.0)
+        return np.where(onn_outputs > 0, error, 0.0)
+
+
+@register_term
+class ComplexityTerm(DomainTerm):
+    """复杂度成本：各域权重的不平衡度，加上超出域容量的部分"""
+    name = 'complexity_cost'
+
+    def cost(self, context: TermContext, totals: DomainTotals) -> np.ndarray:
+        domain_weights = totals.weight
+        largest = domain_weights.max(axis=1)
+        safe = np.where(largest > 0, largest, 1.0)
+        complexity = np.where(largest > 0, 1.0 - domain_weights.min(axis=1) / safe, 0.0)
+
+        capacities = context.domains.capacities
+        if capacities:
+            total_weight = np.where(largest > 0, domain_weights.sum(axis=1), 1.0)
+            for domain, capacity in enumerate(capacities):
+                if capacity is not None and domain < domain_weights.shape[1]:
+                    complexity += np.maximum(0.0, domain_weights[:, domain] - capacity) / total_weight
+        return complexity
+
+
+@register_term
+class InterfaceTerm(DomainTerm):
+    """接口成本：接口信号数与跨分区位宽，上限为1"""
+    name = 'interface_cost'
+    uses_cut = True
+
+    def cost(self, context: TermContext, totals: DomainTotals) -> np.ndarray:
+        signals = totals.count[:, _kind_domains(context, 'onn') + _kind_domains(context, 'electronic')].sum(axis=1)
+        cross_partition_data = totals.cut_width
+        return np.minimum((signals * 0.1 + cross_partition_data * 0.01) / 100.0, 1.0)
+
+
+# ---------------- 可选扩展成本项 ----------------
+
+@register_term
+class CutEdgesTerm(EdgeTerm):
+    """跨分区边比例（按重数）"""
+    name = 'cut_edges'
+
+    def edge_costs(self, context: TermContext) -> np.ndarray:
+        total = context.multiplicity.sum()
+        return context.multiplicity / total if total > 0 else context.multiplicity
+
+
+@register_term
+class OnnPowerTerm(NodeTerm):
+    """ONN连接功耗：ONN域中节点按加权度数计的调制/探测功耗，以reference_power归一化"""
+    name = 'onn_power'
+
+    def node_costs(self, context: TermContext) -> np.ndarray:
+        reference_power = self.params.get('reference_power', 100.0)
+        per_connection = context.cost_function.onn_power_params['per_connection_power']
+        onn = np.array([context.domains.is_onn(d) for d in range(context.domains.num_domains)], dtype=float)
+        return np.outer(context.loads * per_connection / reference_power, onn)
+
+
+def main():
+    """测试函数"""
+    from cost_function import CostFunction
+
+    graph = nx.DiGraph()
+    graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('A', 'D')])
+
+    cost_func = CostFunction()
+    cost_func.add_term('cut_edges', 0.5)
+    context = cost_func.term_context(graph)
+
+    rng = np.random.default_rng(0)
+    samples = rng.integers(0, 2, size=(4, len(context.nodes)))
+    matrix = cost_func.term_matrix(graph, context.nodes, samples)
+
+    print("成本项注册结果:")
+    print(f"  已注册: {sorted(TERM_REGISTRY)}")
+    print(f"  成本项矩阵列: {cost_func.term_names()}")
+    print(f"  成本项矩阵:\n{np.round(matrix, 4)}")
+    print(f"  批量总成本: {np.round(cost_func.batch_total_cost(graph, context.nodes, samples), 4)}")
+
+    partition = dict(zip(context.nodes, samples[0].tolist()))
+    term = create_term('cut_edges')
+    parts = context.dense(partition)
+    print(f"  翻转A的增量: {term.delta(context, parts, np.array([0]), np.array([1 - parts[0]])):.4f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,12 +3,20 @@ DFG解析器模块
 用于解析DFG文件并构建有向图结构
 """
 
+import os
 import re
+import gzip
+import lzma
+import time
+import itertools
+import numpy as np
 import networkx as nx
 from typing import Dict, List, Tuple, Optional
 from dataclasses import dataclass
 from enum import Enum
 
+from bind_tree import TreeNode, TreeSyntaxError, parse_bind_tree
+
 
 class OperatorType(Enum):
     """操作符类型枚举"""
@@ -39,6 +47,7 @@ class OperatorType(Enum):
     TERMINAL = "Terminal"   # 终端节点
     INT_CONST = "IntConst"  # 整数常量
     RENAME = "Rename"       # 重命名
+    INSTANCE = "Instance"   # 子模块实例（层次化DFG中的黑盒超节点）
 
 
 @dataclass
@@ -53,12 +62,103 @@ class DFGNode:
     value: Optional[str] = None
 
 
+# 解析结果（节点、属性或边）发生变化时递增，使旧的图缓存失效
+PARSER_VERSION = 2
+
+# DFG文本中的段标记（generate_dfg.py 按此顺序输出）
+SECTION_MARKERS = {'Directive:': 'directive', 'Instance:': 'instance', 'Term:': 'term', 'Bind:': 'bind'}
+
+# 预编译的行模式
+INSTANCE_PATTERN = re.compile(r"\(([^,\s]+), '([^']+)'\)$")
+TERM_PATTERN = re.compile(r'\(Term name:([^ ]+) type:\[([^\]]+)\] msb:\(([^)]+)\) lsb:\(([^)]+)\)\)')
+BIND_PATTERN = re.compile(r'\(Bind dest:([^ ]+) tree:(.*)\)$')
+OPERAND_PATTERN = re.compile(r'(Terminal|IntConst) ([^ )]+)')
+TREE_HEAD_PATTERN = re.compile(r'\((Operator (\w+)|\w+)')
+
+# pyverilog运算符/节点标签到操作符类型的映射，未列出的按Terminal处理
+OPERATOR_LABELS = {
+    'Plus': OperatorType.PLUS, 'Uplus': OperatorType.PLUS,
+    'Minus': OperatorType.MINUS, 'Uminus': OperatorType.MINUS,
+    'Times': OperatorType.MUL, 'Divide': OperatorType.DIV, 'Mod': OperatorType.DIV,
+    'Sll': OperatorType.SHIFT_LEFT, 'Sla': OperatorType.SHIFT_LEFT,
+    'Srl': OperatorType.SHIFT_RIGHT, 'Sra': OperatorType.SHIFT_RIGHT,
+    'And': OperatorType.AND, 'Land': OperatorType.AND, 'Uand': OperatorType.AND, 'Unand': OperatorType.AND,
+    'Or': OperatorType.OR, 'Lor': OperatorType.OR, 'Uor': OperatorType.OR, 'Unor': OperatorType.OR,
+    'Unot': OperatorType.NOT, 'Ulnot': OperatorType.NOT,
+    'Xor': OperatorType.XOR, 'Xnor': OperatorType.XOR, 'Uxor': OperatorType.XOR, 'Uxnor': OperatorType.XOR,
+    'Eq': OperatorType.EQ, 'NotEq': OperatorType.EQ, 'Eql': OperatorType.EQ, 'NotEql': OperatorType.EQ,
+    'LessThan': OperatorType.LT, 'GreaterThan': OperatorType.GT,
+    'LessEq': OperatorType.LE, 'GreaterEq': OperatorType.GE,
+    'Partselect': OperatorType.BIT_SELECT, 'Pointer': OperatorType.BIT_SELECT,
+    'Concat': OperatorType.CONCAT, 'Repeat': OperatorType.CONCAT,
+    'Branch': OperatorType.BRANCH,
+    'IntConst': OperatorType.INT_CONST, 'Terminal': OperatorType.TERMINAL,
+}
+
+# 压缩格式的文件头
+GZIP_MAGIC = b'\x1f\x8b'
+XZ_MAGIC = b'\xfd7zXZ\x00'
+
+
+def open_dfg_text(file_path: str):
+    """以文本方式打开DFG文件，按文件头透明解压 .gz / .xz"""
+    with open(file_path, 'rb') as f:
+        magic = f.read(len(XZ_MAGIC))
+    if magic.startswith(GZIP_MAGIC):
+        return gzip.open(file_path, 'rt', encoding='utf-8')
+    if magic.startswith(XZ_MAGIC):
+        return lzma.open(file_path, 'rt', encoding='utf-8')
+    return open(file_path, 'r', encoding='utf-8')
+
+
+# 图版本号：全局递增，图被清空重建后也不会与旧版本相同
+_graph_versions = itertools.count(1)
+
+
+def graph_version(graph: nx.DiGraph) -> int:
+    """图的版本号；边数组、成本项上下文等缓存只在版本号未变时复用"""
+    return graph.graph.get('version', 0)
+
+
+def bump_graph_version(graph: nx.DiGraph) -> int:
+    """标记图已修改，使按版本号缓存的数据失效"""
+    graph.graph['version'] = next(_graph_versions)
+    return graph.graph['version']
+
+
+def index_graph(graph: nx.DiGraph):
+    """重建稠密节点编号与位宽数组并更新版本号
+
+    原地修改图（增删节点或边、改变位宽）后必须调用，否则按版本号缓存的数据会被沿用
+    """
+    graph.graph.pop('edge_arrays', None)
+    graph.graph['node_ids'] = {name: i for i, name in enumerate(graph.nodes())}
+    graph.graph['bit_widths'] = np.array(
+        [graph.nodes[name].get('bit_width') or 1 for name in graph.nodes()], dtype=float
+    )
+    bump_graph_version(graph)
+
+
 class DFGParser:
     """DFG文件解析器"""
     
-    def __init__(self):
+    # 结果为1位的运算符（比较、逻辑与归约）
+    ONE_BIT_OPERATORS = {
+        'Eq', 'NotEq', 'Eql', 'NotEql', 'LessThan', 'GreaterThan', 'LessEq', 'GreaterEq',
+        'Lt', 'Gt', 'Le', 'Ge', 'Land', 'Lor', 'Ulnot',
+        'Uand', 'Unand', 'Uor', 'Unor', 'Uxor', 'Uxnor'
+    }
+    
+    def __init__(self, expand_operators: bool = False):
+        # expand_operators为True时，赋值树中每个嵌套运算符成为独立子节点
+        self.expand_operators = expand_operators
         self.nodes: Dict[str, DFGNode] = {}
         self.graph: nx.DiGraph = nx.DiGraph()
+        self.term_widths: Dict[str, int] = {}
+        self.bind_trees: Dict[str, str] = {}
+        self.operator_trees: Dict[str, TreeNode] = {}  # 节点 -> 其结果对应的语法树
+        self.instances: Dict[str, str] = {}  # 实例路径 -> 模块名（Instance段）
+        self.parse_stats: Dict[str, float] = {}
         self.linear_operators = {
             OperatorType.PLUS, OperatorType.MINUS, OperatorType.CONST_MUL,
             OperatorType.SHIFT_LEFT, OperatorType.SHIFT_RIGHT, 
@@ -66,114 +166,271 @@ class DFGParser:
         }
         
     def parse_dfg_file(self, file_path: str) -> nx.DiGraph:
-        """解析DFG文件"""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        """解析DFG文件（逐行流式读取，内存只随图规模增长）"""
+        start_time = time.time()
+        text_bytes = 0
+        line_count = 0
         
-        # 解析Term部分
-        self._parse_terms(content)
+        with open_dfg_text(file_path) as f:
+            section = None
+            for line in f:
+                text_bytes += len(line)
+                line_count += 1
+                line = line.rstrip('\n')
+                
+                # 按段标记切换解析器；没有段标记的文件按行首判断
+                marker = SECTION_MARKERS.get(line.strip())
+                if marker is not None:
+                    section = marker
+                elif section == 'instance':
+                    self._parse_instance_line(line)
+                elif section == 'term' or (section is None and line.startswith('(Term ')):
+                    self._parse_term_line(line)
+                elif section == 'bind' or (section is None and line.startswith('(Bind ')):
+                    self._parse_bind_line(line)
         
-        # 解析Bind部分
-        self._parse_binds(content)
-        
-        # 构建图结构
-        self._build_graph()
+        self.build()
         
+        elapsed = time.time() - start_time
+        self.parse_stats = {
+            'lines': line_count,
+            'text_bytes': text_bytes,
+            'file_bytes': os.path.getsize(file_path),
+            'seconds': elapsed,
+            'mb_per_s': text_bytes / 1e6 / elapsed if elapsed > 0 else float('inf')
+        }
         return self.graph
     
-    def _parse_terms(self, content: str):
-        """解析Term部分，提取节点信息"""
-        term_pattern = r'\(Term name:([^ ]+) type:\[([^\]]+)\] msb:\(([^)]+)\) lsb:\(([^)]+)\)\)'
-        matches = re.findall(term_pattern, content)
-        
-        for match in matches:
-            name, types, msb, lsb = match
-            # 简化处理，这里可以根据需要扩展
-            if 'Reg' in types or 'Wire' in types:
-                self.nodes[name] = DFGNode(
-                    name=name,
-                    operator_type=OperatorType.TERMINAL,
-                    is_linear=True,
-                    inputs=[],
-                    outputs=[],
-                    bit_width=int(msb) - int(lsb) + 1 if msb.isdigit() and lsb.isdigit() else 1
-                )
-    
-    def _parse_binds(self, content: str):
-        """解析Bind部分，提取操作关系（整行捕获，避免树内括号截断）"""
-        bind_pattern = r'^\(Bind dest:([^ ]+) tree:(.*)\)$'
-        matches = re.findall(bind_pattern, content, flags=re.MULTILINE)
-        
-        for dest, tree in matches:
-            self._parse_tree_structure(dest, tree)
+    def _parse_instance_line(self, line: str):
+        """解析一行Instance，如 (top.u0, 'adder')"""
+        match = INSTANCE_PATTERN.match(line.strip())
+        if match is not None:
+            self.add_instance(*match.groups())
+    
+    def add_instance(self, path: str, module: str):
+        """记录一个实例：path为层次路径，module为模块名"""
+        self.instances[path] = module
+    
+    def _parse_term_line(self, line: str):
+        """解析一行Term，提取节点信息"""
+        match = TERM_PATTERN.match(line)
+        if match is None:
+            return
+        self.add_term(*match.groups())
+    
+    def add_term(self, name: str, types, msb: Optional[str], lsb: Optional[str]):
+        """加入一个Term声明；types为类型名集合（或其文本），msb/lsb为常量文本"""
+        msb_value = self._const_value(msb) if msb is not None else None
+        lsb_value = self._const_value(lsb) if lsb is not None else None
+        bit_width = abs(msb_value - lsb_value) + 1 if msb_value is not None and lsb_value is not None else None
+        if bit_width is not None:
+            self.term_widths[name] = bit_width
+        # 简化处理，这里可以根据需要扩展；已由Bind创建的节点只补充位宽
+        if ('Reg' in types or 'Wire' in types) and name not in self.nodes:
+            self.nodes[name] = DFGNode(
+                name=name,
+                operator_type=OperatorType.TERMINAL,
+                is_linear=True,
+                inputs=[],
+                outputs=[],
+                bit_width=bit_width or 1
+            )
+    
+    def _parse_bind_line(self, line: str):
+        """解析一行Bind，提取操作关系（整行捕获，避免树内括号截断）"""
+        match = BIND_PATTERN.match(line)
+        if match is None:
+            return
+        self.add_bind_text(*match.groups())
+    
+    def add_bind_text(self, dest: str, tree: str):
+        """加入一个Bind：tree为Bind树文本"""
+        self.bind_trees[dest] = tree
+        self._parse_tree_structure(dest, tree)
     
     def _parse_tree_structure(self, dest: str, tree: str):
         """解析树形结构，识别操作符和操作数"""
-        # 识别操作符类型
-        operator_type = self._identify_operator(tree)
-        is_linear = operator_type in self.linear_operators
+        try:
+            root = parse_bind_tree(tree)
+        except TreeSyntaxError:
+            # 无法解析的树退回按文本匹配操作数
+            self._set_node(dest, self._identify_operator(tree), self._extract_inputs(tree), [dest])
+            return
+        self.add_bind(dest, root)
+    
+    def add_bind(self, dest: str, root: TreeNode):
+        """加入一个Bind：dest由语法树root赋值"""
+        self.operator_trees[dest] = root
+        if not self.expand_operators:
+            self._set_node(dest, self._classify(root), self._leaf_inputs(root), [dest])
+            return
         
-        # 提取输入和输出
-        inputs = self._extract_inputs(tree)
-        outputs = [dest]
+        # 展开：每个嵌套运算符一个子节点，输入为其直接操作数，输出为其父节点
+        names = {id(root): dest}
+        parents = {id(root): dest}
+        count = 0
+        for node in root.walk():
+            if node.is_leaf:
+                continue
+            if node is not root:
+                count += 1
+                names[id(node)] = f"{dest}._op{count}_{node.label}"
+            for child in node.children:
+                parents[id(child)] = names[id(node)]
         
-        # 创建或更新节点
-        if dest not in self.nodes:
-            self.nodes[dest] = DFGNode(
-                name=dest,
+        for node in root.walk():
+            if node.is_leaf:
+                continue
+            name = names[id(node)]
+            inputs = [self._leaf_name(child) if child.is_leaf else names[id(child)] for child in node.children]
+            self._set_node(name, self._classify(node), inputs, [parents[id(node)]])
+            if node is not root:
+                self.operator_trees[name] = node
+        
+        # 整棵树只有一个叶节点（如直接赋值）时根节点没有子节点
+        if root.is_leaf:
+            self._set_node(dest, self._classify(root), [self._leaf_name(root)], [dest])
+    
+    def _set_node(self, name: str, operator_type: OperatorType, inputs: List[str], outputs: List[str]):
+        """创建或更新节点"""
+        is_linear = operator_type in self.linear_operators
+        if name not in self.nodes:
+            self.nodes[name] = DFGNode(
+                name=name,
                 operator_type=operator_type,
                 is_linear=is_linear,
                 inputs=inputs,
                 outputs=outputs
             )
         else:
-            self.nodes[dest].operator_type = operator_type
-            self.nodes[dest].is_linear = is_linear
-            self.nodes[dest].inputs = inputs
-            self.nodes[dest].outputs = outputs
+            self.nodes[name].operator_type = operator_type
+            self.nodes[name].is_linear = is_linear
+            self.nodes[name].inputs = inputs
+            self.nodes[name].outputs = outputs
+    
+    @staticmethod
+    def _classify(node: TreeNode) -> OperatorType:
+        """按语法树节点的运算符名确定操作符类型"""
+        return OPERATOR_LABELS.get(node.label, OperatorType.TERMINAL)
+    
+    @staticmethod
+    def _leaf_name(node: TreeNode) -> str:
+        return node.value if node.kind == 'Terminal' else f"const_{node.value}"
+    
+    def _leaf_inputs(self, root: TreeNode) -> List[str]:
+        """先序排列的操作数：Terminal在前，IntConst在后"""
+        terminals = []
+        consts = []
+        for leaf in root.leaves():
+            if leaf.kind == 'Terminal':
+                terminals.append(leaf.value)
+            elif leaf.kind == 'IntConst':
+                consts.append(f"const_{leaf.value}")
+        return terminals + consts
     
     def _identify_operator(self, tree: str) -> OperatorType:
-        """识别操作符类型"""
-        if "Operator Plus" in tree:
-            return OperatorType.PLUS
-        elif "Operator Minus" in tree:
-            return OperatorType.MINUS
-        elif "Operator And" in tree:
-            return OperatorType.AND
-        elif "Operator Or" in tree:
-            return OperatorType.OR
-        elif "Operator Unot" in tree:
-            return OperatorType.NOT
-        elif "Operator Eq" in tree:
-            return OperatorType.EQ
-        elif "Partselect" in tree:
-            return OperatorType.BIT_SELECT
-        elif "Concat" in tree:
-            return OperatorType.CONCAT
-        elif "Branch" in tree:
-            return OperatorType.BRANCH
-        elif "IntConst" in tree:
-            return OperatorType.INT_CONST
-        elif "Terminal" in tree:
-            return OperatorType.TERMINAL
-        else:
-            return OperatorType.TERMINAL
+        """识别操作符类型（取树根的运算符）"""
+        try:
+            return self._classify(parse_bind_tree(tree))
+        except TreeSyntaxError:
+            head = TREE_HEAD_PATTERN.match(tree)
+            if head is None:
+                return OperatorType.TERMINAL
+            return OPERATOR_LABELS.get(head.group(2) or head.group(1), OperatorType.TERMINAL)
     
     def _extract_inputs(self, tree: str) -> List[str]:
         """提取输入节点"""
-        inputs = []
-        # 提取Terminal节点
-        terminal_pattern = r'Terminal ([^ )]+)'
-        terminals = re.findall(terminal_pattern, tree)
-        inputs.extend(terminals)
+        # 一次扫描同时提取Terminal节点与IntConst值（Terminal在前）
+        terminals = []
+        consts = []
+        for kind, value in OPERAND_PATTERN.findall(tree):
+            if kind == 'Terminal':
+                terminals.append(value)
+            else:
+                consts.append(f"const_{value}")
+        return terminals + consts
+    
+    def build(self) -> nx.DiGraph:
+        """由已加入的Term和Bind推断位宽并构建图"""
+        self._infer_bit_widths()
+        self._build_graph()
+        return self.graph
+    
+    def _infer_bit_widths(self):
+        """位宽推断：Term声明的msb/lsb优先，否则按赋值树的Partselect范围和运算符推断"""
+        for name, node in self.nodes.items():
+            if name in self.term_widths:
+                node.bit_width = self.term_widths[name]
+            elif name in self.operator_trees:
+                node.bit_width = self._ast_width(self.operator_trees[name])
+            elif name in self.bind_trees:
+                node.bit_width = self._tree_width(self.bind_trees[name])
+            elif name.startswith('const_'):
+                node.bit_width = max(1, int(self._const_value(name[len('const_'):]) or 0).bit_length())
+            else:
+                node.bit_width = node.bit_width or 1
+    
+    def _tree_width(self, tree: str) -> int:
+        """估算赋值树结果的位宽"""
+        try:
+            return self._ast_width(parse_bind_tree(tree))
+        except TreeSyntaxError:
+            return 1
+    
+    def _ast_width(self, root: TreeNode) -> int:
+        """自底向上计算语法树各节点的位宽，返回根节点位宽"""
+        widths: Dict[int, int] = {}
+        # 先序的逆序保证子节点先于父节点
+        for node in reversed(list(root.walk())):
+            widths[id(node)] = self._node_width(node, widths)
+        return widths[id(root)]
+    
+    def _node_width(self, node: TreeNode, widths: Dict[int, int]) -> int:
+        if node.kind == 'Terminal':
+            return self.term_widths.get(node.value, 1)
+        if node.kind == 'IntConst':
+            size = re.match(r"(\d+)'", node.value or '')
+            if size:
+                return int(size.group(1))
+            return max(1, int(self._const_value(node.value or '') or 0).bit_length())
+        if node.is_leaf:
+            return 1
         
-        # 提取IntConst值
-        const_pattern = r'IntConst ([^ )]+)'
-        consts = re.findall(const_pattern, tree)
-        for const in consts:
-            inputs.append(f"const_{const}")
+        label = node.label
+        if label in self.ONE_BIT_OPERATORS or label == 'Pointer':
+            return 1
+        if label == 'Partselect':
+            msb = node.fields.get('MSB', [])
+            lsb = node.fields.get('LSB', [])
+            if len(msb) == 1 and len(lsb) == 1 and msb[0].kind == lsb[0].kind == 'IntConst':
+                msb_value, lsb_value = self._const_value(msb[0].value), self._const_value(lsb[0].value)
+                if msb_value is not None and lsb_value is not None:
+                    return abs(msb_value - lsb_value) + 1
+            return 1
         
-        return inputs
+        child_widths = [widths[id(child)] for child in node.children]
+        if label == 'Concat':
+            return sum(child_widths) or 1
+        if label == 'Branch':
+            # 条件不影响结果位宽
+            return max([widths[id(child)] for key in ('True', 'False') for child in node.fields.get(key, [])],
+                       default=1)
+        return max(child_widths, default=1)
+    
+    @staticmethod
+    def _const_value(text: str) -> Optional[int]:
+        """解析 'IntConst 3'、'3' 或 Verilog 格式常量（如 4'b1010）的值"""
+        text = text.strip()
+        if text.startswith('IntConst '):
+            text = text[len('IntConst '):].strip()
+        if text.isdigit():
+            return int(text)
+        match = re.fullmatch(r"\d*'([sS]?)([bBoOdDhH])([0-9a-fA-F_xXzZ]+)", text)
+        if match:
+            base = {'b': 2, 'o': 8, 'd': 10, 'h': 16}[match.group(2).lower()]
+            digits = re.sub(r'[_xXzZ]', '0', match.group(3))
+            return int(digits, base)
+        return None
     
     def _build_graph(self):
         """构建有向图结构"""
@@ -183,12 +440,25 @@ class DFGParser:
         for node_name, node_data in self.nodes.items():
             self.graph.add_node(node_name, **node_data.__dict__)
         
+        # 稠密位宽数组，按节点编号索引
+        index_graph(self.graph)
+        
         # 添加边
         for node_name, node_data in self.nodes.items():
             for input_node in node_data.inputs:
                 if input_node in self.nodes:
                     self.graph.add_edge(input_node, node_name)
     
+    def cache_options(self) -> Dict[str, bool]:
+        """影响解析结果的选项，参与图缓存的键"""
+        return {'expand_operators': self.expand_operators}
+    
+    def load_graph(self, graph: nx.DiGraph) -> nx.DiGraph:
+        """采用已构建的图（如从缓存加载），由节点属性恢复节点表"""
+        self.graph = graph
+        self.nodes = {name: DFGNode(**data) for name, data in graph.nodes(data=True)}
+        return graph
+    
     def get_linearity_analysis(self) -> Dict[str, float]:
         """获取线性程度分析"""
         total_nodes = len(self.nodes)
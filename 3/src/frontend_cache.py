@@ -0,0 +1,165 @@
+"""
+Verilog前端缓存模块
+pyverilog每次构造解析器都会在当前工作目录重新生成PLY解析表（parsetab.py、parser.out），
+并对源文件重新做预处理。本模块将解析表以pickle形式保存在按pyverilog/PLY版本区分的固定目录，
+预处理结果按 (源文件内容, include路径, 宏定义) 的哈希缓存，重复运行时两步均可跳过
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+from typing import Dict, List, Optional
+
+import ply
+import pyverilog
+from ply.yacc import yacc, NullLogger
+from pyverilog.vparser.lexer import VerilogLexer
+from pyverilog.vparser.parser import VerilogParser
+from pyverilog.vparser.preprocessor import VerilogPreprocessor
+from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+
+
+CACHE_VERSION = 1
+
+# include目录中参与哈希的头文件扩展名
+INCLUDE_SUFFIXES = ('.v', '.vh', '.sv', '.svh', '.h')
+
+
+class CachedTablesParser(VerilogParser):
+    """从缓存的pickle读取LALR解析表的VerilogParser，不在工作目录写任何文件"""
+
+    def __init__(self, tables_file: str):
+        self.lexer = VerilogLexer(error_func=self._lexer_error_func)
+        self.lexer.build()
+        self.tokens = self.lexer.tokens
+
+        if os.path.exists(tables_file):
+            try:
+                self.parser = yacc(module=self, method='LALR', debug=False,
+                                   picklefile=tables_file, errorlog=NullLogger())
+                return
+            except Exception:
+                # 损坏的表文件重新生成
+                os.remove(tables_file)
+
+        # 先写入临时文件再改名，并发生成时不会读到不完整的表
+        staging = f"{tables_file}.{os.getpid()}.tmp"
+        self.parser = yacc(module=self, method='LALR', debug=False,
+                           picklefile=staging, errorlog=NullLogger())
+        os.replace(staging, tables_file)
+
+
+class CachedDataflowAnalyzer(VerilogDataflowAnalyzer):
+    """使用给定解析器与已预处理源码的数据流分析器
+
+    VerilogCodeParser.__init__ 会在工作目录生成解析表，这里不调用它，
+    只设置 generate() / parse() 用到的属性
+    """
+
+    def __init__(self, text: str, topmodule: str, parser: VerilogParser):
+        self.topmodule = topmodule
+        self.terms = {}
+        self.binddict = {}
+        self.frametable = None
+        self.noreorder = False
+        self.nobind = False
+        self.directives = ()
+        self.preprocess_output = None
+        self.parser = parser
+        self.text = text
+
+    def preprocess(self) -> str:
+        return self.text
+
+
+class FrontendCache:
+    """PLY解析表与预处理源码的持久缓存"""
+
+    def __init__(self, directory: str = '.cache/pyverilog'):
+        # 版本目录：pyverilog或PLY升级后自动使用新的缓存
+        self.directory = os.path.join(
+            directory, f"v{CACHE_VERSION}-pyverilog{pyverilog.__version__}-ply{ply.__version__}")
+        self.tables_file = os.path.join(self.directory, 'parsetab.pickle')
+        self.preprocessed_dir = os.path.join(self.directory, 'preprocessed')
+        self.stats: Dict[str, int] = {'table_hits': 0, 'table_misses': 0,
+                                      'preprocess_hits': 0, 'preprocess_misses': 0}
+
+    def create_parser(self) -> VerilogParser:
+        """构造使用缓存解析表的解析器"""
+        os.makedirs(self.directory, exist_ok=True)
+        self.stats['table_hits' if os.path.exists(self.tables_file) else 'table_misses'] += 1
+        return CachedTablesParser(self.tables_file)
+
+    def ensure_tables(self):
+        """预先生成解析表（并行分析前调用，避免各进程重复生成）"""
+        self.create_parser()
+
+    @staticmethod
+    def preprocess_key(verilog_files: List[str], include_paths: List[str], defines: List[str]) -> str:
+        """源文件内容、include目录中头文件的大小与修改时间、宏定义的SHA-256"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({'include': list(include_paths), 'define': list(defines)}).encode('utf-8'))
+        for path in verilog_files:
+            digest.update(os.path.abspath(path).encode('utf-8'))
+            with open(path, 'rb') as f:
+                digest.update(hashlib.sha256(f.read()).digest())
+        for directory in include_paths:
+            if not os.path.isdir(directory):
+                continue
+            for name in sorted(os.listdir(directory)):
+                if name.endswith(INCLUDE_SUFFIXES):
+                    stat = os.stat(os.path.join(directory, name))
+                    digest.update(f"{name}:{stat.st_size}:{stat.st_mtime_ns}".encode('utf-8'))
+        return digest.hexdigest()
+
+    def preprocess(self, verilog_files: List[str], include_paths: Optional[List[str]] = None,
+                   defines: Optional[List[str]] = None) -> str:
+        """返回预处理后的源码，命中缓存时不调用iverilog"""
+        include_paths = list(include_paths or [])
+        defines = list(defines or [])
+        path = os.path.join(self.preprocessed_dir, self.preprocess_key(verilog_files, include_paths, defines) + '.v')
+        if os.path.exists(path):
+            self.stats['preprocess_hits'] += 1
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+
+        self.stats['preprocess_misses'] += 1
+        os.makedirs(self.preprocessed_dir, exist_ok=True)
+        # 每次预处理使用独立的输出文件，并行运行时不会互相覆盖 preprocess.output
+        fd, staging = tempfile.mkstemp(suffix='.v', dir=self.preprocessed_dir)
+        os.close(fd)
+        try:
+            VerilogPreprocessor(list(verilog_files), staging, include_paths, defines).preprocess()
+            with open(staging, 'r', encoding='utf-8') as f:
+                text = f.read()
+            if text.strip():
+                os.replace(staging, path)
+        finally:
+            if os.path.exists(staging):
+                os.remove(staging)
+        return text
+
+    def create_analyzer(self, verilog_files: List[str], topmodule: str,
+                        include_paths: Optional[List[str]] = None,
+                        defines: Optional[List[str]] = None) -> VerilogDataflowAnalyzer:
+        """构造复用缓存的数据流分析器，调用 generate() 后与 VerilogDataflowAnalyzer 用法相同"""
+        text = self.preprocess(verilog_files, include_paths, defines)
+        return CachedDataflowAnalyzer(text, topmodule, self.create_parser())
+
+
+def main():
+    """测试函数"""
+    import time
+
+    cache = FrontendCache(tempfile.mkdtemp())
+    for attempt in ('首次', '再次'):
+        start_time = time.time()
+        analyzer = cache.create_analyzer(['verilogcode/4004.v'], 'alu')
+        analyzer.generate()
+        print(f"{attempt}: {time.time() - start_time:.3f}秒, {len(analyzer.getBinddict())} 个Bind")
+    print(f"缓存统计: {cache.stats}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,251 @@
+"""
+DFG图缓存模块
+将解析后的图编译为紧凑的二进制数组（节点名表、扇入/扇出CSR、属性数组、
+拓扑序与度数），按DFG文件内容的SHA-256与解析器版本寻址保存；
+再次运行时以内存映射方式加载，跳过文本解析
+"""
+
+import os
+import json
+import time
+import shutil
+import hashlib
+import tempfile
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, fields
+
+from dfg_parser import DFGParser, OperatorType, PARSER_VERSION, bump_graph_version
+
+
+CACHE_VERSION = 1
+
+# 操作符类型按枚举顺序编码为uint8
+OPERATOR_CODES = {operator: code for code, operator in enumerate(OperatorType)}
+OPERATORS = list(OperatorType)
+
+
+@dataclass
+class CompiledGraph:
+    """编译后的图：全部字段为numpy数组，名称通过名表索引
+
+    名表前num_nodes项为图节点（按图中顺序），其后为只出现在inputs/outputs/value中的名称
+    """
+    name_bytes: np.ndarray       # uint8，名表各项UTF-8编码拼接
+    name_offsets: np.ndarray     # int64，名表第i项为 name_bytes[offsets[i]:offsets[i+1]]
+    operator_codes: np.ndarray   # uint8，OperatorType编码
+    is_linear: np.ndarray        # bool
+    bit_widths: np.ndarray       # int64，-1表示未知
+    values: np.ndarray           # int64，value在名表中的索引，-1表示无
+    inputs_indptr: np.ndarray    # inputs属性（名表索引）的CSR
+    inputs_indices: np.ndarray
+    outputs_indptr: np.ndarray   # outputs属性（名表索引）的CSR
+    outputs_indices: np.ndarray
+    fanin_indptr: np.ndarray     # 前驱CSR（节点索引），保持原图的插入顺序
+    fanin_indices: np.ndarray
+    fanout_indptr: np.ndarray    # 后继CSR（节点索引）
+    fanout_indices: np.ndarray
+    in_degree: np.ndarray
+    out_degree: np.ndarray
+    topo_order: np.ndarray       # 拓扑序（节点索引），有环时为空
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.operator_codes)
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.fanin_indices)
+
+    def names(self) -> List[str]:
+        """解码名表"""
+        blob = self.name_bytes.tobytes()
+        offsets = self.name_offsets.tolist()
+        return [blob[start:end].decode('utf-8') for start, end in zip(offsets[:-1], offsets[1:])]
+
+    @classmethod
+    def from_networkx(cls, graph: nx.DiGraph) -> 'CompiledGraph':
+        """由解析器生成的图编译"""
+        nodes = list(graph.nodes())
+        table = {node: i for i, node in enumerate(nodes)}
+
+        def index(name) -> int:
+            if name not in table:
+                table[name] = len(table)
+            return table[name]
+
+        def csr(lists: List[List[int]]):
+            indptr = np.zeros(len(lists) + 1, dtype=np.int64)
+            indptr[1:] = np.cumsum([len(items) for items in lists])
+            indices = np.fromiter((i for items in lists for i in items), dtype=np.int64, count=int(indptr[-1]))
+            return indptr, indices
+
+        data = [graph.nodes[node] for node in nodes]
+        inputs_indptr, inputs_indices = csr([[index(name) for name in d.get('inputs', [])] for d in data])
+        outputs_indptr, outputs_indices = csr([[index(name) for name in d.get('outputs', [])] for d in data])
+        values = np.array([index(d['value']) if d.get('value') is not None else -1 for d in data], dtype=np.int64)
+        fanin_indptr, fanin_indices = csr([[table[pred] for pred in graph.predecessors(node)] for node in nodes])
+        fanout_indptr, fanout_indices = csr([[table[succ] for succ in graph.successors(node)] for node in nodes])
+
+        encoded = [str(name).encode('utf-8') for name in table]
+        name_offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+        name_offsets[1:] = np.cumsum([len(name) for name in encoded])
+
+        try:
+            topo_order = np.array([table[node] for node in nx.topological_sort(graph)], dtype=np.int64)
+        except nx.NetworkXUnfeasible:
+            topo_order = np.zeros(0, dtype=np.int64)
+
+        return cls(
+            name_bytes=np.frombuffer(b''.join(encoded), dtype=np.uint8),
+            name_offsets=name_offsets,
+            operator_codes=np.array([OPERATOR_CODES[d['operator_type']] for d in data], dtype=np.uint8),
+            is_linear=np.array([bool(d.get('is_linear')) for d in data], dtype=bool),
+            bit_widths=np.array([d.get('bit_width') or -1 for d in data], dtype=np.int64),
+            values=values,
+            inputs_indptr=inputs_indptr, inputs_indices=inputs_indices,
+            outputs_indptr=outputs_indptr, outputs_indices=outputs_indices,
+            fanin_indptr=fanin_indptr, fanin_indices=fanin_indices,
+            fanout_indptr=fanout_indptr, fanout_indices=fanout_indices,
+            in_degree=np.diff(fanin_indptr),
+            out_degree=np.diff(fanout_indptr),
+            topo_order=topo_order
+        )
+
+    def to_networkx(self) -> nx.DiGraph:
+        """还原为与解析器输出相同的networkx图（节点、边与邻接顺序一致）"""
+        names = self.names()
+        operator_codes = self.operator_codes.tolist()
+        is_linear = self.is_linear.tolist()
+        bit_widths = self.bit_widths.tolist()
+        values = self.values.tolist()
+        inputs_indptr, inputs_indices = self.inputs_indptr.tolist(), self.inputs_indices.tolist()
+        outputs_indptr, outputs_indices = self.outputs_indptr.tolist(), self.outputs_indices.tolist()
+        fanin_indptr, fanin_indices = self.fanin_indptr.tolist(), self.fanin_indices.tolist()
+
+        graph = nx.DiGraph()
+        graph.add_nodes_from(
+            (names[i], {
+                'name': names[i],
+                'operator_type': OPERATORS[operator_codes[i]],
+                'is_linear': is_linear[i],
+                'inputs': [names[j] for j in inputs_indices[inputs_indptr[i]:inputs_indptr[i + 1]]],
+                'outputs': [names[j] for j in outputs_indices[outputs_indptr[i]:outputs_indptr[i + 1]]],
+                'bit_width': bit_widths[i] if bit_widths[i] >= 0 else None,
+                'value': names[values[i]] if values[i] >= 0 else None
+            })
+            for i in range(self.num_nodes)
+        )
+        graph.graph['node_ids'] = {names[i]: i for i in range(self.num_nodes)}
+        graph.graph['bit_widths'] = np.where(self.bit_widths > 0, self.bit_widths, 1).astype(float)
+        bump_graph_version(graph)
+
+        # 解析器按目标节点依次加入入边，按前驱CSR重放即可得到相同的邻接顺序
+        graph.add_edges_from(
+            (names[fanin_indices[k]], names[v])
+            for v in range(self.num_nodes)
+            for k in range(fanin_indptr[v], fanin_indptr[v + 1])
+        )
+        return graph
+
+
+class GraphCache:
+    """按内容寻址的DFG图缓存"""
+
+    def __init__(self, directory: str = '.cache/dfg_graphs'):
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(file_path: str, options: Optional[Dict[str, Any]] = None) -> str:
+        """DFG文件内容、解析器版本与解析选项的SHA-256"""
+        digest = hashlib.sha256()
+        digest.update(json.dumps({'cache': CACHE_VERSION, 'parser': PARSER_VERSION,
+                                  'options': options or {}}, sort_keys=True).encode('utf-8'))
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1 << 20), b''):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def load(self, key: str) -> Optional[CompiledGraph]:
+        """以内存映射方式加载编译后的图，不存在或损坏时返回None"""
+        entry = self.path(key)
+        try:
+            with open(os.path.join(entry, 'meta.json'), 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != CACHE_VERSION or meta.get('parser_version') != PARSER_VERSION:
+                return None
+            return CompiledGraph(**{item.name: np.load(os.path.join(entry, f'{item.name}.npy'), mmap_mode='r')
+                                    for item in fields(CompiledGraph)})
+        except (OSError, ValueError, json.JSONDecodeError):
+            return None
+
+    def save(self, key: str, compiled: CompiledGraph, source: str = ''):
+        """写入临时目录后整体改名，并发运行不会读到不完整的缓存"""
+        os.makedirs(self.directory, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=self.directory, prefix='.tmp-')
+        try:
+            for item in fields(CompiledGraph):
+                np.save(os.path.join(staging, f'{item.name}.npy'), np.ascontiguousarray(getattr(compiled, item.name)))
+            with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as f:
+                json.dump({
+                    'version': CACHE_VERSION,
+                    'parser_version': PARSER_VERSION,
+                    'source': source,
+                    'num_nodes': compiled.num_nodes,
+                    'num_edges': compiled.num_edges
+                }, f, indent=2, ensure_ascii=False)
+            os.replace(staging, self.path(key))
+        except OSError:
+            # 其他进程已写入同一键
+            shutil.rmtree(staging, ignore_errors=True)
+
+    def parse(self, parser: DFGParser, file_path: str) -> nx.DiGraph:
+        """命中缓存时直接加载，否则解析并写入缓存
+
+        缓存只保存图本身：命中时解析器的 operator_trees、bind_trees 与 term_widths 为空，
+        需要赋值树的调用方（如监视模式的修改检测）应直接解析
+        """
+        start_time = time.time()
+        key = self.key(file_path, parser.cache_options())
+        compiled = self.load(key)
+        if compiled is None:
+            self.misses += 1
+            graph = parser.parse_dfg_file(file_path)
+            self.save(key, CompiledGraph.from_networkx(graph), source=os.path.abspath(file_path))
+            parser.parse_stats.update({'cache_hit': False, 'cache_key': key})
+            return graph
+
+        self.hits += 1
+        graph = parser.load_graph(compiled.to_networkx())
+        elapsed = time.time() - start_time
+        parser.parse_stats = {
+            'cache_hit': True,
+            'cache_key': key,
+            'file_bytes': os.path.getsize(file_path),
+            'seconds': elapsed
+        }
+        return graph
+
+
+def main():
+    """测试函数"""
+    dfg_file = 'dfg_files/4004.txt'
+    with tempfile.TemporaryDirectory() as directory:
+        cache = GraphCache(directory)
+        for attempt in ('首次', '再次'):
+            parser = DFGParser()
+            graph = cache.parse(parser, dfg_file)
+            stats = parser.parse_stats
+            print(f"{attempt}: 命中缓存={stats['cache_hit']}, {stats['seconds'] * 1000:.1f} ms, "
+                  f"{len(graph.nodes)} 个节点, {len(graph.edges)} 条边")
+        print(f"缓存键: {stats['cache_key'][:16]}...")
+
+
+if __name__ == "__main__":
+    main()
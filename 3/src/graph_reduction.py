@@ -0,0 +1,210 @@
+"""
+图化简模块
+在搜索前收缩Rename链、单扇入单扇出连线和线性链，剪除孤立常量，
+优化器在化简后的图上搜索，结果再展开回原图供接口生成使用
+"""
+
+import networkx as nx
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass, field
+
+from dfg_parser import OperatorType
+
+
+@dataclass
+class ReductionConfig:
+    """图化简配置参数"""
+    contract_renames: bool = True
+    contract_wires: bool = True
+    contract_linear_chains: bool = True
+    prune_isolated_constants: bool = True
+    pruned_partition: int = 0  # 被剪除节点展开时的分区
+
+
+@dataclass
+class ReducedGraph:
+    """化简结果"""
+    graph: nx.DiGraph
+    members: Dict[str, List[str]]
+    representative: Dict[str, str]
+    pruned: List[str] = field(default_factory=list)
+    pruned_partition: int = 0
+    original: Optional[nx.DiGraph] = None  # 化简前的原图，成本在其上计算
+
+    def expand_partition(self, partition: Dict[str, int]) -> Dict[str, int]:
+        """将超节点分区展开为原图分区"""
+        expanded = {}
+        for supernode, part in partition.items():
+            for member in self.members.get(supernode, [supernode]):
+                expanded[member] = part
+        for node in self.pruned:
+            expanded[node] = self.pruned_partition
+        return expanded
+
+    def reduce_partition(self, partition: Dict[str, int]) -> Dict[str, int]:
+        """将原图分区映射到化简图（超节点取代表节点的分区）"""
+        return {supernode: partition.get(supernode, 0) for supernode in self.graph.nodes()}
+
+    def reduction_ratio(self) -> float:
+        """原图节点数与化简图节点数之比"""
+        original = len(self.representative) + len(self.pruned)
+        return original / len(self.graph) if len(self.graph) > 0 else 1.0
+
+
+class GraphReducer:
+    """DFG图化简器"""
+
+    def __init__(self, config: ReductionConfig = None):
+        self.config = config or ReductionConfig()
+
+    def reduce(self, graph: nx.DiGraph) -> ReducedGraph:
+        """执行化简，返回化简图及超节点成员映射"""
+        pruned = []
+        if self.config.prune_isolated_constants:
+            pruned = [node for node, data in graph.nodes(data=True)
+                      if graph.degree(node) == 0 and self._is_constant(node, data)]
+        pruned_set = set(pruned)
+
+        # 并查集：成员 -> 父节点，根为超节点代表
+        parent = {node: node for node in graph.nodes() if node not in pruned_set}
+
+        def find(node):
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        for node in list(parent):
+            target = self._contraction_target(graph, node)
+            if target is None or target in pruned_set:
+                continue
+            root_node, root_target = find(node), find(target)
+            if root_node != root_target:
+                parent[root_node] = root_target
+
+        # 构建超节点成员表
+        members: Dict[str, List[str]] = {}
+        representative = {}
+        for node in parent:
+            root = find(node)
+            members.setdefault(root, []).append(node)
+            representative[node] = root
+
+        reduced = nx.DiGraph()
+        for root, group in members.items():
+            attrs = dict(graph.nodes[root])
+            attrs['members'] = group
+            attrs['weight'] = sum(graph.nodes[node].get('weight', 1) for node in group)
+            widths = [graph.nodes[node].get('bit_width') or 1 for node in group]
+            attrs['bit_width'] = max(widths)
+            # 直连线和Rename只是传递信号，不影响超节点的线性属性
+            operators = [node for node in group if not self._is_pass_through(node, graph.nodes[node])]
+            attrs['is_linear'] = all(graph.nodes[node].get('is_linear', True) for node in (operators or group))
+            reduced.add_node(root, **attrs)
+
+        for src, dst in graph.edges():
+            if src in pruned_set or dst in pruned_set:
+                continue
+            rsrc, rdst = representative[src], representative[dst]
+            if rsrc == rdst:
+                continue
+            multiplicity = graph.edges[src, dst].get('multiplicity', 1)
+            if reduced.has_edge(rsrc, rdst):
+                reduced.edges[rsrc, rdst]['multiplicity'] += multiplicity
+            else:
+                reduced.add_edge(rsrc, rdst, multiplicity=multiplicity)
+
+        return ReducedGraph(
+            graph=reduced,
+            members=members,
+            representative=representative,
+            pruned=pruned,
+            pruned_partition=self.config.pruned_partition,
+            original=graph
+        )
+
+    def _contraction_target(self, graph: nx.DiGraph, node: str) -> Optional[str]:
+        """返回节点应并入的邻居；不需要收缩时返回None"""
+        data = graph.nodes[node]
+        predecessors = list(graph.predecessors(node))
+        successors = list(graph.successors(node))
+
+        # Rename节点并入其唯一的驱动或唯一的负载
+        if self.config.contract_renames and self._is_rename(node, data):
+            if len(predecessors) == 1:
+                return predecessors[0]
+            if not predecessors and len(successors) == 1:
+                return successors[0]
+            return None
+
+        if len(predecessors) != 1 or len(successors) > 1:
+            return None
+        driver = predecessors[0]
+
+        # 单扇入单扇出的直连线
+        if (self.config.contract_wires and len(successors) == 1 and
+                data.get('operator_type') == OperatorType.TERMINAL and
+                graph.out_degree(driver) == 1):
+            return driver
+
+        # 线性链：驱动只连到本节点且两者都是线性节点
+        if (self.config.contract_linear_chains and graph.out_degree(driver) == 1 and
+                data.get('is_linear') and graph.nodes[driver].get('is_linear')):
+            return driver
+
+        return None
+
+    @staticmethod
+    def _is_rename(node: str, data: Dict[str, Any]) -> bool:
+        """判断是否为pyverilog生成的Rename节点（_rnN_*）"""
+        return (data.get('operator_type') == OperatorType.RENAME or
+                str(node).rsplit('.', 1)[-1].startswith('_rn'))
+
+    @classmethod
+    def _is_pass_through(cls, node: str, data: Dict[str, Any]) -> bool:
+        """判断节点是否只是传递信号（Rename或Terminal直连）"""
+        return cls._is_rename(node, data) or data.get('operator_type') == OperatorType.TERMINAL
+
+    @staticmethod
+    def _is_constant(node: str, data: Dict[str, Any]) -> bool:
+        """判断是否为常量节点"""
+        return (data.get('operator_type') == OperatorType.INT_CONST or
+                str(node).startswith('const_'))
+
+    def analyze_reduction(self, reduced: ReducedGraph) -> Dict[str, Any]:
+        """统计化简效果"""
+        original_nodes = len(reduced.representative) + len(reduced.pruned)
+        return {
+            'original_nodes': original_nodes,
+            'reduced_nodes': len(reduced.graph),
+            'supernodes': sum(1 for group in reduced.members.values() if len(group) > 1),
+            'pruned_nodes': len(reduced.pruned),
+            'reduction_ratio': reduced.reduction_ratio()
+        }
+
+
+def main():
+    """测试函数"""
+    # 创建示例图：A -> B -> C 为直连线链，D 为孤立常量
+    graph = nx.DiGraph()
+    graph.add_node('A', operator_type=OperatorType.PLUS, is_linear=True, bit_width=4)
+    graph.add_node('B', operator_type=OperatorType.TERMINAL, is_linear=True, bit_width=4)
+    graph.add_node('C', operator_type=OperatorType.EQ, is_linear=False, bit_width=1)
+    graph.add_node('E', operator_type=OperatorType.AND, is_linear=False, bit_width=1)
+    graph.add_node('D', operator_type=OperatorType.INT_CONST, is_linear=False, bit_width=1)
+    graph.add_edges_from([('A', 'B'), ('B', 'C'), ('E', 'C')])
+
+    reducer = GraphReducer()
+    reduced = reducer.reduce(graph)
+
+    print("图化简结果:")
+    print(f"  超节点: {reduced.members}")
+    print(f"  剪除节点: {reduced.pruned}")
+    print(f"  化简统计: {reducer.analyze_reduction(reduced)}")
+    print(f"  展开分区: {reduced.expand_partition({node: 1 for node in reduced.graph.nodes()})}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,511 @@
+"""
+层次化DFG模块
+pyverilog的数据流分析把设计完全展开，同一子模块在每个实例化处都会重复出现。
+本模块按DFG的Instance段恢复层次：端口位宽与Bind内容都相同的实例共用一个模板，
+每个模板只构建一次DFG（以其第一个实例为模板），其余实例的Bind只做行哈希、不解析语法树；上层图中子实例作为带端口位宽的黑盒超节点，
+需要时再按实例路径或模块名惰性展开，全部展开时与平坦解析的图一致
+"""
+
+import os
+import re
+import time
+import fnmatch
+import networkx as nx
+from typing import Dict, List, Optional, Set, Tuple, Union
+from dataclasses import dataclass
+
+from bind_tree import TreeNode
+from dfg_parser import (DFGParser, OperatorType, open_dfg_text, SECTION_MARKERS,
+                        TERM_PATTERN, BIND_PATTERN, INSTANCE_PATTERN, index_graph)
+
+
+# 端口方向对应的Term类型
+PORT_TYPES = {'Input': 'input', 'Output': 'output', 'Inout': 'inout'}
+
+
+@dataclass
+class PortInfo:
+    """模块端口"""
+    name: str
+    direction: str   # input / output / inout
+    bit_width: int
+
+
+@dataclass
+class ModuleDFG:
+    """单个模块（同一端口位宽的实例共用）的DFG模板
+
+    图中的节点沿用模板实例（representative）的层次名，子实例为超节点，
+    子实例的端口在图中保留为边界节点
+    """
+    key: str                    # 模块名，端口位宽或Bind内容不同的实例为 模块名#序号
+    module: str
+    representative: str         # 模板实例路径
+    graph: nx.DiGraph
+    ports: Dict[str, PortInfo]
+    instances: Dict[str, str]   # 直接子实例路径 -> 模块键
+    num_nodes: int              # 完全展开后的节点数
+    is_linear: bool
+    build_seconds: float = 0.0
+
+
+def _port_direction(types) -> Optional[str]:
+    for name, direction in PORT_TYPES.items():
+        if name in types:
+            return direction
+    return None
+
+
+def _term_types(types) -> Set[str]:
+    """Term类型集合（文本形式如 'Input', 'Wire'）"""
+    if isinstance(types, str):
+        return {name.strip(" '") for name in types.split(',') if name.strip(" '")}
+    return {str(name) for name in types}
+
+
+def _rename(name: str, old: str, new: str) -> str:
+    """将层次名中的实例前缀old替换为new"""
+    if old == new:
+        return name
+    if name == old:
+        return new
+    if name.startswith(old + '.'):
+        return new + name[len(old):]
+    return name
+
+
+def _body_line(dest: str, tree: str, pattern) -> str:
+    """去掉实例前缀的Bind行文本，不同实例中相同的赋值得到相同的文本"""
+    return pattern.sub('.', f"{dest} {tree}")
+
+
+class HierarchicalDFG:
+    """层次化DFG构建器
+
+    输入顺序为 Instance -> Term -> Bind：先用 note_bind() 登记全部Bind的文本以划分模板，
+    再只对 needs_bind() 为真的Bind调用 add_bind()
+    """
+
+    def __init__(self, expand_operators: bool = False):
+        self.expand_operators = expand_operators
+        self.instances: Dict[str, str] = {}   # 实例路径 -> 模块名
+        self.terms: Dict[str, Tuple[Set[str], Optional[str], Optional[str]]] = {}
+        self.binds: Dict[str, Union[str, TreeNode]] = {}  # 只保存构建模板需要的Bind（文本或语法树）
+        self.parse_stats: Dict[str, float] = {}
+        self._scope_binds: Dict[Optional[str], List[str]] = {}  # 实例 -> 其中的赋值目标
+        self._body_hashes: Dict[str, Tuple[int, int]] = {}  # 实例 -> (Bind数, 去前缀Bind行哈希之和)
+        self._prefix_patterns: Dict[str, re.Pattern] = {}
+        self._modules: Dict[str, ModuleDFG] = {}
+        self._index = None
+        self._grouped = False
+
+    # ------------------------------------------------------------------
+    # 输入
+    # ------------------------------------------------------------------
+
+    def add_instance(self, path: str, module: str):
+        """加入一个实例：path为层次路径（如 top.u0），module为模块名"""
+        self.instances[path] = module
+        self._index = None
+
+    def add_term(self, name: str, types, msb: Optional[str], lsb: Optional[str]):
+        """加入一个Term声明（所有实例都保留，用于端口位宽与实例分组）"""
+        self.terms[name] = (_term_types(types), msb, lsb)
+        self._index = None
+
+    def bind_scope(self, dest: str) -> Optional[str]:
+        """Bind所在的实例：子实例输入端口的连接属于上层实例"""
+        index = self._structure()
+        owner = self.owner(dest)
+        if owner is not None and dest in index['input_ports'] and index['parent'][owner] is not None:
+            return index['parent'][owner]
+        return owner
+
+    def note_bind(self, dest: str, tree: str):
+        """登记一个Bind的文本：按行哈希计入所在实例的内容指纹（不解析语法树）
+
+        只有端口位宽与内容指纹都相同的实例才共用模板，
+        避免同名模块的不同实例（如不同参数下的generate分支）被错误地合并
+        """
+        scope = self.bind_scope(dest)
+        if scope is None:
+            return
+        pattern = self._prefix_patterns.get(scope)
+        if pattern is None:
+            pattern = re.compile(r'(?<![\w.$])' + re.escape(scope) + r'\.')
+            self._prefix_patterns[scope] = pattern
+        count, total = self._body_hashes.get(scope, (0, 0))
+        # 哈希之和与Bind的顺序无关
+        self._body_hashes[scope] = (count + 1, (total + hash(_body_line(dest, tree, pattern))) & 0xFFFFFFFFFFFFFFFF)
+        self._grouped = False
+
+    def needs_bind(self, dest: str) -> bool:
+        """Bind是否参与构建：模板实例内部的赋值，以及模板实例中子实例输入端口的连接"""
+        scope = self.bind_scope(dest)
+        return scope is not None and scope in self._build_index()['is_representative']
+
+    def add_bind(self, dest: str, tree: Union[str, TreeNode]):
+        """加入一个Bind：tree为Bind树文本（构建时才解析）或语法树"""
+        if dest not in self.binds:
+            self._scope_binds.setdefault(self.owner(dest), []).append(dest)
+        self.binds[dest] = tree
+        self._modules.clear()
+
+    def parse_dfg_file(self, file_path: str, flatten: Optional[List[str]] = None) -> nx.DiGraph:
+        """按层次解析DFG文件：非模板实例的Bind只做行匹配与哈希，不解析语法树；flatten同 build()"""
+        start_time = time.time()
+        self._modules.clear()
+        text_bytes = 0
+        line_count = 0
+        skipped = 0
+        bind_lines = []
+
+        with open_dfg_text(file_path) as f:
+            section = None
+            for line in f:
+                text_bytes += len(line)
+                line_count += 1
+                line = line.rstrip('\n')
+                marker = SECTION_MARKERS.get(line.strip())
+                if marker is not None:
+                    section = marker
+                elif section == 'instance':
+                    match = INSTANCE_PATTERN.match(line.strip())
+                    if match is not None:
+                        self.add_instance(*match.groups())
+                elif section == 'term' or (section is None and line.startswith('(Term ')):
+                    match = TERM_PATTERN.match(line)
+                    if match is not None:
+                        self.add_term(*match.groups())
+                elif section == 'bind' or (section is None and line.startswith('(Bind ')):
+                    match = BIND_PATTERN.match(line)
+                    if match is None:
+                        continue
+                    self.note_bind(*match.groups())
+                    bind_lines.append(match.groups())
+
+        # 模板划分依赖全部Bind的内容指纹，读完后再挑出模板实例的Bind
+        for dest, tree in bind_lines:
+            if self.needs_bind(dest):
+                self.add_bind(dest, tree)
+            else:
+                skipped += 1
+
+        graph = self.build(flatten)
+        elapsed = time.time() - start_time
+        self.parse_stats.update({
+            'lines': line_count,
+            'text_bytes': text_bytes,
+            'file_bytes': os.path.getsize(file_path),
+            'skipped_binds': skipped,
+            'seconds': elapsed,
+            'mb_per_s': text_bytes / 1e6 / elapsed if elapsed > 0 else float('inf')
+        })
+        return graph
+
+    # ------------------------------------------------------------------
+    # 实例层次
+    # ------------------------------------------------------------------
+
+    def owner(self, name: str) -> Optional[str]:
+        """信号所属的实例（名称中最长的实例路径前缀）"""
+        parts = name.split('.')
+        for i in range(len(parts) - 1, 0, -1):
+            prefix = '.'.join(parts[:i])
+            if prefix in self.instances:
+                return prefix
+        return None
+
+    @property
+    def modules(self) -> Dict[str, ModuleDFG]:
+        """已构建的模块模板（模块键 -> 模板）"""
+        return dict(self._modules)
+
+    @property
+    def top(self) -> str:
+        return self._build_index()['top']
+
+    def module_key(self, path: str) -> str:
+        """实例对应的模块模板键"""
+        return self._build_index()['key'][path]
+
+    def _structure(self) -> Dict:
+        """由Instance与Term建立实例父子关系与端口（加入Term/Instance后失效）"""
+        if self._index is not None:
+            return self._index
+
+        if not self.instances:
+            # 没有Instance段的DFG：以信号名的首段作为唯一的顶层实例
+            tops = sorted({name.split('.')[0] for name in self.terms if '.' in name})
+            if len(tops) != 1:
+                raise ValueError("DFG中没有Instance段，无法确定顶层模块")
+            self.instances[tops[0]] = tops[0]
+
+        parent = {path: self.owner(path) for path in self.instances}
+        tops = [path for path, up in parent.items() if up is None]
+        if len(tops) != 1:
+            raise ValueError(f"DFG中应有且只有一个顶层实例: {tops}")
+        children: Dict[str, List[str]] = {path: [] for path in self.instances}
+        for path in sorted(self.instances):
+            if parent[path] is not None:
+                children[parent[path]].append(path)
+
+        scope_terms: Dict[str, List[str]] = {path: [] for path in self.instances}
+        ports: Dict[str, Dict[str, PortInfo]] = {path: {} for path in self.instances}
+        input_ports = set()
+        width_parser = DFGParser()
+        for name, (types, msb, lsb) in self.terms.items():
+            path = self.owner(name)
+            if path is None:
+                continue
+            scope_terms[path].append(name)
+            direction = _port_direction(types)
+            if direction is None:
+                continue
+            local = name[len(path) + 1:]
+            width_parser.add_term(name, set(), msb, lsb)
+            ports[path][local] = PortInfo(local, direction, width_parser.term_widths.get(name, 1))
+            if direction != 'output':
+                input_ports.add(name)
+
+        self._index = {
+            'top': tops[0],
+            'parent': parent,
+            'children': children,
+            'scope_terms': scope_terms,
+            'ports': ports,
+            'input_ports': input_ports
+        }
+        self._grouped = False
+        self._modules.clear()
+        return self._index
+
+    def _build_index(self) -> Dict:
+        """实例层次加上模板分组（登记新的Bind后重新分组）"""
+        index = self._structure()
+        if self._grouped:
+            return index
+
+        # 同一模块端口位宽与Bind内容都相同的实例共用模板，参数化后位宽或内容不同的实例各自成组
+        key: Dict[str, str] = {}
+        representative: Dict[str, str] = {}
+        signatures: Dict[str, List[Tuple]] = {}
+        for path in sorted(self.instances):
+            module = self.instances[path]
+            ports = tuple(sorted((port.name, port.direction, port.bit_width)
+                                 for port in index['ports'][path].values()))
+            signature = (ports, self._body_hashes.get(path, (0, 0)))
+            variants = signatures.setdefault(module, [])
+            if signature not in variants:
+                variants.append(signature)
+            number = variants.index(signature)
+            key[path] = module if number == 0 else f"{module}#{number}"
+            representative.setdefault(key[path], path)
+
+        index.update(key=key, representative=representative, is_representative=set(representative.values()))
+        self._grouped = True
+        self._modules.clear()
+        return index
+
+    # ------------------------------------------------------------------
+    # 模块模板
+    # ------------------------------------------------------------------
+
+    def module_dfg(self, key: str) -> ModuleDFG:
+        """构建（或取已缓存的）模块DFG模板"""
+        if key in self._modules:
+            return self._modules[key]
+
+        start_time = time.time()
+        index = self._build_index()
+        path = index['representative'][key]
+        is_top = index['parent'][path] is None
+        children = index['children'][path]
+        parser = DFGParser(expand_operators=self.expand_operators)
+
+        # 本实例的信号；输入端口由上层的连接赋值驱动，在模板内不作为节点
+        for name in index['scope_terms'][path]:
+            types, msb, lsb = self.terms[name]
+            if not is_top and name in index['input_ports']:
+                types = {name for name in types if name not in ('Reg', 'Wire')}
+            parser.add_term(name, types, msb, lsb)
+        # 子实例端口只提供位宽
+        for child in children:
+            for name in index['scope_terms'][child]:
+                types, msb, lsb = self.terms[name]
+                direction_types = {name for name in types if name in PORT_TYPES}
+                if direction_types:
+                    parser.add_term(name, direction_types, msb, lsb)
+
+        # 本实例内部的赋值与子实例输入端口的连接
+        dests = [name for name in self._scope_binds.get(path, [])
+                 if is_top or name not in index['input_ports']]
+        dests += [name for child in children for name in self._scope_binds.get(child, [])
+                  if name in index['input_ports']]
+        for name in dests:
+            tree = self.binds[name]
+            if isinstance(tree, str):
+                parser.add_bind_text(name, tree)
+            else:
+                parser.add_bind(name, tree)
+
+        graph = parser.build()
+        num_nodes = len(graph)
+        instances = {}
+        for child in children:
+            instances[child] = index['key'][child]
+            template = self.module_dfg(index['key'][child])
+            self._add_supernode(graph, child, template)
+            # 输出端口边界节点已计入子模块的节点数
+            num_nodes += template.num_nodes
+
+        # 补齐引用子实例输出端口的边
+        for node, data in list(graph.nodes(data=True)):
+            for source in data['inputs']:
+                if source in graph and source != node:
+                    graph.add_edge(source, node)
+
+        module = ModuleDFG(
+            key=key,
+            module=self.instances[path],
+            representative=path,
+            graph=graph,
+            ports=index['ports'][path],
+            instances=instances,
+            num_nodes=num_nodes,
+            is_linear=all(data['is_linear'] for _, data in graph.nodes(data=True)),
+            build_seconds=time.time() - start_time
+        )
+        self._modules[key] = module
+        return module
+
+    def _add_supernode(self, graph: nx.DiGraph, path: str, template: ModuleDFG):
+        """在上层图中加入子实例的超节点及其输出端口边界节点"""
+        outputs = []
+        for port in sorted(template.ports.values(), key=lambda port: port.name):
+            source = f"{template.representative}.{port.name}"
+            if port.direction == 'input' or source not in template.graph:
+                continue
+            name = f"{path}.{port.name}"
+            graph.add_node(name, **self._renamed(template.graph.nodes[source], template.representative, path))
+            outputs.append(name)
+
+        inputs = [f"{path}.{port.name}" for port in sorted(template.ports.values(), key=lambda port: port.name)
+                  if port.direction != 'output' and f"{path}.{port.name}" in graph]
+        graph.add_node(
+            path,
+            name=path,
+            operator_type=OperatorType.INSTANCE,
+            is_linear=template.is_linear,
+            inputs=inputs,
+            outputs=outputs,
+            # 超节点的出边取输出端口的最大位宽
+            bit_width=max((graph.nodes[name]['bit_width'] or 1 for name in outputs), default=1),
+            value=template.module
+        )
+        for name in inputs:
+            graph.add_edge(name, path)
+        for name in outputs:
+            graph.add_edge(path, name)
+
+    @staticmethod
+    def _renamed(data: Dict, old: str, new: str) -> Dict:
+        renamed = dict(data)
+        renamed['name'] = _rename(data['name'], old, new)
+        renamed['inputs'] = [_rename(name, old, new) for name in data['inputs']]
+        renamed['outputs'] = [_rename(name, old, new) for name in data['outputs']]
+        return renamed
+
+    # ------------------------------------------------------------------
+    # 层次图与惰性展开
+    # ------------------------------------------------------------------
+
+    def build(self, flatten: Optional[List[str]] = None) -> nx.DiGraph:
+        """构建顶层图，flatten中的模式（实例路径或模块名，支持通配符，'*'为全部）对应的实例被展开"""
+        start_time = time.time()
+        top = self.top
+        graph = self.module_dfg(self.module_key(top)).graph.copy()
+
+        patterns = list(flatten or [])
+        pending = [node for node in graph if self._matches(graph, node, patterns)]
+        while pending:
+            pending.extend(node for node in self.flatten(graph, pending.pop())
+                           if self._matches(graph, node, patterns))
+
+        self._index_graph(graph)
+        self.parse_stats = {
+            'instances': len(self.instances),
+            'modules': len(self._modules),
+            'supernodes': len(graph.graph['instances']),
+            'flat_nodes': self.module_dfg(self.module_key(top)).num_nodes,
+            'build_seconds': time.time() - start_time
+        }
+        return graph
+
+    @staticmethod
+    def _matches(graph: nx.DiGraph, node: str, patterns: List[str]) -> bool:
+        data = graph.nodes[node]
+        if data['operator_type'] != OperatorType.INSTANCE:
+            return False
+        return any(fnmatch.fnmatchcase(node, pattern) or fnmatch.fnmatchcase(data['value'], pattern)
+                   for pattern in patterns)
+
+    def flatten(self, graph: nx.DiGraph, path: str) -> List[str]:
+        """将图中的实例超节点原地展开为其模块DFG，返回新出现的子实例超节点"""
+        if path not in graph or graph.nodes[path]['operator_type'] != OperatorType.INSTANCE:
+            raise ValueError(f"图中没有实例超节点: {path}")
+        template = self.module_dfg(self.module_key(path))
+        old = template.representative
+
+        graph.remove_node(path)
+        added = []
+        for name, data in template.graph.nodes(data=True):
+            new_name = _rename(name, old, path)
+            # 输出端口边界节点已在图中，保留其出边
+            graph.add_node(new_name, **self._renamed(data, old, path))
+            added.append(new_name)
+        for source, target in template.graph.edges():
+            graph.add_edge(_rename(source, old, path), _rename(target, old, path))
+        # 模块内部由上层输入端口驱动的节点
+        for name in added:
+            for source in graph.nodes[name]['inputs']:
+                if source in graph and source != name:
+                    graph.add_edge(source, name)
+
+        index_graph(graph)
+        return [name for name in added if graph.nodes[name]['operator_type'] == OperatorType.INSTANCE]
+
+    def _index_graph(self, graph: nx.DiGraph):
+        """与DFGParser相同的稠密节点编号、位宽数组，以及超节点的实例信息"""
+        index_graph(graph)
+        instances = {}
+        for name, data in graph.nodes(data=True):
+            if data['operator_type'] != OperatorType.INSTANCE:
+                continue
+            template = self.module_dfg(self.module_key(name))
+            instances[name] = {
+                'module': template.module,
+                'key': template.key,
+                'num_nodes': template.num_nodes,
+                'ports': {port.name: {'direction': port.direction, 'bit_width': port.bit_width}
+                          for port in template.ports.values()}
+            }
+        graph.graph['instances'] = instances
+
+
+def main():
+    """测试函数"""
+    hierarchy = HierarchicalDFG()
+    graph = hierarchy.parse_dfg_file('dfg_files/4004.txt')
+
+    print("层次化DFG解析结果:")
+    for key, value in hierarchy.parse_stats.items():
+        print(f"  {key}: {value}")
+    for key, module in sorted(hierarchy.modules.items()):
+        print(f"  模块 {key}: 模板实例 {module.representative}, 展开后 {module.num_nodes} 个节点, "
+              f"{len(module.instances)} 个子实例")
+    print(f"  顶层图: {len(graph.nodes)} 个节点, {len(graph.edges)} 条边")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,8 @@ from typing import Dict, List, Tuple, Set, Optional
 from dataclasses import dataclass
 import networkx as nx
 
+from cost_function import PartitionDomains
+
 
 @dataclass
 class InterfaceSignal:
@@ -17,6 +19,8 @@ class InterfaceSignal:
     bit_width: int
     signal_type: str  # 'wire', 'reg'
     description: str = ""
+    source_domain: Optional[int] = None
+    target_domain: Optional[int] = None
 
 
 @dataclass
@@ -31,9 +35,12 @@ class InterfaceModule:
 class InterfaceGenerator:
     """接口生成器"""
     
-    def __init__(self):
+    def __init__(self, use_nets: bool = False, domains: PartitionDomains = None):
         self.interface_signals: List[InterfaceSignal] = []
         self.cross_partition_edges: List[Tuple[str, str]] = []
+        # 按线网生成接口：每个驱动向每个其他域只输出一个信号
+        self.use_nets = use_nets
+        self.domains = domains or PartitionDomains()
         
     def analyze_partition_interface(self, graph: nx.DiGraph, partition: Dict[str, int]) -> Dict[str, any]:
         """分析分区接口需求"""
@@ -42,11 +49,14 @@ class InterfaceGenerator:
         onn_nodes = set()
         electronic_nodes = set()
         
+        domain_nodes = {domain: [] for domain in range(self.domains.num_domains)}
         for node in partition:
-            if partition[node] == 1:
+            if self.domains.is_onn(partition[node]):
                 onn_nodes.add(node)
             else:
                 electronic_nodes.add(node)
+            if partition[node] in domain_nodes:
+                domain_nodes[partition[node]].append(node)
         
         # 分析跨分区连接
         for edge in graph.edges():
@@ -60,13 +70,17 @@ class InterfaceGenerator:
             'cross_partition_edges': cross_edges,
             'onn_nodes': list(onn_nodes),
             'electronic_nodes': list(electronic_nodes),
+            'domain_nodes': domain_nodes,
             'interface_signals': [],
             'data_dependencies': {},
             'timing_constraints': {}
         }
         
         # 生成接口信号
-        self._generate_interface_signals(graph, partition, cross_edges, interface_analysis)
+        if self.use_nets:
+            self._generate_net_interface_signals(graph, partition, cross_edges, interface_analysis)
+        else:
+            self._generate_interface_signals(graph, partition, cross_edges, interface_analysis)
         
         return interface_analysis
     
@@ -77,15 +91,10 @@ class InterfaceGenerator:
         signal_counter = {}
         
         for src, dst in cross_edges:
-            # 确定信号方向
-            if partition[src] == 0 and partition[dst] == 1:  # 电子 -> ONN
-                direction = 'output'
-                source_partition = 'electronic'
-                target_partition = 'onn'
-            else:  # ONN -> 电子
-                direction = 'input'
-                source_partition = 'onn'
-                target_partition = 'electronic'
+            # 确定信号方向：电子域驱动为输出，ONN域驱动为输入
+            direction = 'output' if self.domains.is_electronic(partition[src]) else 'input'
+            source_partition = self._domain_label(partition[src])
+            target_partition = self._domain_label(partition[dst])
             
             # 生成信号名称
             signal_name = self._generate_signal_name(src, dst, direction, signal_counter)
@@ -99,7 +108,9 @@ class InterfaceGenerator:
                 direction=direction,
                 bit_width=bit_width,
                 signal_type='wire',
-                description=f"从 {src} 到 {dst} 的{source_partition}到{target_partition}接口信号"
+                description=f"从 {src} 到 {dst} 的{source_partition}到{target_partition}接口信号",
+                source_domain=partition[src],
+                target_domain=partition[dst]
             )
             
             interface_signals.append(signal)
@@ -112,6 +123,53 @@ class InterfaceGenerator:
         
         analysis['interface_signals'] = interface_signals
     
+    def _generate_net_interface_signals(self, graph: nx.DiGraph, partition: Dict[str, int],
+                                      cross_edges: List[Tuple[str, str]], analysis: Dict[str, any]):
+        """按线网生成接口信号：同一驱动的所有跨分区负载共用一个信号"""
+        cross_nets: Dict[str, List[str]] = {}
+        domain_sinks: Dict[Tuple[str, int], List[str]] = {}
+        for src, dst in cross_edges:
+            cross_nets.setdefault(src, []).append(dst)
+            domain_sinks.setdefault((src, partition[dst]), []).append(dst)
+        
+        interface_signals = []
+        for (src, target), sinks in domain_sinks.items():
+            source = partition[src]
+            src_clean = re.sub(r'[^a-zA-Z0-9_]', '_', src)
+            if self.domains.num_domains > 2:
+                direction = 'output' if self.domains.is_electronic(source) else 'input'
+                name = f"{src_clean}_to_{self._domain_label(target)}"
+                description = (f"{src} 到 {len(sinks)} 个{self._domain_label(target)}负载的"
+                               f"{self._domain_label(source)}到{self._domain_label(target)}接口信号")
+            elif self.domains.is_electronic(source):  # 电子 -> ONN
+                direction = 'output'
+                name = f"{src_clean}_to_onn"
+                description = f"{src} 到 {len(sinks)} 个ONN负载的电子到ONN接口信号"
+            else:  # ONN -> 电子
+                direction = 'input'
+                name = f"{src_clean}_from_onn"
+                description = f"{src} 到 {len(sinks)} 个电子负载的ONN到电子接口信号"
+            
+            bit_width = max(self._estimate_bit_width(graph, src, dst) for dst in sinks)
+            
+            interface_signals.append(InterfaceSignal(
+                name=name,
+                direction=direction,
+                bit_width=bit_width,
+                signal_type='wire',
+                description=description,
+                source_domain=source,
+                target_domain=target
+            ))
+        
+        analysis['cross_partition_nets'] = cross_nets
+        analysis['interface_signals'] = interface_signals
+    
+    def _domain_label(self, domain: int) -> str:
+        """域名称：两路分区时为类型名，多域时附加域编号"""
+        kind = self.domains.kinds[domain] if 0 <= domain < self.domains.num_domains else 'unknown'
+        return kind if self.domains.num_domains == 2 else f"{kind}{domain}"
+    
     def _generate_signal_name(self, src: str, dst: str, direction: str, counter: Dict[str, int]) -> str:
         """生成信号名称"""
         # 清理节点名称
@@ -136,8 +194,8 @@ class InterfaceGenerator:
         dst_node = graph.nodes[dst]
         
         # 尝试获取位宽信息
-        src_width = getattr(src_node, 'bit_width', None)
-        dst_width = getattr(dst_node, 'bit_width', None)
+        src_width = src_node.get('bit_width')
+        dst_width = dst_node.get('bit_width')
         
         if src_width is not None:
             return src_width
@@ -325,6 +383,49 @@ class InterfaceGenerator:
         
         return "\n".join(verilog_code)
     
+    def generate_domain_interface(self, analysis: Dict[str, any], domain: int) -> str:
+        """生成单个域（ONN核或电子岛）的接口代码"""
+        verilog_code = []
+        label = self._domain_label(domain)
+        
+        verilog_code.append(f"// 域 {domain} ({label}) 接口定义")
+        verilog_code.append("")
+        
+        # 流入本域的信号为输入，本域驱动的信号为输出
+        domain_inputs = [s for s in analysis['interface_signals'] if s.target_domain == domain]
+        domain_outputs = [s for s in analysis['interface_signals'] if s.source_domain == domain]
+        
+        verilog_code.append(f"module {label}_interface (")
+        
+        if not domain_inputs and not domain_outputs:
+            verilog_code.append("    // 占位端口（无跨域信号时生成）")
+            verilog_code.append("    input wire clk,")
+            verilog_code.append("    input wire rst_n")
+        else:
+            if domain_inputs:
+                verilog_code.append("    // 输入端口")
+                for i, signal in enumerate(domain_inputs):
+                    comma = "," if i < len(domain_inputs) - 1 or domain_outputs else ""
+                    verilog_code.append(f"    input wire [{signal.bit_width-1}:0] {signal.name}{comma}")
+            
+            if domain_outputs:
+                verilog_code.append("    // 输出端口")
+                for i, signal in enumerate(domain_outputs):
+                    comma = "," if i < len(domain_outputs) - 1 else ""
+                    verilog_code.append(f"    output wire [{signal.bit_width-1}:0] {signal.name}{comma}")
+        
+        verilog_code.append(");")
+        verilog_code.append("")
+        
+        verilog_code.append(f"    // {label} 实现占位符")
+        for signal in domain_outputs:
+            verilog_code.append(f"    assign {signal.name} = {signal.name}_{label}_result;")
+        verilog_code.append("")
+        
+        verilog_code.append("endmodule")
+        
+        return "\n".join(verilog_code)
+    
     def generate_testbench(self, analysis: Dict[str, any]) -> str:
         """生成测试台代码"""
         verilog_code = []
@@ -15,9 +15,23 @@ import networkx as nx
 
 # 导入自定义模块
 from dfg_parser import DFGParser
-from cost_function import CostFunction, CostWeights
-from simulated_annealing import SimulatedAnnealing, AnnealingConfig
+from cost_function import CostFunction, CostWeights, PartitionDomains, PartitionCost, OBJECTIVE_NAMES
+from simulated_annealing import SimulatedAnnealing, AnnealingConfig, PopulationAnnealing, PopulationAnnealingConfig
 from neural_architecture_search import NeuralArchitectureSearch, NASConfig
+from estimation_of_distribution import EstimationOfDistribution, EDAConfig
+from milp_partitioner import MILPPartitioner, MILPConfig
+from min_cut_partitioner import MinCutPartitioner, MinCutConfig
+from graph_reduction import GraphReducer, ReductionConfig
+from pattern_cache import PatternCache
+from graph_cache import GraphCache
+from hierarchy import HierarchicalDFG
+from verilog_frontend import VerilogFrontend, FrontendConfig
+from batch_frontend import load_manifest
+from watch import DesignWatcher, WatchConfig
+from net_model import NetModel
+from term_log import TermLog
+from constraints import ConstraintChecker, ResourceBudgets
+from weight_calibration import WeightCalibrator, CalibrationConfig, CalibrationResult, load_reference_samples
 from interface_generator import InterfaceGenerator
 
 
@@ -26,13 +40,21 @@ class VerilogPartitioner:
     
     def __init__(self, config_file: str = None):
         self.config = self._load_config(config_file)
-        self.dfg_parser = DFGParser()
+        self.dfg_parser = DFGParser(
+            expand_operators=self.config.get('dfg_parser', {}).get('expand_operators', False)
+        )
+        graph_cache_settings = self.config.get('graph_cache', {})
+        self.graph_cache = (GraphCache(graph_cache_settings.get('directory', '.cache/dfg_graphs'))
+                            if graph_cache_settings.get('enabled', False) else None)
         self.cost_function = CostFunction()
         self.interface_generator = InterfaceGenerator()
         
         # 结果存储
         self.graph = None
+        self.search_graph = None
+        self.reduction = None
         self.best_partition = None
+        self.best_cost = None
         self.optimization_results = {}
         
     def _load_config(self, config_file: str) -> Dict:
@@ -40,6 +62,41 @@ class VerilogPartitioner:
         default_config = {
             'dfg_file': 'dfg_files/alu_dfg.txt',
             'output_dir': 'output_alu',
+            'dfg_parser': {
+                'expand_operators': False
+            },
+            'hierarchy': {
+                'enabled': False,
+                'flatten': []
+            },
+            'graph_cache': {
+                'enabled': False,
+                'directory': '.cache/dfg_graphs'
+            },
+            'watch': {
+                'poll_interval': 1.0,
+                'debounce': 0.5,
+                'neighborhood_hops': 2,
+                'max_affected_ratio': 0.5,
+                'iterations_per_node': 20,
+                'annealing': {
+                    'initial_temperature': 0.05,
+                    'final_temperature': 0.0001,
+                    'cooling_rate': 0.9,
+                    'iterations_per_temp': 20,
+                    'max_iterations': 2000
+                },
+                'visualize': False
+            },
+            'verilog_frontend': {
+                'enabled': False,
+                'verilog_files': [],
+                'topmodule': None,
+                'include_paths': [],
+                'defines': [],
+                'dfg_text_file': None,
+                'cache_dir': '.cache/pyverilog'
+            },
             'optimization': {
                 'simulated_annealing': {
                     'enabled': True,
@@ -55,8 +112,75 @@ class VerilogPartitioner:
                     'generations': 100,
                     'mutation_rate': 0.1,
                     'crossover_rate': 0.8
+                },
+                'population_annealing': {
+                    'enabled': False,
+                    'initial_temperature': 1000.0,
+                    'final_temperature': 0.1,
+                    'cooling_rate': 0.95,
+                    'iterations_per_temp': 10,
+                    'max_iterations': 5000,
+                    'num_replicas': 16,
+                    'num_workers': 1
+                },
+                'estimation_of_distribution': {
+                    'enabled': False,
+                    'batch_size': 200,
+                    'elite_fraction': 0.1,
+                    'learning_rate': 0.7,
+                    'max_batches': 100
+                },
+                'min_cut': {
+                    'enabled': False,
+                    'seed_annealing': True,
+                    'onn_seeds': None,
+                    'pin_nonlinear': True
+                },
+                'milp': {
+                    'enabled': False,
+                    'time_limit': 60.0,
+                    'mip_rel_gap': 1e-4,
+                    'max_nodes': 2000,
+                    'fallback_to_annealing': True
                 }
             },
+            'graph_reduction': {
+                'enabled': True,
+                'contract_renames': True,
+                'contract_wires': True,
+                'contract_linear_chains': True,
+                'prune_isolated_constants': True
+            },
+            'partition_domains': {
+                'kinds': ['electronic', 'onn'],
+                'capacities': None
+            },
+            'net_model': {
+                'enabled': False
+            },
+            'constraints': {
+                'enabled': True
+            },
+            'cost_terms': {},
+            'weight_calibration': {
+                'enabled': False,
+                'reference_file': 'calibration/reference_partitions.json',
+                'target': 'score',
+                'method': 'least_squares'
+            },
+            'term_log': {
+                'enabled': False,
+                'directory': '.cache/term_log',
+                'top_k': 10,
+                'warm_start': True
+            },
+            'pattern_cache': {
+                'enabled': False,
+                'cache_file': '.cache/pattern_cache.json',
+                'depth': 2,
+                'min_size': 3,
+                'super_moves': True
+            },
             'cost_weights': {
                 'area_weight': 0.3,
                 'delay_weight': 0.25,
@@ -89,6 +213,8 @@ class VerilogPartitioner:
         """解析DFG文件，可通过参数指定拆分目标文件"""
         # 优先级：参数 > config > 默认
         import os
+        if dfg_file is None and self.config.get('verilog_frontend', {}).get('enabled', False):
+            return self.parse_verilog()
         if dfg_file is None:
             dfg_file = self.config.get('dfg_file')
         print('当前工作目录:', os.getcwd())
@@ -99,65 +225,280 @@ class VerilogPartitioner:
             raise FileNotFoundError(f"DFG文件不存在: {dfg_file}")
         print(f"正在解析DFG文件: {dfg_file}")
         try:
-            self.graph = self.dfg_parser.parse_dfg_file(dfg_file)
+            if self.config.get('hierarchy', {}).get('enabled', False):
+                hierarchy = HierarchicalDFG(expand_operators=self.dfg_parser.expand_operators)
+                self.graph = self.dfg_parser.load_graph(
+                    hierarchy.parse_dfg_file(dfg_file, self.config['hierarchy'].get('flatten')))
+                self.dfg_parser.parse_stats = dict(hierarchy.parse_stats)
+            elif self.graph_cache is not None:
+                self.graph = self.graph_cache.parse(self.dfg_parser, dfg_file)
+            else:
+                self.graph = self.dfg_parser.parse_dfg_file(dfg_file)
             if self.graph is None or len(self.graph) == 0:
                 print(f"❌ 解析DFG后得到的图为空，请检查DFG文件内容: {dfg_file}")
                 raise ValueError("DFG解析后为空")
-            # 分析线性程度
-            linearity = self.dfg_parser.get_linearity_analysis()
-            stats = self.dfg_parser.get_node_statistics()
-            print("\nDFG解析结果:")
-            print(f"  总节点数: {linearity['total_nodes']}")
-            print(f"  线性节点数: {linearity['linear_nodes']}")
-            print(f"  非线性节点数: {linearity['nonlinear_nodes']}")
-            print(f"  线性程度: {linearity['linearity_ratio']:.2%}")
-            print("\n节点类型统计:")
-            for op_type, count in stats.items():
-                print(f"  {op_type}: {count}")
+            self._report_dfg()
+            self._reduce_graph()
             return self.graph
         except Exception as e:
             print(f"DFG解析失败: {e}")
             raise
     
-    def optimize_partition(self) -> Dict[str, any]:
-        """执行分区优化"""
+    def parse_verilog(self, verilog_files: List[str] = None, topmodule: str = None) -> nx.DiGraph:
+        """由Verilog源文件在进程内构建DFG（不经过文本DFG）"""
+        settings = self.config.get('verilog_frontend', {})
+        verilog_files = verilog_files or settings.get('verilog_files') or []
+        topmodule = topmodule or settings.get('topmodule')
+        if not verilog_files or not topmodule:
+            raise ValueError("Verilog前端需要指定 verilog_files 和 topmodule")
+        
+        print(f"正在分析Verilog: {', '.join(verilog_files)} (顶层模块: {topmodule})")
+        frontend = VerilogFrontend(FrontendConfig(
+            include_paths=settings.get('include_paths', []),
+            defines=settings.get('defines', []),
+            dfg_text_file=settings.get('dfg_text_file'),
+            cache_dir=settings.get('cache_dir', '.cache/pyverilog')
+        ))
+        try:
+            hierarchy_settings = self.config.get('hierarchy', {})
+            if hierarchy_settings.get('enabled', False):
+                result = frontend.analyze(verilog_files, topmodule)
+                if frontend.config.dfg_text_file:
+                    frontend.write_dfg_text(result, frontend.config.dfg_text_file)
+                hierarchy = HierarchicalDFG(expand_operators=self.dfg_parser.expand_operators)
+                self.graph = self.dfg_parser.load_graph(
+                    frontend.build_hierarchy(result, hierarchy, hierarchy_settings.get('flatten')))
+                self.dfg_parser.parse_stats = dict(hierarchy.parse_stats)
+            else:
+                self.graph = frontend.run(verilog_files, topmodule, self.dfg_parser)
+            if self.graph is None or len(self.graph) == 0:
+                raise ValueError("Verilog分析后DFG为空")
+            if frontend.config.dfg_text_file:
+                print(f"  文本DFG: {frontend.config.dfg_text_file}")
+            self._report_dfg()
+            self._reduce_graph()
+            return self.graph
+        except Exception as e:
+            print(f"Verilog分析失败: {e}")
+            raise
+    
+    def _report_dfg(self):
+        """打印DFG解析结果"""
+        # 分析线性程度
+        linearity = self.dfg_parser.get_linearity_analysis()
+        stats = self.dfg_parser.get_node_statistics()
+        print("\nDFG解析结果:")
+        print(f"  总节点数: {linearity['total_nodes']}")
+        print(f"  线性节点数: {linearity['linear_nodes']}")
+        print(f"  非线性节点数: {linearity['nonlinear_nodes']}")
+        print(f"  线性程度: {linearity['linearity_ratio']:.2%}")
+        parse_stats = self.dfg_parser.parse_stats
+        if 'instances' in parse_stats:
+            print(f"  层次: {parse_stats['instances']} 个实例, {parse_stats['modules']} 个唯一模块, "
+                  f"{parse_stats['supernodes']} 个实例超节点, 展开后 {parse_stats['flat_nodes']} 个节点, "
+                  f"跳过 {parse_stats['skipped_binds']} 个重复实例的Bind")
+        if parse_stats.get('cache_hit'):
+            print(f"  解析: 命中图缓存 {parse_stats['cache_key'][:12]}, {parse_stats['seconds']:.3f}秒")
+        elif 'analysis_seconds' in parse_stats:
+            print(f"  分析: {parse_stats['analysis_seconds']:.3f}秒, 构建: {parse_stats['build_seconds']:.3f}秒 "
+                  f"({parse_stats['terms']} 个Term, {parse_stats['binds']} 个Bind)")
+        elif parse_stats:
+            print(f"  解析: {parse_stats['lines']} 行, {parse_stats['seconds']:.3f}秒, "
+                  f"{parse_stats['mb_per_s']:.1f} MB/s")
+        print("\n节点类型统计:")
+        for op_type, count in stats.items():
+            print(f"  {op_type}: {count}")
+    
+    def _reduce_graph(self):
+        """化简DFG，得到优化器使用的搜索图"""
+        self.reduction = None
+        self.search_graph = self.graph
+        
+        reduction_settings = self.config.get('graph_reduction', {})
+        if not reduction_settings.get('enabled', False):
+            return
+        
+        reduction_params = {k: v for k, v in reduction_settings.items() if k != 'enabled'}
+        reducer = GraphReducer(ReductionConfig(**reduction_params))
+        self.reduction = reducer.reduce(self.graph)
+        self.search_graph = self.reduction.graph
+        
+        stats = reducer.analyze_reduction(self.reduction)
+        print("\n图化简结果:")
+        print(f"  化简前节点数: {stats['original_nodes']}")
+        print(f"  化简后节点数: {stats['reduced_nodes']}")
+        print(f"  超节点数: {stats['supernodes']}")
+        print(f"  剪除节点数: {stats['pruned_nodes']}")
+        print(f"  化简比例: {stats['reduction_ratio']:.2f}x")
+    
+    def optimize_partition(self, initial_partition: Optional[Dict[str, int]] = None,
+                           movable_nodes: Optional[List[str]] = None) -> Dict[str, any]:
+        """执行分区优化；initial_partition/movable_nodes（搜索图上）用于增量重新分区的热启动与局部搜索"""
         if not self.graph:
             raise ValueError("请先解析DFG文件")
         
         print("\n开始执行分区优化...")
         
+        # 优化器在化简后的图上搜索，成本在原图上计算（化简图上的分区先展开）
+        search_graph = self.search_graph if self.search_graph is not None else self.graph
+        
         # 更新成本函数权重
         weights = CostWeights(**self.config['cost_weights'])
         self.cost_function.weights = weights
         
-        # 定义成本函数包装器
-        def cost_wrapper(graph, partition):
-            # 确定ONN和电子输出
-            onn_outputs = [node for node, part in partition.items() if part == 1]
-            electronic_outputs = [node for node, part in partition.items() if part == 0]
+        # 分区域（多个ONN核/电子岛）
+        domains = self._partition_domains()
+        self.cost_function.domains = domains
+        num_domains = domains.num_domains
+        if num_domains > 2:
+            print(f"\n多域分区: {num_domains} 个域 {domains.kinds}")
+        
+        # 线网模型：割与接口按每个驱动一次转换计算
+        if self.config.get('net_model', {}).get('enabled', False):
+            net_model = NetModel(self.graph, self.cost_function)
+            self.cost_function.set_net_model(net_model)
+            print(f"\n线网模型: {len(net_model.nets)} 条线网")
+        else:
+            self.cost_function.set_net_model(None)
+        
+        # 扩展成本项：按名称启用已注册的成本项，配置中给出权重与参数
+        self.cost_function.extra_terms = []
+        for name, settings in self.config.get('cost_terms', {}).items():
+            settings = dict(settings)
+            if not settings.pop('enabled', True):
+                continue
+            self.cost_function.add_term(name, settings.pop('weight', 1.0), **settings)
+        if self.cost_function.extra_terms:
+            print(f"\n扩展成本项: {[term.name for term, _ in self.cost_function.extra_terms]}")
+        
+        # 权重标定：以历史流片的参考分区与实测指标拟合成本权重
+        calibration_settings = self.config.get('weight_calibration', {})
+        if calibration_settings.get('enabled', False):
+            calibration = self._calibrate_weights(calibration_settings)
+            if calibration is not None:
+                calibration.apply(self.cost_function)
+                weights = self.cost_function.weights
+        
+        # 资源预算硬约束：ONN面积/功耗与电子面积预算取自 onn_parameters / electronic_parameters
+        budgets = None
+        constraint_checker = None
+        if self.config.get('constraints', {}).get('enabled', False):
+            budgets = ResourceBudgets.from_config(self.config)
+            if not budgets.is_unlimited():
+                constraint_checker = ConstraintChecker(search_graph, self.cost_function, budgets, self.reduction)
+                print(f"\n资源预算约束: ONN面积 {budgets.onn_area} mm², ONN功耗 {budgets.onn_power} mW, "
+                      f"电子面积 {budgets.electronic_area} mm²")
+        
+        # 成本项日志：按当前权重对历史评估重新排序，并以最优分区热启动
+        term_log = None
+        warm_start_partition = None
+        log_settings = self.config.get('term_log', {})
+        if log_settings.get('enabled', False):
+            # 列与成本函数的全部成本项一致，重新排序使用与优化相同的目标
+            term_log = TermLog(list(self.graph.nodes()), log_settings.get('directory'),
+                               term_names=self.cost_function.term_names())
+            if len(term_log) > 0:
+                extra_weights = {term.name: weight for term, weight in self.cost_function.extra_terms}
+                ranked = term_log.rerank(weights, log_settings.get('top_k', 10), extra_weights)
+                print(f"\n成本项日志: {len(term_log)} 条记录，按当前权重重新排序")
+                for rank, (cost, _) in enumerate(ranked[:5], 1):
+                    print(f"  第{rank}名成本: {cost:.6f}")
+                if log_settings.get('warm_start', True):
+                    warm_start_partition = ranked[0][1]
+                    if self.reduction:
+                        warm_start_partition = self.reduction.reduce_partition(warm_start_partition)
+        self.cost_function.set_term_log(term_log)
+        
+        # 成本函数包装器（可序列化，种群退火可在工作进程中评估）
+        cost_wrapper = PartitionCost(self.cost_function, self.reduction)
+        
+        results = {}
+        
+        # 最小割分区（接口成本主导时的多项式时间解，可作为模拟退火初始解）
+        annealing_initial_partition = initial_partition or warm_start_partition
+        min_cut_settings = self.config['optimization'].get('min_cut', {})
+        if min_cut_settings.get('enabled', False) and self._binary_only('最小割分区', num_domains):
+            print("\n执行最小割分区...")
+            min_cut_params = {k: v for k, v in min_cut_settings.items() 
+                             if k not in ('enabled', 'seed_annealing')}
+            if self.reduction and min_cut_params.get('onn_seeds'):
+                # 种子节点映射到所在超节点
+                min_cut_params['onn_seeds'] = [self.reduction.representative.get(node, node)
+                                               for node in min_cut_params['onn_seeds']]
+            min_cut_partitioner = MinCutPartitioner(MinCutConfig(**min_cut_params), self.cost_function)
+            min_cut_result = min_cut_partitioner.optimize(search_graph)
             
-            metrics = self.cost_function.calculate_total_cost(
-                graph=graph,
-                partition=partition,
-                onn_outputs=onn_outputs,
-                electronic_outputs=electronic_outputs
+            results['min_cut'] = {
+                'result': min_cut_result,
+                'execution_time': min_cut_result.solve_time,
+                'analysis': min_cut_partitioner.analyze_result(min_cut_result),
+                'evaluated_cost': cost_wrapper(search_graph, min_cut_result.best_partition)
+            }
+            if min_cut_settings.get('seed_annealing', True):
+                annealing_initial_partition = min_cut_result.best_partition
+            
+            print(f"最小割完成，耗时: {min_cut_result.solve_time:.4f}秒")
+            print(f"割容量: {min_cut_result.cut_value}, 成本: {results['min_cut']['evaluated_cost']:.6f}")
+        
+        # 结构模式缓存：预分配匹配区域，并作为模拟退火的整体移动
+        pattern_cache = None
+        pattern_groups = []
+        cache_settings = self.config.get('pattern_cache', {})
+        if cache_settings.get('enabled', False):
+            pattern_cache = PatternCache(
+                cache_file=cache_settings.get('cache_file'),
+                depth=cache_settings.get('depth', 2),
+                min_size=cache_settings.get('min_size', 3)
             )
-            return metrics.total_cost
+            template_count = pattern_cache.load()
+            base_partition = annealing_initial_partition or {node: 0 for node in search_graph.nodes()}
+            assigned_partition, matches = pattern_cache.apply(search_graph, base_partition)
+            if matches:
+                annealing_initial_partition = assigned_partition
+                if cache_settings.get('super_moves', True):
+                    pattern_groups = [match.members for match in matches]
+            print(f"\n结构模式缓存: {template_count} 个模板，匹配 {len(matches)} 个区域")
         
-        results = {}
+        # 精确MILP求解（适用于中小规模DFG）
+        milp_fallback = False
+        milp_settings = self.config['optimization'].get('milp', {})
+        if milp_settings.get('enabled', False) and self._binary_only('MILP精确求解', num_domains):
+            print("\n执行MILP精确求解...")
+            milp_params = {k: v for k, v in milp_settings.items() 
+                          if k not in ('enabled', 'fallback_to_annealing')}
+            milp_partitioner = MILPPartitioner(MILPConfig(**milp_params), self.cost_function)
+            milp_result = milp_partitioner.optimize(search_graph, budgets=budgets, reduction=self.reduction)
+            
+            if milp_result.success:
+                results['milp'] = {
+                    'result': milp_result,
+                    'execution_time': milp_result.solve_time,
+                    'analysis': milp_partitioner.analyze_result(milp_result),
+                    'evaluated_cost': cost_wrapper(search_graph, milp_result.best_partition)
+                }
+                print(f"MILP完成，耗时: {milp_result.solve_time:.2f}秒")
+                print(f"模型成本: {milp_result.best_cost:.6f} (下界: {milp_result.lower_bound}, 间隙: {milp_result.mip_gap})")
+                print(f"实际成本: {results['milp']['evaluated_cost']:.6f}")
+            else:
+                print(f"MILP未得到可行解: {milp_result.message}")
+                milp_fallback = milp_settings.get('fallback_to_annealing', True)
         
-        # 模拟退火优化
-        if self.config['optimization']['simulated_annealing']['enabled']:
+        # 模拟退火优化（MILP失败时作为回退）
+        if self.config['optimization']['simulated_annealing']['enabled'] or milp_fallback:
             print("\n执行模拟退火优化...")
             # 过滤掉enabled参数，只保留AnnealingConfig支持的参数
             sa_params = {k: v for k, v in self.config['optimization']['simulated_annealing'].items() 
                         if k != 'enabled'}
+            sa_params.setdefault('num_domains', num_domains)
             sa_config = AnnealingConfig(**sa_params)
             sa = SimulatedAnnealing(sa_config)
             sa.set_random_seed(42)
+            sa.set_move_groups(pattern_groups)
+            sa.set_movable_nodes(movable_nodes)
+            sa.set_constraints(constraint_checker)
             
             start_time = time.time()
-            sa_result = sa.optimize(self.graph, cost_wrapper)
+            sa_result = sa.optimize(search_graph, cost_wrapper, initial_partition=annealing_initial_partition)
             sa_time = time.time() - start_time
             
             results['simulated_annealing'] = {
@@ -169,6 +510,34 @@ class VerilogPartitioner:
             print(f"模拟退火完成，耗时: {sa_time:.2f}秒")
             print(f"最佳成本: {sa_result.best_cost:.6f}")
             print(f"收敛原因: {sa_result.convergence_reason}")
+            if constraint_checker is not None:
+                print(f"超出预算被拒绝的移动: {constraint_checker.rejected_moves}/{constraint_checker.checked_moves}")
+        
+        # 种群退火优化
+        if self.config['optimization'].get('population_annealing', {}).get('enabled', False):
+            print("\n执行种群退火优化...")
+            pa_params = {k: v for k, v in self.config['optimization']['population_annealing'].items() 
+                        if k != 'enabled'}
+            pa_params.setdefault('num_domains', num_domains)
+            pa = PopulationAnnealing(PopulationAnnealingConfig(**pa_params))
+            pa.set_random_seed(42)
+            pa.set_move_groups(pattern_groups)
+            pa.set_movable_nodes(movable_nodes)
+            pa.set_constraints(constraint_checker)
+            
+            start_time = time.time()
+            pa_result = pa.optimize(search_graph, cost_wrapper, initial_partition=annealing_initial_partition)
+            pa_time = time.time() - start_time
+            
+            results['population_annealing'] = {
+                'result': pa_result,
+                'execution_time': pa_time,
+                'analysis': pa.analyze_result(pa_result)
+            }
+            
+            print(f"种群退火完成，耗时: {pa_time:.2f}秒")
+            print(f"最佳成本: {pa_result.best_cost:.6f}")
+            print(f"收敛原因: {pa_result.convergence_reason}")
         
         # 神经网络架构搜索
         if self.config['optimization']['neural_architecture_search']['enabled']:
@@ -176,14 +545,32 @@ class VerilogPartitioner:
             # 过滤掉enabled参数，只保留NASConfig支持的参数
             nas_params = {k: v for k, v in self.config['optimization']['neural_architecture_search'].items() 
                          if k != 'enabled'}
+            nas_params.setdefault('num_domains', num_domains)
             nas_config = NASConfig(**nas_params)
-            nas = NeuralArchitectureSearch(nas_config)
+            nas = NeuralArchitectureSearch(nas_config, domains)
             
             start_time = time.time()
-            nas.evolve(self.graph, cost_wrapper)
+            pareto_front = None
+            if nas_config.multi_objective:
+                # 多目标模式：一次运行得到帕累托前沿，再按当前权重选出代表解
+                def objective_wrapper(graph, partition):
+                    return cost_wrapper.metrics(graph, partition).objective_vector()
+                
+                archive = nas.evolve_multi_objective(search_graph, objective_wrapper)
+                pareto_front = []
+                best_arch, best_front_cost = None, float('inf')
+                for objectives, architecture in archive.entries():
+                    cost = cost_wrapper(search_graph, architecture.partition)
+                    pareto_front.append((objectives, architecture, cost))
+                    if cost < best_front_cost:
+                        best_arch, best_front_cost = architecture, cost
+                if best_arch:
+                    best_arch.fitness = 1.0 / (1.0 + best_front_cost)
+            else:
+                nas.evolve(search_graph, cost_wrapper)
+                best_arch = nas.get_best_architecture()
             nas_time = time.time() - start_time
             
-            best_arch = nas.get_best_architecture()
             if best_arch:
                 results['neural_architecture_search'] = {
                     'result': best_arch,
@@ -191,45 +578,141 @@ class VerilogPartitioner:
                     'analysis': nas.analyze_architecture(best_arch),
                     'history': nas.get_optimization_history()
                 }
+                if pareto_front is not None:
+                    results['neural_architecture_search']['pareto_front'] = pareto_front
+                    print(f"帕累托前沿解数: {len(pareto_front)}")
                 
                 print(f"NAS完成，耗时: {nas_time:.2f}秒")
                 print(f"最佳适应度: {best_arch.fitness:.6f}")
         
+        # 分布估计算法
+        if (self.config['optimization'].get('estimation_of_distribution', {}).get('enabled', False) and
+                self._binary_only('分布估计', num_domains)):
+            print("\n执行分布估计优化...")
+            eda_params = {k: v for k, v in self.config['optimization']['estimation_of_distribution'].items() 
+                         if k != 'enabled'}
+            eda = EstimationOfDistribution(EDAConfig(**eda_params))
+            eda.set_random_seed(42)
+            
+            start_time = time.time()
+            eda_result = eda.optimize(search_graph, cost_wrapper, initial_partition=warm_start_partition,
+                                      batch_cost_function=cost_wrapper.batch)
+            eda_time = time.time() - start_time
+            
+            results['estimation_of_distribution'] = {
+                'result': eda_result,
+                'execution_time': eda_time,
+                'analysis': eda.analyze_result(eda_result)
+            }
+            
+            print(f"分布估计完成，耗时: {eda_time:.2f}秒")
+            print(f"最佳成本: {eda_result.best_cost:.6f}")
+            print(f"收敛原因: {eda_result.convergence_reason}")
+        
         # 选择最佳结果
-        self._select_best_result(results)
+        self._select_best_result(results, constraint_checker)
+        
+        # 记录各模板区域的子分区，供后续设计复用
+        if pattern_cache is not None and self.best_partition:
+            # 模板区域按其诱导子图上的成本比较，不同规模的设计之间可比
+            updated = pattern_cache.record(search_graph, self.best_partition, PartitionCost(self.cost_function))
+            pattern_cache.save()
+            print(f"结构模式缓存更新 {updated} 个模板")
+        
+        if term_log is not None:
+            term_log.flush()
+            print(f"成本项日志: 共 {len(term_log)} 条记录")
+        
+        # 将化简图上的分区展开回原图
+        if self.reduction and self.best_partition:
+            self.best_partition = self.reduction.expand_partition(self.best_partition)
         self.optimization_results = results
         
         return results
     
-    def _select_best_result(self, results: Dict):
-        """选择最佳分区结果"""
+    def _calibrate_weights(self, settings: Dict) -> Optional[CalibrationResult]:
+        """读取参考样本并标定权重，样本不可用时返回None"""
+        reference_file = settings.get('reference_file')
+        if not reference_file or not os.path.exists(reference_file):
+            print(f"\n权重标定: 参考样本文件不存在 ({reference_file})，使用配置权重")
+            return None
+        
+        partitions, measured = load_reference_samples(reference_file, settings.get('target', 'score'))
+        if len(partitions) < 2:
+            print("\n权重标定: 有效参考样本不足，使用配置权重")
+            return None
+        
+        # 参考分区是原图上的分区，与优化时的成本一样在原图上标定
+        calibrator = WeightCalibrator(CalibrationConfig(method=settings.get('method', 'least_squares')),
+                                      self.cost_function)
+        result = calibrator.fit(self.graph, partitions, measured)
+        print(f"\n权重标定: {result.num_samples} 个参考分区，耗时 {result.fit_time:.3f}秒")
+        print(f"  标定权重: {result.weights}")
+        print(f"  秩相关: {result.rank_correlation:.4f}, 成对顺序准确率: {result.pairwise_accuracy:.4f}")
+        return result
+    
+    def _partition_domains(self) -> PartitionDomains:
+        """由配置构建分区域定义"""
+        return PartitionDomains(**self.config.get('partition_domains', {}))
+    
+    def _binary_only(self, method_name: str, num_domains: int) -> bool:
+        """仅支持两路分区的方法在多域时跳过"""
+        if num_domains == 2:
+            return True
+        print(f"\n{method_name}仅支持两路分区，多域时跳过")
+        return False
+    
+    def _select_best_result(self, results: Dict, constraint_checker: ConstraintChecker = None):
+        """选择最佳分区结果（设置资源约束时只在满足预算的结果中选择）"""
         best_cost = float('inf')
         best_partition = None
         best_method = None
+        fallback = None
         
         for method, result in results.items():
-            if method == 'simulated_annealing':
+            if method in ('simulated_annealing', 'population_annealing', 'estimation_of_distribution'):
                 cost = result['result'].best_cost
                 partition = result['result'].best_partition
+            elif method in ('milp', 'min_cut'):
+                cost = result['evaluated_cost']
+                partition = result['result'].best_partition
             elif method == 'neural_architecture_search':
                 cost = 1.0 / result['result'].fitness if result['result'].fitness > 0 else float('inf')
                 partition = result['result'].partition
             else:
                 continue
             
+            if constraint_checker is not None and not constraint_checker.is_feasible(partition):
+                print(f"\n{method} 结果超出资源预算，不参与选择")
+                if fallback is None or cost < fallback[0]:
+                    fallback = (cost, partition, method)
+                continue
+            
             if cost < best_cost:
                 best_cost = cost
                 best_partition = partition
                 best_method = method
         
+        if best_partition is None and fallback is not None:
+            best_cost, best_partition, best_method = fallback
+            print("\n警告: 没有满足资源预算的结果，使用超出预算的最佳结果")
+        
         if best_partition:
             self.best_partition = best_partition
+            self.best_cost = best_cost
             print(f"\n选择最佳结果 (方法: {best_method}):")
             print(f"  成本: {best_cost:.6f}")
-            onn_count = sum(1 for v in best_partition.values() if v == 1)
+            domains = self.cost_function.domains
+            onn_count = sum(1 for v in best_partition.values() if domains.is_onn(v))
             electronic_count = len(best_partition) - onn_count
             print(f"  ONN节点数: {onn_count}")
             print(f"  电子节点数: {electronic_count}")
+            if constraint_checker is not None:
+                print(f"  资源预算: {'满足' if constraint_checker.is_feasible(best_partition) else '超出'}")
+            if domains.num_domains > 2:
+                for domain, kind in enumerate(domains.kinds):
+                    count = sum(1 for v in best_partition.values() if v == domain)
+                    print(f"  域{domain} ({kind}) 节点数: {count}")
     
     def generate_interfaces(self) -> Dict[str, any]:
         """生成接口定义"""
@@ -239,6 +722,8 @@ class VerilogPartitioner:
         print("\n生成接口定义...")
         
         # 分析接口需求
+        self.interface_generator.use_nets = self.config.get('net_model', {}).get('enabled', False)
+        self.interface_generator.domains = self._partition_domains()
         interface_analysis = self.interface_generator.analyze_partition_interface(
             self.graph, self.best_partition
         )
@@ -252,6 +737,15 @@ class VerilogPartitioner:
             'analysis': interface_analysis
         }
         
+        # 多域时为每个ONN核/电子岛单独生成接口
+        domains = self.interface_generator.domains
+        if domains.num_domains > 2:
+            interfaces['domain_interfaces'] = {
+                self.interface_generator._domain_label(domain):
+                    self.interface_generator.generate_domain_interface(interface_analysis, domain)
+                for domain in range(domains.num_domains)
+            }
+        
         return interfaces
     
     def _convert_interface_analysis_to_serializable(self, analysis: Dict[str, any]) -> Dict[str, any]:
@@ -274,6 +768,11 @@ class VerilogPartitioner:
             elif key == 'cross_partition_edges':
                 # 转换边列表为字符串元组列表
                 serializable[key] = [(str(src), str(dst)) for src, dst in value]
+            elif key == 'cross_partition_nets':
+                # 转换线网为驱动到负载列表的映射
+                serializable[key] = {str(src): [str(dst) for dst in sinks] for src, sinks in value.items()}
+            elif key == 'domain_nodes':
+                serializable[key] = {str(domain): [str(node) for node in nodes] for domain, nodes in value.items()}
             elif key == 'onn_nodes':
                 # 转换节点列表为字符串列表
                 serializable[key] = [str(node) for node in value]
@@ -294,16 +793,22 @@ class VerilogPartitioner:
         print(f"\n保存结果到: {output_dir}")
         
         # 保存分区结果
+        domains = self._partition_domains()
         if self.best_partition:
             partition_file = os.path.join(output_dir, 'partition_result.json')
             partition_data = {
                 'partition': self.best_partition,
                 'statistics': {
                     'total_nodes': len(self.best_partition),
-                    'onn_nodes': sum(1 for v in self.best_partition.values() if v == 1),
-                    'electronic_nodes': sum(1 for v in self.best_partition.values() if v == 0)
+                    'onn_nodes': sum(1 for v in self.best_partition.values() if domains.is_onn(v)),
+                    'electronic_nodes': sum(1 for v in self.best_partition.values() if domains.is_electronic(v))
                 }
             }
+            if domains.num_domains > 2:
+                partition_data['statistics']['domain_nodes'] = {
+                    f"{domain}:{kind}": sum(1 for v in self.best_partition.values() if v == domain)
+                    for domain, kind in enumerate(domains.kinds)
+                }
             
             with open(partition_file, 'w', encoding='utf-8') as f:
                 json.dump(partition_data, f, indent=2, ensure_ascii=False)
@@ -315,7 +820,7 @@ class VerilogPartitioner:
             # 转换不可序列化的对象
             serializable_results = {}
             for method, result in self.optimization_results.items():
-                if method == 'simulated_annealing':
+                if method in ('simulated_annealing', 'population_annealing'):
                     serializable_results[method] = {
                         'best_cost': result['result'].best_cost,
                         'iteration_count': result['result'].iteration_count,
@@ -329,6 +834,42 @@ class VerilogPartitioner:
                         'execution_time': result['execution_time'],
                         'analysis': result['analysis']
                     }
+                    if 'pareto_front' in result:
+                        # 每个前沿解附带各目标取值和原图分区，可按任意权重离线挑选
+                        serializable_results[method]['pareto_front'] = [
+                            {
+                                'objectives': dict(zip(OBJECTIVE_NAMES, objectives.tolist())),
+                                'weighted_cost': cost,
+                                'partition': (self.reduction.expand_partition(architecture.partition)
+                                              if self.reduction else architecture.partition)
+                            }
+                            for objectives, architecture, cost in result['pareto_front']
+                        ]
+                elif method == 'milp':
+                    serializable_results[method] = {
+                        'model_cost': result['result'].best_cost,
+                        'evaluated_cost': result['evaluated_cost'],
+                        'lower_bound': result['result'].lower_bound,
+                        'mip_gap': result['result'].mip_gap,
+                        'is_optimal': result['result'].is_optimal,
+                        'execution_time': result['execution_time'],
+                        'analysis': result['analysis']
+                    }
+                elif method == 'min_cut':
+                    serializable_results[method] = {
+                        'cut_value': result['result'].cut_value,
+                        'evaluated_cost': result['evaluated_cost'],
+                        'execution_time': result['execution_time'],
+                        'analysis': result['analysis']
+                    }
+                elif method == 'estimation_of_distribution':
+                    serializable_results[method] = {
+                        'best_cost': result['result'].best_cost,
+                        'batch_count': result['result'].batch_count,
+                        'convergence_reason': result['result'].convergence_reason,
+                        'execution_time': result['execution_time'],
+                        'analysis': result['analysis']
+                    }
             
             with open(optimization_file, 'w', encoding='utf-8') as f:
                 json.dump(serializable_results, f, indent=2, ensure_ascii=False)
@@ -345,6 +886,8 @@ class VerilogPartitioner:
             'electronic_interface.v': interfaces['electronic_interface'],
             'testbench.v': interfaces['testbench']
         }
+        for label, content in interfaces.get('domain_interfaces', {}).items():
+            interface_files[f'{label}_interface.v'] = content
         
         for filename, content in interface_files.items():
             filepath = os.path.join(interface_dir, filename)
@@ -379,8 +922,9 @@ class VerilogPartitioner:
         plt.close()
         # 子图2：分区结果
         plt.figure(figsize=(7, 5))
-        onn_nodes = [node for node, part in self.best_partition.items() if part == 1]
-        electronic_nodes = [node for node, part in self.best_partition.items() if part == 0]
+        domains = self._partition_domains()
+        onn_nodes = [node for node, part in self.best_partition.items() if domains.is_onn(part)]
+        electronic_nodes = [node for node, part in self.best_partition.items() if domains.is_electronic(part)]
         partition_graph = self.graph.copy()
         nx.draw_networkx_nodes(partition_graph, pos, nodelist=onn_nodes, node_color='red', node_size=500, label='ONN节点')
         nx.draw_networkx_nodes(partition_graph, pos, nodelist=electronic_nodes, node_color='blue', node_size=500, label='电子节点')
@@ -396,9 +940,15 @@ class VerilogPartitioner:
         if 'simulated_annealing' in self.optimization_results:
             sa_history = self.optimization_results['simulated_annealing']['result'].cost_history
             plt.plot(sa_history, label='模拟退火', alpha=0.7)
+        if 'population_annealing' in self.optimization_results:
+            pa_history = self.optimization_results['population_annealing']['result'].cost_history
+            plt.plot(pa_history, label='种群退火', alpha=0.7)
         if 'neural_architecture_search' in self.optimization_results:
             nas_history = self.optimization_results['neural_architecture_search']['history']['fitness_history']
             plt.plot(nas_history, label='NAS', alpha=0.7)
+        if 'estimation_of_distribution' in self.optimization_results:
+            eda_history = self.optimization_results['estimation_of_distribution']['result'].cost_history
+            plt.plot(eda_history, label='分布估计', alpha=0.7)
         plt.xlabel('迭代次数')
         plt.ylabel('成本/适应度')
         plt.title('优化历史')
@@ -449,7 +999,8 @@ class VerilogPartitioner:
             
             # 打印总结
             if self.best_partition:
-                onn_count = sum(1 for v in self.best_partition.values() if v == 1)
+                domains = self._partition_domains()
+                onn_count = sum(1 for v in self.best_partition.values() if domains.is_onn(v))
                 electronic_count = len(self.best_partition) - onn_count
                 total_interface_signals = len(interfaces['analysis']['interface_signals'])
                 
@@ -469,25 +1020,58 @@ class VerilogPartitioner:
         return True
 
 
+def run_manifest(config_file: Optional[str], manifest_path: str, output_dir: Optional[str] = None) -> bool:
+    """依次拆分批量前端清单中分析成功的全部模块，每个模块输出到单独的子目录"""
+    modules = load_manifest(manifest_path)
+    print(f"清单 {manifest_path}: {len(modules)} 个可用模块")
+    
+    success = True
+    for module in modules:
+        print(f"\n{'=' * 20} 模块 {module.name} {'=' * 20}")
+        partitioner = VerilogPartitioner(config_file)
+        partitioner.config['dfg_file'] = module.outputs['text']
+        partitioner.config['verilog_frontend']['enabled'] = False
+        partitioner.config['output_dir'] = os.path.join(output_dir or partitioner.config['output_dir'], module.name)
+        success = partitioner.run_complete_flow() and success
+    return success
+
+
 def main():
     """主函数"""
     parser = argparse.ArgumentParser(description='Verilog线性和非线性拆分系统')
     parser.add_argument('--config', '-c', type=str, help='配置文件路径')
     parser.add_argument('--dfg', '-d', type=str, help='DFG文件路径')
+    parser.add_argument('--verilog', nargs='+', help='Verilog源文件（进程内分析，不经过文本DFG）')
+    parser.add_argument('--top', '-t', type=str, help='Verilog顶层模块')
+    parser.add_argument('--manifest', '-m', type=str, help='批量前端清单，依次拆分其中的全部模块')
     parser.add_argument('--output', '-o', type=str, help='输出目录')
     parser.add_argument('--visualize', '-v', action='store_true', help='生成可视化结果')
+    parser.add_argument('--watch', '-w', action='store_true', help='监视模式：源文件修改后增量重新分区')
     
     args = parser.parse_args()
     
+    if args.manifest:
+        sys.exit(0 if run_manifest(args.config, args.manifest, args.output) else 1)
+    
     # 创建分区器
     partitioner = VerilogPartitioner(args.config)
     
     # 更新配置
     if args.dfg:
         partitioner.config['dfg_file'] = args.dfg
+    if args.verilog:
+        partitioner.config['verilog_frontend'].update(enabled=True, verilog_files=args.verilog)
+        if args.top:
+            partitioner.config['verilog_frontend']['topmodule'] = args.top
     if args.output:
         partitioner.config['output_dir'] = args.output
     
+    if args.watch:
+        watch_settings = dict(partitioner.config.get('watch', {}))
+        watch_settings['visualize'] = watch_settings.get('visualize', False) or args.visualize
+        DesignWatcher(partitioner, WatchConfig(**watch_settings)).run()
+        sys.exit(0)
+    
     # 运行完整流程
     success = partitioner.run_complete_flow()
     
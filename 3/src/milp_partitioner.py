@@ -0,0 +1,329 @@
+"""
+精确MILP分区模块
+将成本函数中与分区相关的各项编码为混合整数线性规划，
+通过 scipy.optimize.milp（HiGHS 后端）求解，给出可证明的最优解或最优性间隙
+"""
+
+import time
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+from scipy.optimize import milp, LinearConstraint, Bounds
+from scipy.sparse import lil_matrix
+
+from constraints import ResourceBudgets
+from cost_function import CostFunction
+from graph_reduction import ReducedGraph
+
+
+@dataclass
+class MILPConfig:
+    """MILP求解配置参数"""
+    time_limit: float = 60.0
+    mip_rel_gap: float = 1e-4
+    max_nodes: int = 2000
+
+
+@dataclass
+class MILPResult:
+    """MILP求解结果"""
+    best_partition: Dict[str, int]
+    best_cost: float
+    lower_bound: Optional[float]
+    mip_gap: Optional[float]
+    is_optimal: bool
+    success: bool
+    status: int
+    message: str
+    solve_time: float
+
+
+class MILPPartitioner:
+    """基于 scipy.optimize.milp 的精确分区求解器
+
+    决策变量 x_v ∈ {0,1} 表示节点 v 分配到ONN，y_e ≥ |x_u - x_v| 表示边 e 跨分区。
+    模型与 CostFunction 的对应关系：
+      - 面积：ONN面积中 matrix_size * avg_degree 等于ONN节点按权重加权的度数之和，电子面积与电子节点数成正比，均为线性；
+      - 延迟：与分区无关，作为常数项；
+      - 误差：ONN输出误差与跨分区边比例均为线性，min(·, 1) 上限用一个二元变量精确表示；
+      - 复杂度：1 - min/max 的平衡项用 |ONN权重 - 电子权重| / 总权重 线性近似（两端取值一致，中间为下界）；
+      - 接口：跨分区位宽之和为线性，min(·, 1) 上限同误差项。
+    在化简图上求解时，每个超节点的系数为其成员在原图上的取值之和，跨分区边按原图的边汇总，
+    模型成本与原图上的成本一致；最优性针对“超节点成员同域”这一受限的解空间。
+    """
+
+    def __init__(self, config: MILPConfig = None, cost_function: CostFunction = None):
+        self.config = config or MILPConfig()
+        self.cost_function = cost_function or CostFunction()
+
+    def optimize(self,
+                graph: nx.DiGraph,
+                fixed_nodes: Optional[Dict[str, int]] = None,
+                budgets: Optional[ResourceBudgets] = None,
+                reduction: Optional[ReducedGraph] = None) -> MILPResult:
+        """求解分区MILP，fixed_nodes 可将部分节点固定到指定分区，budgets 为资源预算硬约束，
+        reduction 为graph的化简结果时目标按原图计算"""
+        start_time = time.time()
+        nodes = list(graph.nodes())
+        num_nodes = len(nodes)
+
+        if num_nodes == 0:
+            return MILPResult({}, 0.0, 0.0, 0.0, True, True, 0, "空图", 0.0)
+
+        if num_nodes > self.config.max_nodes:
+            return MILPResult(
+                best_partition={}, best_cost=float('inf'), lower_bound=None, mip_gap=None,
+                is_optimal=False, success=False, status=-1,
+                message=f"节点数 {num_nodes} 超过上限 {self.config.max_nodes}",
+                solve_time=0.0
+            )
+
+        # 决策变量对应的原图节点组：未化简时每个节点一组，化简时为超节点成员，
+        # 被剪除的节点作为固定在 pruned_partition 的变量
+        source = graph
+        groups = {node: [node] for node in nodes}
+        if reduction is not None and reduction.graph is graph and reduction.original is not None:
+            source = reduction.original
+            groups = {node: reduction.members.get(node, [node]) for node in nodes}
+            fixed_nodes = dict(fixed_nodes or {})
+            for node in reduction.pruned:
+                groups[node] = [node]
+                fixed_nodes[node] = reduction.pruned_partition
+        variables = list(groups)
+        num_variables = len(variables)
+        index = {node: i for i, node in enumerate(variables)}
+        representative = {member: node for node, group in groups.items() for member in group}
+
+        member_weights = {node: float(self.cost_function._node_weight(source, node)) for node in source.nodes()}
+        node_weights = np.array([sum(member_weights[member] for member in groups[node]) for node in variables])
+        # ONN负载为原图上的 权重×度数 之和
+        onn_loads = np.array([sum(member_weights[member] * source.degree(member) for member in groups[node])
+                              for node in variables])
+        node_counts = np.array([len(groups[node]) for node in variables], dtype=float)
+        total_weight = node_weights.sum()
+        total_count = node_counts.sum()
+
+        # 原图的边按端点所在变量汇总，同一组内的边不会跨分区但计入总重数
+        cut_edges: Dict[tuple, List[float]] = {}
+        total_multiplicity = 0.0
+        for src, dst, multiplicity in source.edges(data='multiplicity', default=1):
+            total_multiplicity += multiplicity
+            u, v = index[representative[src]], index[representative[dst]]
+            if u == v:
+                continue
+            entry = cut_edges.setdefault((u, v), [0.0, 0.0])
+            entry[0] += self.cost_function._edge_bit_width(source, src, dst) * multiplicity
+            entry[1] += multiplicity
+        edges = [(u, v, width, multiplicity) for (u, v), (width, multiplicity) in cut_edges.items()]
+        num_edges = len(edges)
+        edge_multiplicity = np.array([multiplicity for _, _, _, multiplicity in edges], dtype=float)
+
+        weights = self.cost_function.weights
+        onn_params = self.cost_function.onn_area_params
+
+        # 变量布局：x[0:n] | y[n:n+m] | z(ONN非空) | d(不平衡度) | err, b_err | intf, b_intf
+        x0 = 0
+        y0 = num_variables
+        z = y0 + num_edges
+        d = z + 1
+        err, b_err = d + 1, d + 2
+        intf, b_intf = d + 3, d + 4
+        num_vars = d + 5
+
+        c = np.zeros(num_vars)
+        constant = 0.0
+
+        # 面积项（/100 归一化）
+        electronic_node_area = self.cost_function._electronic_area_per_weight()
+        onn_base_area = self.cost_function._onn_tile_area(0.0)
+        c[x0:x0 + num_variables] += weights.area_weight * (
+            onn_params['matrix_size_factor'] * onn_loads - electronic_node_area * node_weights) / 100.0
+        constant += weights.area_weight * electronic_node_area * total_weight / 100.0
+        c[z] += weights.area_weight * onn_base_area / 100.0
+
+        # 延迟项与分区无关
+        constant += weights.delay_weight * self.cost_function._calculate_delay_cost(source, {})
+
+        # 复杂度项
+        c[d] += weights.complexity_weight / total_weight
+
+        # 误差项与接口项（带上限）
+        c[err] += weights.error_weight
+        c[intf] += weights.interface_weight
+
+        # 约束矩阵
+        num_rows = 2 * num_edges + 1 + 2 + 2 + 2 + 3
+        A = lil_matrix((num_rows, num_vars))
+        lower = np.full(num_rows, -np.inf)
+        upper = np.full(num_rows, np.inf)
+        row = 0
+
+        # y_e ≥ x_u - x_v, y_e ≥ x_v - x_u
+        for k, (u, v, _, _) in enumerate(edges):
+            A[row, y0 + k] = 1.0
+            A[row, x0 + u] = -1.0
+            A[row, x0 + v] = 1.0
+            lower[row] = 0.0
+            row += 1
+            A[row, y0 + k] = 1.0
+            A[row, x0 + u] = 1.0
+            A[row, x0 + v] = -1.0
+            lower[row] = 0.0
+            row += 1
+
+        # n·z ≥ Σx
+        A[row, z] = num_variables
+        A[row, x0:x0 + num_variables] = -1.0
+        lower[row] = 0.0
+        row += 1
+
+        # d ≥ |2Σw·x - W|
+        A[row, d] = 1.0
+        A[row, x0:x0 + num_variables] = -2.0 * node_weights
+        lower[row] = -total_weight
+        row += 1
+        A[row, d] = 1.0
+        A[row, x0:x0 + num_variables] = 2.0 * node_weights
+        lower[row] = total_weight
+        row += 1
+
+        # err = min(0.01·Σx + 0.1·Σy/m, 1)：err ≥ a - M·b_err，err ≥ b_err（x按组内节点数计）
+        error_big_m = 0.01 * total_count + 0.1
+        A[row, err] = 1.0
+        A[row, x0:x0 + num_variables] = -0.01 * node_counts
+        if num_edges > 0:
+            A[row, y0:y0 + num_edges] = -0.1 * edge_multiplicity / total_multiplicity
+        A[row, b_err] = error_big_m
+        lower[row] = 0.0
+        row += 1
+        A[row, err] = 1.0
+        A[row, b_err] = -1.0
+        lower[row] = 0.0
+        row += 1
+
+        # intf = min((0.1·n + 0.01·Σw·y) / 100, 1)
+        interface_base = total_count * 0.1 / 100.0
+        edge_widths = np.array([width for _, _, width, _ in edges], dtype=float)
+        interface_big_m = interface_base + 0.01 * edge_widths.sum() / 100.0
+        A[row, intf] = 1.0
+        if num_edges > 0:
+            A[row, y0:y0 + num_edges] = -0.01 * edge_widths / 100.0
+        A[row, b_intf] = interface_big_m
+        lower[row] = interface_base
+        row += 1
+        A[row, intf] = 1.0
+        A[row, b_intf] = -1.0
+        lower[row] = 0.0
+        row += 1
+
+        # 资源预算（面积与功耗对Σw·deg·x线性，ONN核非空时计入固定部分）
+        budgets = budgets or ResourceBudgets()
+        power_params = self.cost_function.onn_power_params
+        A[row, z] = onn_base_area
+        A[row, x0:x0 + num_variables] = onn_params['matrix_size_factor'] * onn_loads
+        if budgets.onn_area is not None:
+            upper[row] = budgets.onn_area
+        row += 1
+        A[row, z] = power_params['base_power']
+        A[row, x0:x0 + num_variables] = power_params['per_connection_power'] * onn_loads
+        if budgets.onn_power is not None:
+            upper[row] = budgets.onn_power
+        row += 1
+        A[row, x0:x0 + num_variables] = -electronic_node_area * node_weights
+        if budgets.electronic_area is not None:
+            upper[row] = budgets.electronic_area - electronic_node_area * total_weight
+        row += 1
+
+        # 变量界与整数性
+        var_lower = np.zeros(num_vars)
+        var_upper = np.ones(num_vars)
+        var_upper[d] = total_weight
+        integrality = np.zeros(num_vars)
+        integrality[x0:x0 + num_variables] = 1
+        integrality[[z, b_err, b_intf]] = 1
+
+        for node, part in (fixed_nodes or {}).items():
+            if node in index:
+                var_lower[x0 + index[node]] = part
+                var_upper[x0 + index[node]] = part
+
+        result = milp(
+            c,
+            integrality=integrality,
+            bounds=Bounds(var_lower, var_upper),
+            constraints=LinearConstraint(A.tocsr(), lower, upper),
+            options={
+                'time_limit': self.config.time_limit,
+                'mip_rel_gap': self.config.mip_rel_gap,
+                'disp': False
+            }
+        )
+        solve_time = time.time() - start_time
+
+        if result.x is None:
+            return MILPResult(
+                best_partition={}, best_cost=float('inf'), lower_bound=None, mip_gap=None,
+                is_optimal=False, success=False, status=result.status,
+                message=result.message, solve_time=solve_time
+            )
+
+        partition = {node: int(round(result.x[x0 + index[node]])) for node in nodes}
+        lower_bound = getattr(result, 'mip_dual_bound', None)
+
+        return MILPResult(
+            best_partition=partition,
+            best_cost=float(result.fun) + constant,
+            lower_bound=float(lower_bound) + constant if lower_bound is not None else None,
+            mip_gap=getattr(result, 'mip_gap', None),
+            is_optimal=result.status == 0,
+            success=True,
+            status=result.status,
+            message=result.message,
+            solve_time=solve_time
+        )
+
+    def analyze_result(self, result: MILPResult) -> Dict[str, Any]:
+        """分析求解结果"""
+        onn_count = sum(1 for part in result.best_partition.values() if part == 1)
+        return {
+            'status': result.status,
+            'message': result.message,
+            'is_optimal': result.is_optimal,
+            'model_cost': result.best_cost,
+            'lower_bound': result.lower_bound,
+            'mip_gap': result.mip_gap,
+            'solve_time': result.solve_time,
+            'onn_nodes': onn_count,
+            'electronic_nodes': len(result.best_partition) - onn_count
+        }
+
+
+def main():
+    """测试函数"""
+    # 创建示例图
+    graph = nx.DiGraph()
+    graph.add_nodes_from(['A', 'B', 'C', 'D', 'E', 'F'])
+    graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E'), ('E', 'F')])
+
+    partitioner = MILPPartitioner(MILPConfig(time_limit=10.0))
+    result = partitioner.optimize(graph)
+    analysis = partitioner.analyze_result(result)
+
+    # 与成本函数的实际取值对比
+    cost_func = CostFunction()
+    onn_outputs = [node for node, part in result.best_partition.items() if part == 1]
+    electronic_outputs = [node for node, part in result.best_partition.items() if part == 0]
+    metrics = cost_func.calculate_total_cost(graph, result.best_partition, onn_outputs, electronic_outputs)
+
+    print("MILP求解结果:")
+    print(f"  最优分区: {result.best_partition}")
+    print(f"  模型成本: {result.best_cost:.6f}")
+    print(f"  下界: {analysis['lower_bound']}")
+    print(f"  是否最优: {result.is_optimal}")
+    print(f"  实际成本: {metrics.total_cost:.6f}")
+    print(f"  求解时间: {result.solve_time:.3f}秒")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,160 @@
+"""
+超图线网模型模块
+每个驱动节点对应一条线网（驱动 + 全部负载），跨分区成本按
+连通度减一（λ-1）计算：驱动扇出到多个ONN负载只需一次光电转换。
+支持k个域，移动节点时只更新其所在线网的各域引脚计数，割值增量维护
+"""
+
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Optional, Any
+from dataclasses import dataclass
+
+
+@dataclass
+class Net:
+    """线网（超边）"""
+    driver: str
+    sinks: List[str]
+    width: int
+    multiplicity: int
+
+
+class NetModel:
+    """基于线网的割与接口模型（k路分区）"""
+
+    def __init__(self, graph: nx.DiGraph, cost_function=None, num_domains: Optional[int] = None):
+        self.graph = graph
+        if num_domains is None:
+            num_domains = cost_function.domains.num_domains if cost_function is not None else 2
+        self.num_domains = num_domains
+        self.nets: List[Net] = []
+        self.node_nets: Dict[str, List[int]] = {node: [] for node in graph.nodes()}
+
+        for driver in graph.nodes():
+            sinks = list(graph.successors(driver))
+            if not sinks:
+                continue
+            if cost_function is not None:
+                width = max(cost_function._edge_bit_width(graph, driver, sink) for sink in sinks)
+            else:
+                width = graph.nodes[driver].get('bit_width') or 1
+            # 化简图中的并行边合并为重数，取最大值作为该驱动的独立信号数
+            multiplicity = max(graph.edges[driver, sink].get('multiplicity', 1) for sink in sinks)
+
+            net_index = len(self.nets)
+            self.nets.append(Net(driver, sinks, width, multiplicity))
+            self.node_nets[driver].append(net_index)
+            for sink in sinks:
+                self.node_nets[sink].append(net_index)
+
+        self.pin_counts = np.array([len(net.sinks) + 1 for net in self.nets], dtype=np.int64)
+        self.widths = np.array([net.width * net.multiplicity for net in self.nets], dtype=float)
+        self.multiplicities = np.array([net.multiplicity for net in self.nets], dtype=float)
+        self.total_multiplicity = float(self.multiplicities.sum())
+
+        # 分区状态：每条线网在各域中的引脚数及连通度（跨越的域数）
+        self.domain_pins = np.zeros((len(self.nets), num_domains), dtype=np.int64)
+        self.connectivity = np.zeros(len(self.nets), dtype=np.int64)
+        self.partition: Optional[Dict[str, int]] = None
+        self.cut_width = 0.0
+        self.cut_count = 0.0
+
+    def set_partition(self, partition: Dict[str, int]):
+        """按完整分区重新计算线网计数（缺失节点视为域0）"""
+        self.partition = {node: partition.get(node, 0) for node in self.node_nets}
+        self.domain_pins[:] = 0
+        for node, part in self.partition.items():
+            for net_index in self.node_nets[node]:
+                self.domain_pins[net_index, part] += 1
+
+        self.connectivity = (self.domain_pins > 0).sum(axis=1)
+        excess = np.maximum(self.connectivity - 1, 0)
+        self.cut_width = float((self.widths * excess).sum())
+        self.cut_count = float((self.multiplicities * excess).sum())
+
+    def move(self, node: str, domain: int) -> float:
+        """将节点移动到指定域，返回割位宽的增量（复杂度为节点度数）"""
+        if self.partition is None:
+            self.set_partition({})
+
+        source = self.partition[node]
+        if source == domain:
+            return 0.0
+        self.partition[node] = domain
+
+        delta = 0.0
+        for net_index in self.node_nets[node]:
+            change = 0
+            self.domain_pins[net_index, source] -= 1
+            if self.domain_pins[net_index, source] == 0:
+                change -= 1
+            if self.domain_pins[net_index, domain] == 0:
+                change += 1
+            self.domain_pins[net_index, domain] += 1
+            if change:
+                self.connectivity[net_index] += change
+                delta += change * float(self.widths[net_index])
+                self.cut_count += change * float(self.multiplicities[net_index])
+
+        self.cut_width += delta
+        return delta
+
+    def flip(self, node: str) -> float:
+        """两路分区下翻转单个节点，返回割位宽的增量"""
+        if self.partition is None:
+            self.set_partition({})
+        return self.move(node, 1 - self.partition[node])
+
+    def sync(self, partition: Dict[str, int]):
+        """与新分区同步：只翻转发生变化的节点"""
+        if self.partition is None:
+            self.set_partition(partition)
+            return
+
+        changed = [node for node, part in self.partition.items() if partition.get(node, 0) != part]
+        # 变化节点过多时整体重算更快
+        if len(changed) > len(self.partition) // 2:
+            self.set_partition(partition)
+            return
+        for node in changed:
+            self.move(node, partition.get(node, 0))
+
+    def covers(self, graph: nx.DiGraph, partition: Dict[str, int]) -> bool:
+        """判断模型是否适用于给定图和分区"""
+        return graph is self.graph and len(partition) == len(self.node_nets)
+
+    def cut_nets(self) -> List[Net]:
+        """当前分区下跨分区的线网"""
+        return [self.nets[i] for i in np.flatnonzero(self.connectivity > 1)]
+
+    def analyze(self) -> Dict[str, Any]:
+        """统计线网模型"""
+        return {
+            'nets': len(self.nets),
+            'pins': int(self.pin_counts.sum()),
+            'cut_nets': len(self.cut_nets()),
+            'cut_width': self.cut_width
+        }
+
+
+def main():
+    """测试函数"""
+    # 驱动A扇出到B、C、D三个负载
+    graph = nx.DiGraph()
+    graph.add_edges_from([('A', 'B'), ('A', 'C'), ('A', 'D'), ('D', 'E')])
+
+    model = NetModel(graph)
+    model.set_partition({'A': 0, 'B': 1, 'C': 1, 'D': 1, 'E': 1})
+    print("线网模型结果:")
+    print(f"  线网数: {len(model.nets)}")
+    print(f"  割位宽（按线网）: {model.cut_width}")
+    print(f"  割位宽（按边）: {sum(1 for u, v in graph.edges() if model.partition[u] != model.partition[v])}")
+
+    delta = model.flip('A')
+    print(f"  翻转A后割位宽增量: {delta}, 当前割位宽: {model.cut_width}")
+    print(f"  统计: {model.analyze()}")
+
+
+if __name__ == "__main__":
+    main()
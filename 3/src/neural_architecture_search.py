@@ -13,6 +13,9 @@ import networkx as nx
 import random
 import copy
 
+from pareto import ParetoArchive, fast_non_dominated_sort, crowding_distance
+from cost_function import PartitionDomains
+
 
 @dataclass
 class NASConfig:
@@ -25,6 +28,15 @@ class NASConfig:
     tournament_size: int = 3
     learning_rate: float = 0.001
     batch_size: int = 32
+    # 分区交叉算子：'prefix'（按字典顺序前缀）、'bfs'（BFS球）、
+    # 'level'（拓扑层级带）、'cone'（扇出锥）、'mixed'（随机选择图感知算子）
+    crossover_operator: str = 'bfs'
+    # 精简基因组模式：仅保留分区位向量，适应度只由成本决定
+    partition_only: bool = False
+    num_domains: int = 2  # 分区域数（多个ONN核/电子岛时大于2）
+    # 多目标模式：NSGA-II选择，一次运行得到整个帕累托前沿
+    multi_objective: bool = False
+    archive_size: int = 200
 
 
 @dataclass
@@ -34,16 +46,26 @@ class Architecture:
     connectivity: Dict[str, List[str]]
     layer_config: Dict[str, Any]
     fitness: float = 0.0
+    objectives: Optional[np.ndarray] = None  # 多目标模式下的目标向量
+    rank: int = 0  # 非支配等级
+    crowding: float = 0.0  # 拥挤距离
 
 
 class NeuralArchitectureSearch:
     """神经网络架构搜索实现"""
     
-    def __init__(self, config: NASConfig = None):
+    def __init__(self, config: NASConfig = None, domains: PartitionDomains = None):
         self.config = config or NASConfig()
+        self.domains = domains or PartitionDomains()  # 域类型，用于统计ONN与电子节点
         self.population: List[Architecture] = []
         self.best_architecture: Optional[Architecture] = None
         self.fitness_history: List[float] = []
+        self.pareto_archive: Optional[ParetoArchive] = None
+        self.front_size_history: List[int] = []
+        
+        # 图感知交叉所需的图结构缓存
+        self._graph: Optional[nx.DiGraph] = None
+        self._node_levels: Dict[str, int] = {}
         
         # 检查CUDA可用性
         self.device = torch.device('cuda' if torch.cuda.is_available() else 'cpu')
@@ -61,7 +83,10 @@ class NeuralArchitectureSearch:
         # 随机分区
         partition = {}
         for node in graph.nodes():
-            partition[node] = random.randint(0, 1)
+            partition[node] = random.randint(0, self.config.num_domains - 1)
+        
+        if self.config.partition_only:
+            return Architecture(partition=partition, connectivity={}, layer_config={})
         
         # 随机连接性
         connectivity = {}
@@ -99,6 +124,10 @@ class NeuralArchitectureSearch:
             # 转换为适应度（成本越低，适应度越高）
             fitness = 1.0 / (1.0 + cost)
             
+            if self.config.partition_only:
+                architecture.fitness = max(0.0, fitness)
+                return architecture.fitness
+            
             # 考虑架构复杂度
             complexity_penalty = self._calculate_complexity_penalty(architecture)
             fitness *= (1.0 - complexity_penalty)
@@ -133,16 +162,23 @@ class NeuralArchitectureSearch:
         if not partition_values:
             return 0.0
         
-        onn_count = sum(1 for v in partition_values if v == 1)
-        electronic_count = len(partition_values) - onn_count
+        domain_counts = self._domain_counts(architecture)
         
-        if onn_count == 0 or electronic_count == 0:
-            return 0.3  # 完全不平衡的惩罚
+        if min(domain_counts) == 0:
+            return 0.3  # 存在空域（完全不平衡）的惩罚
         
         # 计算平衡比例
-        balance_ratio = min(onn_count, electronic_count) / max(onn_count, electronic_count)
+        balance_ratio = min(domain_counts) / max(domain_counts)
         return 0.2 * (1.0 - balance_ratio)
     
+    def _domain_counts(self, architecture: Architecture) -> List[int]:
+        """各域的节点数"""
+        domain_counts = [0] * self.config.num_domains
+        for part in architecture.partition.values():
+            if 0 <= part < len(domain_counts):
+                domain_counts[part] += 1
+        return domain_counts
+    
     def selection(self) -> List[Architecture]:
         """选择操作"""
         # 锦标赛选择
@@ -151,25 +187,26 @@ class NeuralArchitectureSearch:
         for _ in range(self.config.population_size):
             tournament = random.sample(self.population, self.config.tournament_size)
             winner = max(tournament, key=lambda x: x.fitness)
-            selected.append(copy.deepcopy(winner))
+            selected.append(self._copy_architecture(winner))
         
         return selected
     
     def crossover(self, parent1: Architecture, parent2: Architecture) -> Tuple[Architecture, Architecture]:
         """交叉操作"""
-        child1 = copy.deepcopy(parent1)
-        child2 = copy.deepcopy(parent2)
+        child1 = self._copy_architecture(parent1)
+        child2 = self._copy_architecture(parent2)
         
-        # 分区交叉
+        # 分区交叉：交换DFG上连通的子图区域，使子代继承完整的ONN区域
         if random.random() < self.config.crossover_rate:
-            crossover_point = random.randint(1, len(parent1.partition) - 1)
-            nodes = list(parent1.partition.keys())
+            region = self._select_crossover_region(list(parent1.partition.keys()))
             
-            for i in range(crossover_point):
-                node = nodes[i]
+            for node in region:
                 child1.partition[node] = parent2.partition[node]
                 child2.partition[node] = parent1.partition[node]
         
+        if self.config.partition_only:
+            return child1, child2
+        
         # 连接性交叉
         if random.random() < self.config.crossover_rate:
             for node in parent1.connectivity:
@@ -186,12 +223,132 @@ class NeuralArchitectureSearch:
         
         return child1, child2
     
+    def _copy_architecture(self, architecture: Architecture) -> Architecture:
+        """复制架构；精简模式下只复制分区位向量（其余基因不参与进化，原样保留）"""
+        if self.config.partition_only:
+            return Architecture(
+                partition=dict(architecture.partition),
+                connectivity={node: list(neighbors) for node, neighbors in architecture.connectivity.items()},
+                layer_config=dict(architecture.layer_config),
+                fitness=architecture.fitness,
+                objectives=architecture.objectives,
+                rank=architecture.rank,
+                crowding=architecture.crowding
+            )
+        return copy.deepcopy(architecture)
+    
+    def _select_crossover_region(self, nodes: List[str]) -> List[str]:
+        """选择交叉时交换的节点区域"""
+        if len(nodes) < 2:
+            return []
+        
+        region_size = random.randint(1, len(nodes) - 1)
+        operator = self.config.crossover_operator
+        if operator == 'mixed':
+            operator = random.choice(['bfs', 'level', 'cone'])
+        
+        # 没有图结构时退化为前缀交叉
+        if operator == 'prefix' or self._graph is None:
+            return nodes[:region_size]
+        
+        if operator == 'bfs':
+            return self._bfs_region(nodes, region_size)
+        elif operator == 'level':
+            return self._level_band_region(nodes, region_size)
+        elif operator == 'cone':
+            return self._fanout_cone_region(nodes, region_size)
+        else:
+            raise ValueError(f"未知的交叉算子: {self.config.crossover_operator}")
+    
+    def _bfs_region(self, nodes: List[str], region_size: int) -> List[str]:
+        """以随机根节点为中心的BFS球（忽略边方向）"""
+        root = random.choice(nodes)
+        region = [root]
+        visited = {root}
+        frontier = [root]
+        
+        while frontier and len(region) < region_size:
+            next_frontier = []
+            for node in frontier:
+                neighbors = list(self._graph.successors(node)) + list(self._graph.predecessors(node))
+                for neighbor in neighbors:
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        region.append(neighbor)
+                        next_frontier.append(neighbor)
+                        if len(region) >= region_size:
+                            return region
+            frontier = next_frontier
+        
+        return region
+    
+    def _level_band_region(self, nodes: List[str], region_size: int) -> List[str]:
+        """从随机层级开始向下取连续的拓扑层级，总节点数不超过region_size"""
+        if not self._node_levels:
+            return nodes[:region_size]
+        
+        levels: Dict[int, List[str]] = {}
+        for node in nodes:
+            levels.setdefault(self._node_levels.get(node, -1), []).append(node)
+        ordered = sorted(levels)
+        
+        region = []
+        for level in ordered[random.randrange(len(ordered)):]:
+            region.extend(levels[level])
+            if len(region) >= region_size:
+                break
+        
+        return region[:region_size]
+    
+    def _fanout_cone_region(self, nodes: List[str], region_size: int) -> List[str]:
+        """随机根节点的扇出锥（沿后继方向BFS）"""
+        root = random.choice(nodes)
+        region = [root]
+        visited = {root}
+        frontier = [root]
+        
+        while frontier and len(region) < region_size:
+            next_frontier = []
+            for node in frontier:
+                for successor in self._graph.successors(node):
+                    if successor not in visited:
+                        visited.add(successor)
+                        region.append(successor)
+                        next_frontier.append(successor)
+                        if len(region) >= region_size:
+                            return region
+            frontier = next_frontier
+        
+        return region
+    
+    def _prepare_graph(self, graph: nx.DiGraph):
+        """缓存图结构及拓扑层级（环路按强连通分量收缩后分层）"""
+        self._graph = graph
+        self._node_levels = {}
+        
+        if len(graph) == 0:
+            return
+        
+        condensed = nx.condensation(graph)
+        for level, components in enumerate(nx.topological_generations(condensed)):
+            for component in components:
+                for node in condensed.nodes[component]['members']:
+                    self._node_levels[node] = level
+    
     def mutation(self, architecture: Architecture):
         """变异操作"""
         # 分区变异
         if random.random() < self.config.mutation_rate:
             node = random.choice(list(architecture.partition.keys()))
-            architecture.partition[node] = 1 - architecture.partition[node]
+            num_domains = self.config.num_domains
+            if num_domains == 2:
+                architecture.partition[node] = 1 - architecture.partition[node]
+            else:
+                offset = random.randint(1, num_domains - 1)
+                architecture.partition[node] = (architecture.partition[node] + offset) % num_domains
+        
+        if self.config.partition_only:
+            return
         
         # 连接性变异
         if random.random() < self.config.mutation_rate:
@@ -222,6 +379,8 @@ class NeuralArchitectureSearch:
     
     def evolve(self, graph: nx.DiGraph, cost_function: callable):
         """执行进化过程"""
+        self._prepare_graph(graph)
+        
         if not self.population:
             self.initialize_population(graph)
         
@@ -266,7 +425,7 @@ class NeuralArchitectureSearch:
             # 更新最佳架构
             current_best = max(self.population, key=lambda x: x.fitness)
             if current_best.fitness > self.best_architecture.fitness:
-                self.best_architecture = copy.deepcopy(current_best)
+                self.best_architecture = self._copy_architecture(current_best)
             
             self.fitness_history.append(self.best_architecture.fitness)
             
@@ -274,22 +433,116 @@ class NeuralArchitectureSearch:
             if generation % 10 == 0:
                 print(f"第 {generation} 代: 最佳适应度 = {self.best_architecture.fitness:.4f}")
     
+    def evaluate_objectives(self, architecture: Architecture, graph: nx.DiGraph,
+                            objective_function: callable) -> np.ndarray:
+        """评估多目标向量，标量适应度仅用于记录"""
+        objectives = np.asarray(objective_function(graph, architecture.partition), dtype=float)
+        architecture.objectives = objectives
+        architecture.fitness = 1.0 / (1.0 + float(objectives.sum()))
+        return objectives
+    
+    def _assign_rank_and_crowding(self, population: List[Architecture]) -> List[List[int]]:
+        """非支配排序并计算每个前沿内的拥挤距离"""
+        objectives = np.array([architecture.objectives for architecture in population])
+        fronts = fast_non_dominated_sort(objectives)
+        for rank, front in enumerate(fronts):
+            distances = crowding_distance(objectives[front])
+            for index, distance in zip(front, distances):
+                population[index].rank = rank
+                population[index].crowding = float(distance)
+        return fronts
+    
+    def _crowded_tournament(self) -> Architecture:
+        """二元锦标赛：等级低者胜，同等级时拥挤距离大者胜"""
+        first, second = random.sample(self.population, 2)
+        if (first.rank, -first.crowding) <= (second.rank, -second.crowding):
+            return first
+        return second
+    
+    def _archive_architecture(self, architecture: Architecture):
+        """将已评估的架构加入非支配存档"""
+        self.pareto_archive.add(architecture.objectives, self._copy_architecture(architecture))
+    
+    def evolve_multi_objective(self, graph: nx.DiGraph, objective_function: callable,
+                               archive: Optional[ParetoArchive] = None) -> ParetoArchive:
+        """NSGA-II多目标进化，objective_function返回目标向量，结果为非支配解存档"""
+        self._prepare_graph(graph)
+        
+        if not self.population:
+            self.initialize_population(graph)
+        
+        self.pareto_archive = archive or ParetoArchive(self.config.archive_size)
+        
+        # 评估初始种群
+        for architecture in self.population:
+            self.evaluate_objectives(architecture, graph, objective_function)
+            self._archive_architecture(architecture)
+        self._assign_rank_and_crowding(self.population)
+        
+        self.best_architecture = self._copy_architecture(max(self.population, key=lambda x: x.fitness))
+        self.fitness_history = [self.best_architecture.fitness]
+        self.front_size_history = [len(self.pareto_archive)]
+        
+        population_size = self.config.population_size
+        for generation in range(self.config.generations):
+            # 拥挤比较锦标赛选择父代并生成子代
+            offspring = []
+            while len(offspring) < population_size:
+                child1, child2 = self.crossover(self._crowded_tournament(), self._crowded_tournament())
+                self.mutation(child1)
+                self.mutation(child2)
+                offspring.extend([child1, child2])
+            offspring = offspring[:population_size]
+            
+            for architecture in offspring:
+                self.evaluate_objectives(architecture, graph, objective_function)
+                self._archive_architecture(architecture)
+            
+            # 父代与子代合并后按前沿等级和拥挤距离截断
+            combined = self.population + offspring
+            fronts = self._assign_rank_and_crowding(combined)
+            next_population = []
+            for front in fronts:
+                members = [combined[index] for index in front]
+                if len(next_population) + len(members) > population_size:
+                    members.sort(key=lambda x: x.crowding, reverse=True)
+                    next_population.extend(members[:population_size - len(next_population)])
+                    break
+                next_population.extend(members)
+            self.population = next_population
+            
+            current_best = max(self.population, key=lambda x: x.fitness)
+            if current_best.fitness > self.best_architecture.fitness:
+                self.best_architecture = self._copy_architecture(current_best)
+            
+            self.fitness_history.append(self.best_architecture.fitness)
+            self.front_size_history.append(len(self.pareto_archive))
+            
+            # 打印进度
+            if generation % 10 == 0:
+                print(f"第 {generation} 代: 前沿解数 = {len(self.pareto_archive)}")
+        
+        return self.pareto_archive
+    
     def get_best_architecture(self) -> Optional[Architecture]:
         """获取最佳架构"""
         return self.best_architecture
     
     def get_optimization_history(self) -> Dict[str, List[float]]:
         """获取优化历史"""
-        return {
+        history = {
             'fitness_history': self.fitness_history,
             'generations': list(range(len(self.fitness_history)))
         }
+        if self.front_size_history:
+            history['front_size_history'] = self.front_size_history
+        return history
     
     def analyze_architecture(self, architecture: Architecture) -> Dict[str, Any]:
         """分析架构特征"""
-        partition_values = list(architecture.partition.values())
-        onn_count = sum(1 for v in partition_values if v == 1)
-        electronic_count = len(partition_values) - onn_count
+        domain_counts = self._domain_counts(architecture)
+        onn_count = sum(domain_counts[d] for d in self.domains.onn_domains() if d < len(domain_counts))
+        electronic_count = sum(domain_counts[d] for d in self.domains.electronic_domains() if d < len(domain_counts))
         
         total_connections = sum(len(conns) for conns in architecture.connectivity.values())
         
@@ -297,7 +550,9 @@ class NeuralArchitectureSearch:
             'total_nodes': len(architecture.partition),
             'onn_nodes': onn_count,
             'electronic_nodes': electronic_count,
-            'balance_ratio': min(onn_count, electronic_count) / max(onn_count, electronic_count) if max(onn_count, electronic_count) > 0 else 0,
+            'domain_counts': domain_counts,
+            # 各域节点数的最小/最大比（两路分区时即ONN与电子节点数之比）
+            'balance_ratio': min(domain_counts) / max(domain_counts) if max(domain_counts) > 0 else 0,
             'total_connections': total_connections,
             'avg_connections_per_node': total_connections / len(architecture.partition) if architecture.partition else 0,
             'layer_config': architecture.layer_config,
@@ -0,0 +1,134 @@
+"""
+帕累托前沿模块
+提供非支配排序、拥挤距离与非支配解存档，支配判断基于numpy向量化比较，
+用于多目标优化（所有目标均为越小越好）
+"""
+
+import numpy as np
+from typing import List, Tuple, Optional, Any
+
+
+def dominates(a: np.ndarray, b: np.ndarray) -> bool:
+    """判断目标向量a是否支配b"""
+    return bool(np.all(a <= b) and np.any(a < b))
+
+
+def fast_non_dominated_sort(objectives: np.ndarray) -> List[List[int]]:
+    """快速非支配排序，返回按等级排列的前沿（每个前沿为下标列表）"""
+    objectives = np.asarray(objectives, dtype=float)
+    num_points = len(objectives)
+    if num_points == 0:
+        return []
+
+    # dominance[i, j] 表示 i 支配 j
+    less_equal = np.all(objectives[:, None, :] <= objectives[None, :, :], axis=2)
+    less = np.any(objectives[:, None, :] < objectives[None, :, :], axis=2)
+    dominance = less_equal & less
+
+    dominated_count = dominance.sum(axis=0)
+    fronts = []
+    current = np.flatnonzero(dominated_count == 0)
+    while len(current) > 0:
+        fronts.append(current.tolist())
+        dominated_count = dominated_count - dominance[current].sum(axis=0)
+        dominated_count[current] = -1
+        current = np.flatnonzero(dominated_count == 0)
+    return fronts
+
+
+def crowding_distance(objectives: np.ndarray) -> np.ndarray:
+    """计算拥挤距离（边界点为无穷大）"""
+    objectives = np.asarray(objectives, dtype=float)
+    num_points, num_objectives = objectives.shape if objectives.ndim == 2 else (len(objectives), 0)
+    distance = np.zeros(num_points)
+    if num_points <= 2:
+        distance[:] = np.inf
+        return distance
+
+    for m in range(num_objectives):
+        order = np.argsort(objectives[:, m], kind='stable')
+        values = objectives[order, m]
+        span = values[-1] - values[0]
+        distance[order[0]] = distance[order[-1]] = np.inf
+        if span > 0:
+            distance[order[1:-1]] += (values[2:] - values[:-2]) / span
+    return distance
+
+
+class ParetoArchive:
+    """非支配解存档"""
+
+    def __init__(self, capacity: Optional[int] = None):
+        self.capacity = capacity
+        self.objectives: Optional[np.ndarray] = None
+        self.payloads: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.payloads)
+
+    def add(self, objectives, payload: Any = None) -> bool:
+        """尝试加入一个解，被支配或重复时返回False"""
+        vector = np.asarray(objectives, dtype=float)
+
+        if self.objectives is None or len(self.payloads) == 0:
+            self.objectives = vector[None, :].copy()
+            self.payloads = [payload]
+            return True
+
+        # 存档中有解支配新解（或与之相同）时拒绝
+        weakly_better = np.all(self.objectives <= vector, axis=1)
+        if np.any(weakly_better):
+            return False
+
+        # 移除被新解支配的旧解
+        dominated = np.all(vector <= self.objectives, axis=1) & np.any(vector < self.objectives, axis=1)
+        if np.any(dominated):
+            keep = np.flatnonzero(~dominated)
+            self.objectives = self.objectives[keep]
+            self.payloads = [self.payloads[i] for i in keep]
+
+        self.objectives = np.vstack([self.objectives, vector])
+        self.payloads.append(payload)
+
+        # 超出容量时移除拥挤距离最小的解
+        if self.capacity is not None and len(self.payloads) > self.capacity:
+            drop = int(np.argmin(crowding_distance(self.objectives)))
+            self.objectives = np.delete(self.objectives, drop, axis=0)
+            del self.payloads[drop]
+            return drop != len(self.payloads)
+        return True
+
+    def entries(self) -> List[Tuple[np.ndarray, Any]]:
+        """返回存档中的 (目标向量, 负载) 列表"""
+        if self.objectives is None:
+            return []
+        return list(zip(self.objectives, self.payloads))
+
+    def select(self, weights) -> Tuple[Optional[np.ndarray], Any]:
+        """按权重加权和从前沿中选出一个解"""
+        if self.objectives is None or len(self.payloads) == 0:
+            return None, None
+        index = int(np.argmin(self.objectives @ np.asarray(weights, dtype=float)))
+        return self.objectives[index], self.payloads[index]
+
+
+def main():
+    """测试函数"""
+    rng = np.random.default_rng(0)
+    points = rng.random((30, 2))
+
+    fronts = fast_non_dominated_sort(points)
+    archive = ParetoArchive()
+    for i, point in enumerate(points):
+        archive.add(point, payload=i)
+
+    print("帕累托前沿结果:")
+    print(f"  前沿数: {len(fronts)}")
+    print(f"  第一前沿: {sorted(fronts[0])}")
+    print(f"  存档: {sorted(payload for _, payload in archive.entries())}")
+    print(f"  拥挤距离: {np.round(crowding_distance(points[fronts[0]]), 3)}")
+    print(f"  权重(0.5, 0.5)选择: {archive.select([0.5, 0.5])[1]}")
+
+
+if __name__ == "__main__":
+    main()
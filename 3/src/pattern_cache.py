@@ -0,0 +1,210 @@
+"""
+结构模式缓存模块
+对小规模有根子图（扇入锥）按运算符类型和拓扑计算规范哈希，
+将每种模板的最优子分区保存到磁盘，新设计中匹配的区域可直接预分配
+或在优化器中作为整体移动
+"""
+
+import os
+import json
+import hashlib
+import networkx as nx
+from typing import Callable, Dict, List, Tuple, Optional, Any
+from dataclasses import dataclass
+
+
+CACHE_VERSION = 2  # 2: 模板按区域自身的局部得分比较（1为整个设计的总成本，不可跨设计比较）
+
+
+@dataclass
+class PatternMatch:
+    """模板匹配结果"""
+    template_hash: str
+    root: str
+    members: List[str]
+    assignment: List[int]
+
+
+class PatternCache:
+    """结构模式缓存"""
+
+    def __init__(self, cache_file: Optional[str] = None, depth: int = 2, min_size: int = 3):
+        self.cache_file = cache_file
+        self.depth = depth
+        self.min_size = min_size
+        self.templates: Dict[str, Dict[str, Any]] = {}
+
+    def load(self) -> int:
+        """从磁盘加载缓存，返回模板数量"""
+        self.templates = {}
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return 0
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"模式缓存加载失败: {e}")
+            return 0
+
+        # 版本或深度不一致时哈希不可比较，丢弃旧缓存
+        if data.get('version') == CACHE_VERSION and data.get('depth') == self.depth:
+            self.templates = data.get('templates', {})
+        return len(self.templates)
+
+    def save(self):
+        """保存缓存到磁盘"""
+        if not self.cache_file:
+            return
+
+        directory = os.path.dirname(os.path.abspath(self.cache_file))
+        os.makedirs(directory, exist_ok=True)
+        with open(self.cache_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': CACHE_VERSION,
+                'depth': self.depth,
+                'templates': self.templates
+            }, f, indent=2, ensure_ascii=False)
+
+    def extract_templates(self, graph: nx.DiGraph) -> Dict[str, Tuple[str, List[str]]]:
+        """提取每个节点的扇入锥模板，返回 {根节点: (模板哈希, 规范顺序的成员)}"""
+        labels = self._node_labels(graph)
+
+        # 逐层细化的哈希：h_k(v) = H(label(v), sorted(h_{k-1}(前驱)))
+        hashes = [labels]
+        for _ in range(self.depth):
+            previous = hashes[-1]
+            hashes.append({
+                node: self._digest(labels[node] + '|' +
+                                   ','.join(sorted(previous[pred] for pred in graph.predecessors(node))))
+                for node in graph.nodes()
+            })
+
+        templates = {}
+        for root in graph.nodes():
+            members = self._canonical_members(graph, root, hashes)
+            if len(members) >= self.min_size:
+                templates[root] = (hashes[self.depth][root], members)
+        return templates
+
+    def record(self, graph: nx.DiGraph, partition: Dict[str, int],
+               score_function: Optional[Callable[[nx.DiGraph, Dict[str, int]], float]] = None) -> int:
+        """记录分区中各模板区域的子分区，局部得分更低时覆盖，返回更新的模板数
+
+        局部得分只取决于区域本身（区域诱导子图及其子分区），同一模板在不同设计中可比较；
+        score_function(子图, 子分区) 默认为区域内跨分区的边数
+        """
+        score_function = score_function or self.cut_score
+        updated = 0
+        for root, (template_hash, members) in self.extract_templates(graph).items():
+            if any(node not in partition for node in members):
+                continue
+            assignment = [partition[node] for node in members]
+            entry = self.templates.get(template_hash)
+            if entry is not None and entry['assignment'] == assignment:
+                continue
+            score = float(score_function(graph.subgraph(members).copy(), dict(zip(members, assignment))))
+            if entry is None or score < entry['score']:
+                self.templates[template_hash] = {
+                    'assignment': assignment,
+                    'score': score,
+                    'size': len(members),
+                    'example_root': str(root)
+                }
+                updated += 1
+        return updated
+    
+    @staticmethod
+    def cut_score(region: nx.DiGraph, partition: Dict[str, int]) -> float:
+        """区域内跨分区的边数（按重数计）"""
+        return float(sum(multiplicity for src, dst, multiplicity in region.edges(data='multiplicity', default=1)
+                         if partition[src] != partition[dst]))
+
+    def match(self, graph: nx.DiGraph) -> List[PatternMatch]:
+        """在图中匹配已缓存模板，按区域大小优先选取互不重叠的区域"""
+        candidates = []
+        for root, (template_hash, members) in self.extract_templates(graph).items():
+            entry = self.templates.get(template_hash)
+            if entry is not None and len(entry['assignment']) == len(members):
+                candidates.append(PatternMatch(template_hash, root, members, list(entry['assignment'])))
+
+        candidates.sort(key=lambda m: len(m.members), reverse=True)
+        covered = set()
+        matches = []
+        for candidate in candidates:
+            if covered.isdisjoint(candidate.members):
+                matches.append(candidate)
+                covered.update(candidate.members)
+        return matches
+
+    def apply(self, graph: nx.DiGraph, partition: Dict[str, int]) -> Tuple[Dict[str, int], List[PatternMatch]]:
+        """用缓存的子分区覆盖匹配区域，返回新分区与匹配列表"""
+        matches = self.match(graph)
+        assigned = dict(partition)
+        for match in matches:
+            for node, part in zip(match.members, match.assignment):
+                assigned[node] = part
+        return assigned, matches
+
+    def _canonical_members(self, graph: nx.DiGraph, root: str, hashes: List[Dict[str, str]]) -> List[str]:
+        """按规范顺序（前驱按子树哈希排序的DFS）列出根节点扇入锥的成员"""
+        members = []
+        visited = set()
+
+        def visit(node, level):
+            if node in visited:
+                return
+            visited.add(node)
+            members.append(node)
+            if level >= self.depth:
+                return
+            remaining = self.depth - level - 1
+            for pred in sorted(graph.predecessors(node), key=lambda p: (hashes[remaining][p], str(p))):
+                visit(pred, level + 1)
+
+        visit(root, 0)
+        return members
+
+    @staticmethod
+    def _node_labels(graph: nx.DiGraph) -> Dict[str, str]:
+        """节点标签：运算符类型与线性属性"""
+        labels = {}
+        for node, data in graph.nodes(data=True):
+            operator = data.get('operator_type')
+            operator = getattr(operator, 'value', operator)
+            labels[node] = f"{operator}:{int(bool(data.get('is_linear')))}"
+        return labels
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        """稳定的短哈希（不受Python哈希随机化影响）"""
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=8).hexdigest()
+
+
+def main():
+    """测试函数"""
+    # 两个相同结构的加法-比较模板
+    graph = nx.DiGraph()
+    for prefix in ('u0', 'u1'):
+        graph.add_node(f'{prefix}.a', operator_type='Terminal', is_linear=True)
+        graph.add_node(f'{prefix}.b', operator_type='Terminal', is_linear=True)
+        graph.add_node(f'{prefix}.sum', operator_type='Plus', is_linear=True)
+        graph.add_node(f'{prefix}.eq', operator_type='Eq', is_linear=False)
+        graph.add_edges_from([(f'{prefix}.a', f'{prefix}.sum'), (f'{prefix}.b', f'{prefix}.sum'),
+                              (f'{prefix}.sum', f'{prefix}.eq')])
+
+    cache = PatternCache(depth=2, min_size=3)
+    partition = {node: 0 for node in graph.nodes()}
+    partition.update({'u0.a': 1, 'u0.b': 1, 'u0.sum': 1})
+    cache.record(graph.subgraph([n for n in graph if n.startswith('u0')]), partition)
+
+    assigned, matches = cache.apply(graph, {node: 0 for node in graph.nodes()})
+
+    print("结构模式缓存结果:")
+    print(f"  模板数: {len(cache.templates)}")
+    print(f"  匹配区域: {[(m.root, m.members) for m in matches]}")
+    print(f"  预分配分区: {assigned}")
+
+
+if __name__ == "__main__":
+    main()
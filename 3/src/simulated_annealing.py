@@ -6,6 +6,8 @@
 import numpy as np
 import random
 import copy
+import pickle
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional, Callable
 from dataclasses import dataclass
 import networkx as nx
@@ -20,6 +22,14 @@ class AnnealingConfig:
     iterations_per_temp: int = 100
     max_iterations: int = 10000
     min_improvement: float = 1e-6
+    num_domains: int = 2  # 分区域数（多个ONN核/电子岛时大于2）
+
+
+@dataclass
+class PopulationAnnealingConfig(AnnealingConfig):
+    """种群退火配置参数"""
+    num_replicas: int = 16
+    num_workers: int = 1
 
 
 @dataclass
@@ -39,6 +49,20 @@ class SimulatedAnnealing:
     def __init__(self, config: AnnealingConfig = None):
         self.config = config or AnnealingConfig()
         self.random_seed = None
+        # 整体移动的节点组（例如结构模式缓存匹配到的区域）
+        self.move_groups: List[List[str]] = []
+        # 资源预算检查器（可选）：超出预算的邻域解不计算成本直接拒绝
+        self.constraint_checker = None
+        # 可移动节点（增量重新分区时只在受影响的邻域内搜索），None表示全部节点
+        self.movable_nodes: Optional[List[str]] = None
+        self._moved_nodes: List[str] = []
+        # 种群退火副本使用的独立随机数生成器，None时使用全局random
+        self._replica_rng: Optional[random.Random] = None
+    
+    @property
+    def rng(self):
+        """邻域操作与接受准则使用的随机数源"""
+        return self._replica_rng if self._replica_rng is not None else random
     
     def set_random_seed(self, seed: int):
         """设置随机种子"""
@@ -47,6 +71,40 @@ class SimulatedAnnealing:
             random.seed(seed)
             np.random.seed(seed)
     
+    def set_move_groups(self, groups: List[List[str]]):
+        """设置整体移动的节点组，邻域操作会将组内节点一起翻转"""
+        self.move_groups = [list(group) for group in groups if group]
+    
+    def set_movable_nodes(self, nodes: Optional[List[str]]):
+        """限定邻域操作只移动给定节点，其余节点保持初始分区"""
+        self.movable_nodes = list(nodes) if nodes is not None else None
+    
+    def _candidate_nodes(self, partition: Dict[str, int]) -> List[str]:
+        """邻域操作可选的节点"""
+        if self.movable_nodes is None:
+            return list(partition.keys())
+        return [node for node in self.movable_nodes if node in partition]
+    
+    def set_constraints(self, constraint_checker):
+        """设置资源预算检查器，初始分区不可行时先贪心修复"""
+        self.constraint_checker = constraint_checker
+    
+    def _repair_partition(self, partition: Dict[str, int]) -> Dict[str, int]:
+        """修复超出预算的分区（未设置约束时原样返回）"""
+        if self.constraint_checker is None:
+            return partition
+        return self.constraint_checker.repair(partition)
+    
+    def _violates_constraints(self, new_partition: Dict[str, int]) -> bool:
+        """判断最近一次邻域操作是否超出预算"""
+        return (self.constraint_checker is not None and
+                not self.constraint_checker.allows(new_partition, self._moved_nodes))
+    
+    def _commit_move(self, new_partition: Dict[str, int]):
+        """接受邻域解后更新预算累加量"""
+        if self.constraint_checker is not None:
+            self.constraint_checker.commit(new_partition, self._moved_nodes)
+    
     def optimize(self, 
                 graph: nx.DiGraph,
                 cost_function: Callable,
@@ -58,6 +116,7 @@ class SimulatedAnnealing:
             partition = self._generate_random_partition(graph)
         else:
             partition = copy.deepcopy(initial_partition)
+        partition = self._repair_partition(partition)
         
         current_partition = copy.deepcopy(partition)
         best_partition = copy.deepcopy(partition)
@@ -66,6 +125,10 @@ class SimulatedAnnealing:
         current_cost = cost_function(graph, current_partition)
         best_cost = current_cost
         
+        # 成本函数提供 delta(graph, partition, changes) 时按增量评估移动，
+        # 返回None时退回完整评估；新的最优解与每个温度步的当前解仍完整评估以消除累积误差
+        delta_function = getattr(cost_function, 'delta', None)
+        
         # 初始化温度
         temperature = self.config.initial_temperature
         
@@ -80,19 +143,37 @@ class SimulatedAnnealing:
                iteration < self.config.max_iterations):
             
             # 在当前温度下进行多次迭代
+            drifted = False  # 当前成本是否由增量累加得到
             for _ in range(self.config.iterations_per_temp):
                 # 生成新解
                 new_partition = self._generate_neighbor(current_partition, graph)
                 
-                # 计算新成本
-                new_cost = cost_function(graph, new_partition)
+                # 计算新成本（超出预算的解不计算成本，必被拒绝）
+                incremental = False
+                if self._violates_constraints(new_partition):
+                    new_cost = float('inf')
+                else:
+                    move_delta = None
+                    if delta_function is not None:
+                        changes = {node: new_partition[node] for node in self._moved_nodes if node in new_partition}
+                        move_delta = delta_function(graph, current_partition, changes)
+                    if move_delta is None:
+                        new_cost = cost_function(graph, new_partition)
+                    else:
+                        new_cost = current_cost + move_delta
+                        incremental = True
                 
                 # 计算成本差
                 delta_cost = new_cost - current_cost
                 
                 # 接受准则
                 if delta_cost < 0 or self._accept_probability(delta_cost, temperature):
+                    self._commit_move(new_partition)
                     current_partition = copy.deepcopy(new_partition)
+                    if incremental and new_cost < best_cost:
+                        new_cost = cost_function(graph, new_partition)
+                    else:
+                        drifted = drifted or incremental
                     current_cost = new_cost
                     
                     # 更新最优解
@@ -115,6 +196,8 @@ class SimulatedAnnealing:
             
             # 降温
             temperature *= self.config.cooling_rate
+            if drifted:
+                current_cost = cost_function(graph, current_partition)
             
             # 检查收敛
             if len(cost_history) > 100:
@@ -147,8 +230,8 @@ class SimulatedAnnealing:
         nodes = list(graph.nodes())
         
         for node in nodes:
-            # 随机分配：0表示电子部分，1表示ONN部分
-            partition[node] = random.randint(0, 1)
+            # 随机分配到一个域（两路分区时0表示电子部分，1表示ONN部分）
+            partition[node] = self.rng.randint(0, self.config.num_domains - 1)
         
         return partition
     
@@ -157,45 +240,76 @@ class SimulatedAnnealing:
         new_partition = copy.deepcopy(partition)
         
         # 随机选择邻域操作
-        operation = random.choice(['flip', 'swap', 'cluster'])
+        candidates = self._candidate_nodes(partition)
+        operations = ['flip', 'swap', 'cluster']
+        if self.move_groups and self.movable_nodes is None:
+            operations.append('group')
+        operation = self.rng.choice(operations)
+        self._moved_nodes = []
+        if not candidates:
+            return new_partition
         
         if operation == 'flip':
-            # 随机翻转一个节点的分配
-            node = random.choice(list(partition.keys()))
-            new_partition[node] = 1 - new_partition[node]
+            # 随机将一个节点移到另一个域
+            node = self.rng.choice(candidates)
+            new_partition[node] = self._other_domain(new_partition[node])
+            self._moved_nodes = [node]
             
         elif operation == 'swap':
             # 随机交换两个节点的分配
-            nodes = list(partition.keys())
+            nodes = candidates
             if len(nodes) >= 2:
-                node1, node2 = random.sample(nodes, 2)
+                node1, node2 = self.rng.sample(nodes, 2)
                 new_partition[node1], new_partition[node2] = new_partition[node2], new_partition[node1]
+                self._moved_nodes = [node1, node2]
                 
         elif operation == 'cluster':
             # 基于图结构的聚类操作
-            self._cluster_based_neighbor(new_partition, graph)
+            self._moved_nodes = self._cluster_based_neighbor(new_partition, graph, candidates)
+            
+        elif operation == 'group':
+            # 整组按相同偏移移动（两路分区时即整组翻转）
+            group = self.rng.choice(self.move_groups)
+            num_domains = self.config.num_domains
+            offset = 1 if num_domains == 2 else self.rng.randint(1, num_domains - 1)
+            for node in group:
+                if node in new_partition:
+                    new_partition[node] = (new_partition[node] + offset) % num_domains
+            self._moved_nodes = group
         
         return new_partition
     
-    def _cluster_based_neighbor(self, partition: Dict[str, int], graph: nx.DiGraph):
-        """基于聚类的邻域操作"""
+    def _other_domain(self, domain: int) -> int:
+        """随机选择另一个域（两路分区时即翻转）"""
+        num_domains = self.config.num_domains
+        if num_domains == 2:
+            return 1 - domain
+        return (domain + self.rng.randint(1, num_domains - 1)) % num_domains
+    
+    def _cluster_based_neighbor(self, partition: Dict[str, int], graph: nx.DiGraph,
+                                candidates: Optional[List[str]] = None) -> List[str]:
+        """基于聚类的邻域操作，返回被移动的节点"""
         # 选择一个随机节点
-        center_node = random.choice(list(partition.keys()))
+        center_node = self.rng.choice(candidates or list(partition.keys()))
         
         # 找到其邻居节点
         neighbors = list(graph.neighbors(center_node))
+        if self.movable_nodes is not None:
+            movable = set(self.movable_nodes)
+            neighbors = [neighbor for neighbor in neighbors if neighbor in movable]
         if not neighbors:
-            return
+            return []
         
         # 随机选择邻居数量
-        num_neighbors = random.randint(1, min(3, len(neighbors)))
-        selected_neighbors = random.sample(neighbors, num_neighbors)
+        num_neighbors = self.rng.randint(1, min(3, len(neighbors)))
+        selected_neighbors = self.rng.sample(neighbors, num_neighbors)
         
         # 将选中的邻居分配到同一分区
         target_partition = partition[center_node]
         for neighbor in selected_neighbors:
             if neighbor in partition:
                 partition[neighbor] = target_partition
+        return selected_neighbors
     
     def _accept_probability(self, delta_cost: float, temperature: float) -> bool:
         """计算接受概率"""
@@ -205,7 +319,7 @@ class SimulatedAnnealing:
         # Metropolis准则
         if delta_cost > 0:
             probability = np.exp(-delta_cost / temperature)
-            return random.random() < probability
+            return self.rng.random() < probability
         else:
             return True
     
@@ -267,6 +381,189 @@ class SimulatedAnnealing:
         return analysis
 
 
+def _replica_sweep(annealer: 'PopulationAnnealing', graph: nx.DiGraph, cost_function: Callable,
+                   partition: Dict[str, int], cost: float, temperature: float,
+                   seed: int) -> Tuple[Dict[str, int], float, Dict[str, int], float]:
+    """在给定温度下对单个副本执行一轮Metropolis扫描，随机数只取自该副本的种子"""
+    annealer._replica_rng = random.Random(seed)
+    try:
+        return annealer._metropolis_sweep(graph, cost_function, partition, cost, temperature)
+    finally:
+        annealer._replica_rng = None
+
+
+# 工作进程中的退火器、图与成本函数：由进程池的initializer每个进程只接收一次
+_worker_state: Tuple = ()
+
+
+def _init_replica_worker(annealer: 'PopulationAnnealing', graph: nx.DiGraph, cost_function: Callable):
+    global _worker_state
+    _worker_state = (annealer, graph, cost_function)
+
+
+def _worker_replica_sweep(partition: Dict[str, int], cost: float, temperature: float,
+                          seed: int) -> Tuple[Dict[str, int], float, Dict[str, int], float]:
+    """工作进程中的副本扫描，每个任务只传递副本分区与种子"""
+    annealer, graph, cost_function = _worker_state
+    return _replica_sweep(annealer, graph, cost_function, partition, cost, temperature, seed)
+
+
+class PopulationAnnealing(SimulatedAnnealing):
+    """种群退火：多个副本沿同一降温曲线演化，每次降温按Boltzmann权重重采样"""
+    
+    def __init__(self, config: PopulationAnnealingConfig = None):
+        super().__init__(config or PopulationAnnealingConfig())
+    
+    def optimize(self, 
+                graph: nx.DiGraph,
+                cost_function: Callable,
+                initial_partition: Optional[Dict[str, int]] = None) -> AnnealingResult:
+        """执行种群退火优化"""
+        num_replicas = max(1, self.config.num_replicas)
+        
+        # 初始化副本
+        if initial_partition is None:
+            replicas = [self._generate_random_partition(graph) for _ in range(num_replicas)]
+        else:
+            replicas = [copy.deepcopy(initial_partition) for _ in range(num_replicas)]
+        replicas = [self._repair_partition(replica) for replica in replicas]
+        costs = [cost_function(graph, replica) for replica in replicas]
+        
+        best_index = int(np.argmin(costs))
+        best_partition = copy.deepcopy(replicas[best_index])
+        best_cost = costs[best_index]
+        
+        temperature = self.config.initial_temperature
+        
+        # 记录历史（每个温度步记录种群平均成本）
+        cost_history = [float(np.mean(costs))]
+        temperature_history = [temperature]
+        
+        executor = self._create_executor(graph, cost_function)
+        # 独立的种子序列，保证串行与并行执行结果一致
+        seed_generator = random.Random(random.getrandbits(32))
+        iteration = 0
+        
+        try:
+            while (temperature > self.config.final_temperature and 
+                   iteration < self.config.max_iterations):
+                
+                # 所有副本在当前温度下扫描
+                seeds = [seed_generator.getrandbits(32) for _ in range(num_replicas)]
+                if executor is not None:
+                    sweeps = list(executor.map(
+                        _worker_replica_sweep, replicas, costs, [temperature] * num_replicas, seeds
+                    ))
+                else:
+                    sweeps = [_replica_sweep(self, graph, cost_function, replica, cost, temperature, seed)
+                              for replica, cost, seed in zip(replicas, costs, seeds)]
+                
+                replicas = [sweep[0] for sweep in sweeps]
+                costs = [sweep[1] for sweep in sweeps]
+                
+                # 更新最优解
+                for _, _, sweep_best_partition, sweep_best_cost in sweeps:
+                    if sweep_best_cost < best_cost:
+                        best_partition = sweep_best_partition
+                        best_cost = sweep_best_cost
+                
+                iteration += self.config.iterations_per_temp
+                
+                # 降温并按Boltzmann权重重采样
+                new_temperature = temperature * self.config.cooling_rate
+                replicas, costs = self._resample(replicas, costs, temperature, new_temperature)
+                temperature = new_temperature
+                
+                cost_history.append(float(np.mean(costs)))
+                temperature_history.append(temperature)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+        
+        # 确定收敛原因
+        if temperature <= self.config.final_temperature:
+            convergence_reason = "温度达到终止条件"
+        else:
+            convergence_reason = "达到最大迭代次数"
+        
+        return AnnealingResult(
+            best_partition=best_partition,
+            best_cost=best_cost,
+            cost_history=cost_history,
+            temperature_history=temperature_history,
+            iteration_count=iteration,
+            convergence_reason=convergence_reason
+        )
+    
+    def _metropolis_sweep(self, graph: nx.DiGraph, cost_function: Callable,
+                          partition: Dict[str, int], cost: float,
+                          temperature: float) -> Tuple[Dict[str, int], float, Dict[str, int], float]:
+        """固定温度下的Metropolis扫描，返回(当前分区, 当前成本, 扫描内最优分区, 最优成本)"""
+        current_partition = partition
+        current_cost = cost
+        best_partition = partition
+        best_cost = cost
+        if self.constraint_checker is not None:
+            self.constraint_checker.set_partition(partition)
+        
+        for _ in range(self.config.iterations_per_temp):
+            new_partition = self._generate_neighbor(current_partition, graph)
+            if self._violates_constraints(new_partition):
+                new_cost = float('inf')
+            else:
+                new_cost = cost_function(graph, new_partition)
+            delta_cost = new_cost - current_cost
+            
+            if delta_cost < 0 or self._accept_probability(delta_cost, temperature):
+                self._commit_move(new_partition)
+                current_partition = new_partition
+                current_cost = new_cost
+                if new_cost < best_cost:
+                    best_partition = new_partition
+                    best_cost = new_cost
+        
+        return current_partition, current_cost, best_partition, best_cost
+    
+    def _resample(self, replicas: List[Dict[str, int]], costs: List[float],
+                  temperature: float, new_temperature: float) -> Tuple[List[Dict[str, int]], List[float]]:
+        """按Boltzmann重加权因子 exp(-(1/T' - 1/T)·E) 重采样副本"""
+        if new_temperature <= 0 or temperature <= 0:
+            return replicas, costs
+        
+        energies = np.asarray(costs, dtype=float)
+        beta_step = 1.0 / new_temperature - 1.0 / temperature
+        # 减去最小能量避免指数溢出
+        weights = np.exp(-beta_step * (energies - energies.min()))
+        weights /= weights.sum()
+        
+        counts = np.random.multinomial(len(replicas), weights)
+        new_replicas = []
+        new_costs = []
+        for index, count in enumerate(counts):
+            for copy_index in range(count):
+                # 第一个副本直接复用，其余复制
+                replica = replicas[index] if copy_index == 0 else copy.deepcopy(replicas[index])
+                new_replicas.append(replica)
+                new_costs.append(costs[index])
+        
+        return new_replicas, new_costs
+    
+    def _create_executor(self, graph: nx.DiGraph, cost_function: Callable) -> Optional[ProcessPoolExecutor]:
+        """创建工作进程池，退火器、图与成本函数在进程启动时一并传入（保持图与成本函数的对象关系）；
+        成本函数不可序列化时退化为串行执行"""
+        if self.config.num_workers <= 1:
+            return None
+        
+        try:
+            pickle.dumps(cost_function)
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            print(f"成本函数无法在进程间传递，种群退火改为串行执行: {e}")
+            return None
+        
+        return ProcessPoolExecutor(max_workers=self.config.num_workers, initializer=_init_replica_worker,
+                                   initargs=(self, graph, cost_function))
+
+
 def main():
     """测试函数"""
     # 创建示例图
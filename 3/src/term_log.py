@@ -0,0 +1,204 @@
+"""
+成本项日志模块
+以列式方式（NumPy memmap）记录每个已评估分区的成本项向量，
+更换成本权重后只需一次矩阵-向量乘积即可对已探索的全部分区重新排序，
+并以前k个分区热启动新的搜索
+"""
+
+import os
+import json
+import numpy as np
+from typing import Dict, List, Tuple, Optional, Any
+
+from cost_function import CostMetrics, CostWeights
+
+
+# 内置成本项及其对应的权重名称（扩展成本项按CostFunction.term_names()追加在后）
+TERM_NAMES = ('area_cost', 'delay_cost', 'error_cost', 'complexity_cost', 'interface_cost')
+WEIGHT_NAMES = ('area_weight', 'delay_weight', 'error_weight', 'complexity_weight', 'interface_weight')
+LOG_VERSION = 1
+
+
+class TermLog:
+    """已评估分区的成本项列式存储"""
+
+    def __init__(self, nodes: List[str], directory: Optional[str] = None, initial_capacity: int = 1024,
+                 term_names: Optional[List[str]] = None):
+        self.nodes = list(nodes)
+        # 列名与CostFunction.term_names()一致：内置成本项在前，启用的扩展成本项在后
+        self.term_names = list(term_names or TERM_NAMES)
+        if self.term_names[:len(TERM_NAMES)] != list(TERM_NAMES):
+            raise ValueError(f"成本项日志的前{len(TERM_NAMES)}列须为内置成本项: {self.term_names}")
+        self.node_index = {node: i for i, node in enumerate(self.nodes)}
+        self.directory = directory
+        self.count = 0
+        self._seen = set()
+
+        capacity = max(1, initial_capacity)
+        if directory and self._load():
+            return
+        self._allocate(capacity)
+
+    def __len__(self) -> int:
+        return self.count
+
+    @property
+    def capacity(self) -> int:
+        return len(self.terms)
+
+    def record(self, partition: Dict[str, int], metrics: CostMetrics) -> bool:
+        """记录一次评估，重复分区、节点或成本项不匹配时跳过"""
+        if len(partition) != len(self.nodes):
+            return False
+        try:
+            row = np.fromiter((partition[node] for node in self.nodes), dtype=np.int8, count=len(self.nodes))
+            values = [getattr(metrics, name) for name in TERM_NAMES] + \
+                     [metrics.extra_costs[name] for name in self.term_names[len(TERM_NAMES):]]
+        except KeyError:
+            return False
+
+        key = row.tobytes()
+        if key in self._seen:
+            return False
+        self._seen.add(key)
+
+        if self.count == self.capacity:
+            self._allocate(self.capacity * 2)
+        self.terms[self.count] = values
+        self.partitions[self.count] = row
+        self.count += 1
+        return True
+
+    def costs(self, weights: CostWeights, extra_weights: Optional[Dict[str, float]] = None) -> np.ndarray:
+        """按给定权重计算全部已记录分区的总成本（一次矩阵-向量乘积）
+
+        extra_weights 为扩展成本项的权重，日志中的每个扩展成本项都必须给出
+        """
+        extra_weights = extra_weights or {}
+        missing = [name for name in self.term_names[len(TERM_NAMES):] if name not in extra_weights]
+        if missing:
+            raise KeyError(f"缺少扩展成本项的权重: {missing}")
+        weight_vector = np.array([getattr(weights, name) for name in WEIGHT_NAMES] +
+                                 [extra_weights[name] for name in self.term_names[len(TERM_NAMES):]])
+        return self.terms[:self.count] @ weight_vector
+
+    def rerank(self, weights: CostWeights, top_k: int = 10,
+               extra_weights: Optional[Dict[str, float]] = None) -> List[Tuple[float, Dict[str, int]]]:
+        """按新权重重新排序，返回成本最低的前k个 (成本, 分区)"""
+        if self.count == 0:
+            return []
+        costs = self.costs(weights, extra_weights)
+        top_k = min(top_k, self.count)
+        best = np.argpartition(costs, top_k - 1)[:top_k]
+        best = best[np.argsort(costs[best], kind='stable')]
+        return [(float(costs[i]), self.partition(i)) for i in best]
+
+    def partition(self, index: int) -> Dict[str, int]:
+        """读取第index条记录的分区"""
+        return dict(zip(self.nodes, self.partitions[index].tolist()))
+
+    def flush(self):
+        """将数据与元信息写入磁盘"""
+        if not self.directory:
+            return
+        self.terms.flush()
+        self.partitions.flush()
+        with open(os.path.join(self.directory, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': LOG_VERSION,
+                'terms': self.term_names,
+                'nodes': self.nodes,
+                'count': self.count,
+                'capacity': self.capacity
+            }, f, ensure_ascii=False)
+
+    def _paths(self) -> Tuple[str, str]:
+        return (os.path.join(self.directory, 'terms.f64'),
+                os.path.join(self.directory, 'partitions.i8'))
+
+    def _allocate(self, capacity: int):
+        """分配（或扩容）存储，保留已有记录"""
+        old_terms = getattr(self, 'terms', None)
+        old_partitions = getattr(self, 'partitions', None)
+        if old_terms is not None:
+            old_terms = np.array(old_terms[:self.count])
+            old_partitions = np.array(old_partitions[:self.count])
+
+        shape = (capacity, len(self.term_names))
+        if self.directory:
+            os.makedirs(self.directory, exist_ok=True)
+            terms_path, partitions_path = self._paths()
+            # 先释放旧映射，再以新大小重新映射文件
+            self.terms = self.partitions = None
+            self.terms = np.memmap(terms_path, dtype=np.float64, mode='w+', shape=shape)
+            self.partitions = np.memmap(partitions_path, dtype=np.int8, mode='w+',
+                                        shape=(capacity, max(1, len(self.nodes))))
+        else:
+            self.terms = np.zeros(shape)
+            self.partitions = np.zeros((capacity, max(1, len(self.nodes))), dtype=np.int8)
+
+        if old_terms is not None:
+            self.terms[:self.count] = old_terms
+            self.partitions[:self.count] = old_partitions
+
+    def _load(self) -> bool:
+        """加载已有日志；节点集合或版本不一致时返回False（将重建）"""
+        meta_path = os.path.join(self.directory, 'meta.json')
+        if not os.path.exists(meta_path):
+            return False
+        try:
+            with open(meta_path, 'r', encoding='utf-8') as f:
+                meta = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return False
+        if (meta.get('version') != LOG_VERSION or meta.get('terms') != self.term_names or
+                meta.get('nodes') != self.nodes):
+            return False
+
+        terms_path, partitions_path = self._paths()
+        capacity = meta['capacity']
+        self.terms = np.memmap(terms_path, dtype=np.float64, mode='r+', shape=(capacity, len(self.term_names)))
+        self.partitions = np.memmap(partitions_path, dtype=np.int8, mode='r+',
+                                    shape=(capacity, max(1, len(self.nodes))))
+        self.count = meta['count']
+        self._seen = {self.partitions[i].tobytes() for i in range(self.count)}
+        return True
+
+    def analyze(self) -> Dict[str, Any]:
+        """统计日志"""
+        return {
+            'entries': self.count,
+            'capacity': self.capacity,
+            'nodes': len(self.nodes),
+            'bytes': int(self.terms.nbytes + self.partitions.nbytes)
+        }
+
+
+def main():
+    """测试函数"""
+    import networkx as nx
+    from cost_function import CostFunction
+
+    graph = nx.DiGraph()
+    graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D')])
+    nodes = list(graph.nodes())
+
+    cost_func = CostFunction()
+    log = TermLog(nodes)
+    cost_func.set_term_log(log)
+
+    # 穷举全部分区并记录成本项
+    for mask in range(2 ** len(nodes)):
+        partition = {node: (mask >> i) & 1 for i, node in enumerate(nodes)}
+        onn = [n for n, p in partition.items() if p == 1]
+        cost_func.calculate_total_cost(graph, partition, onn, [n for n in nodes if n not in onn])
+
+    print("成本项日志结果:")
+    print(f"  统计: {log.analyze()}")
+    for weights in (CostWeights(), CostWeights(area_weight=0.0, interface_weight=1.0)):
+        cost, partition = log.rerank(weights, top_k=1)[0]
+        print(f"  权重 {weights}: 最优成本 {cost:.4f}, 分区 {partition}")
+
+
+if __name__ == "__main__":
+    main()
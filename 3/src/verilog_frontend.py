@@ -0,0 +1,373 @@
+"""
+Verilog前端模块
+在进程内调用pyverilog的VerilogDataflowAnalyzer，直接由 getTerms() / getBinddict()
+的数据流对象构建DFG，省去 tostr() 写文本再用正则解析回来的往返；
+同一次分析结果可输出文本DFG、DOT/PNG数据流图和分区器使用的图
+"""
+
+import os
+import time
+import shutil
+import networkx as nx
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+
+from bind_tree import TreeNode
+from dfg_parser import DFGParser
+from hierarchy import HierarchicalDFG
+
+try:
+    from pyverilog.dataflow.dataflow_analyzer import VerilogDataflowAnalyzer
+    PYVERILOG_AVAILABLE = True
+except ImportError:
+    VerilogDataflowAnalyzer = None
+    PYVERILOG_AVAILABLE = False
+
+
+@dataclass
+class FrontendConfig:
+    """Verilog前端配置参数"""
+    include_paths: List[str] = field(default_factory=list)
+    defines: List[str] = field(default_factory=list)    # NAME 或 NAME=VALUE
+    dfg_text_file: Optional[str] = None                 # 可选：同时写出文本DFG
+    cache_dir: Optional[str] = '.cache/pyverilog'       # PLY解析表与预处理缓存目录，None表示不缓存
+
+
+@dataclass
+class DotOptions:
+    """DOT数据流图生成参数（对应VerilogGraphGenerator.generate）"""
+    signals: List[str] = field(default_factory=list)  # 目标信号，默认为全部被赋值的信号
+    walk: bool = False
+    identical: bool = False
+    step: int = 1
+    reorder: bool = False
+    delay: bool = False
+
+
+@dataclass
+class DataflowResult:
+    """一次数据流分析的结果（pyverilog对象）"""
+    topmodule: str
+    terms: Dict[Any, Any]
+    binddict: Dict[Any, List[Any]]
+    instances: List[Tuple[Any, Any]]
+    directives: List[Any]
+    analysis_time: float
+    verilog_files: List[str] = field(default_factory=list)
+    _resolved: Optional[Tuple[Any, Any, Any]] = field(default=None, repr=False)
+
+    def resolved(self) -> Tuple[Any, Any, Any]:
+        """常量解析结果 (resolved_terms, resolved_binddict, constlist)，首次调用时计算"""
+        if self._resolved is None:
+            from pyverilog.dataflow.optimizer import VerilogDataflowOptimizer
+            optimizer = VerilogDataflowOptimizer(self.terms, self.binddict)
+            optimizer.resolveConstant()
+            self._resolved = (optimizer.getResolvedTerms(), optimizer.getResolvedBinddict(),
+                              optimizer.getConstlist())
+        return self._resolved
+
+    def sorted_terms(self) -> List[Any]:
+        """按名称排序的Term（与文本DFG的输出顺序一致）"""
+        return [term for _, term in sorted(self.terms.items(), key=lambda item: str(item[0]))]
+
+    def sorted_binds(self) -> List[Any]:
+        """按目标名排序的Bind（与文本DFG的输出顺序一致）"""
+        return [bind for _, binds in sorted(self.binddict.items(), key=lambda item: str(item[0]))
+                for bind in binds]
+
+
+def tree_from_dataflow(root) -> TreeNode:
+    """将pyverilog的DFNode树转换为TreeNode（显式栈，不受递归深度限制）"""
+    converted = {}
+    stack = [(root, False)]
+    while stack:
+        node, expanded = stack.pop()
+        if id(node) in converted:
+            continue
+        fields = _dataflow_fields(node)
+        if not expanded and fields:
+            stack.append((node, True))
+            stack.extend((child, False) for children in fields.values() for child in children)
+            continue
+        kind, value = _dataflow_label(node)
+        converted[id(node)] = TreeNode(
+            kind=kind,
+            value=value,
+            fields={label: [converted[id(child)] for child in children] for label, children in fields.items()}
+        )
+    return converted[id(root)]
+
+
+def _dataflow_fields(node) -> Dict[str, List[Any]]:
+    """DFNode的子节点，字段名与 tostr() 输出一致"""
+    kind = type(node).__name__
+    if kind in ('DFOperator', 'DFConcat', 'DFSyscall'):
+        return {'Next': list(node.nextnodes)}
+    if kind == 'DFPartselect':
+        return {'Var': [node.var], 'MSB': [node.msb], 'LSB': [node.lsb]}
+    if kind == 'DFPointer':
+        return {'Var': [node.var], 'PTR': [node.ptr]}
+    if kind == 'DFBranch':
+        branches = (('Cond', node.condnode), ('True', node.truenode), ('False', node.falsenode))
+        return {label: [child] for label, child in branches if child is not None}
+    if kind == 'DFDelay':
+        return {'Next': [node.nextnode]} if node.nextnode is not None else {}
+    return {}
+
+
+def _dataflow_label(node) -> Tuple[str, Optional[str]]:
+    """DFNode对应的 (节点类型, 值)"""
+    kind = type(node).__name__
+    if kind == 'DFTerminal':
+        return 'Terminal', '.'.join(str(n) for n in node.name)
+    if kind in ('DFIntConst', 'DFFloatConst', 'DFStringConst'):
+        return kind[2:], str(node.value)
+    if kind in ('DFEvalValue', 'DFUndefined', 'DFHighImpedance'):
+        # 求值后的常量按Verilog常量文本（如 4'd3）处理
+        return 'IntConst', node.tostr().strip('()-')
+    if kind == 'DFOperator':
+        return 'Operator', node.operator
+    if kind == 'DFSyscall':
+        return 'Syscall', node.syscall
+    return kind[2:] if kind.startswith('DF') else kind, None
+
+
+def _const_text(node) -> Optional[str]:
+    """Term的msb/lsb常量文本"""
+    if node is None:
+        return None
+    kind, value = _dataflow_label(node)
+    return value if kind == 'IntConst' else None
+
+
+class VerilogFrontend:
+    """进程内Verilog到DFG的前端"""
+
+    def __init__(self, config: FrontendConfig = None):
+        self.config = config or FrontendConfig()
+        self.stats: Dict[str, float] = {}
+        self.cache_stats: Dict[str, int] = {}
+
+    def analyze(self, verilog_files: List[str], topmodule: str) -> DataflowResult:
+        """运行pyverilog数据流分析"""
+        if not PYVERILOG_AVAILABLE:
+            raise ImportError("Verilog前端需要pyverilog（pip install pyverilog）")
+        for path in verilog_files:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"Verilog文件不存在: {path}")
+
+        start_time = time.time()
+        if self.config.cache_dir:
+            from frontend_cache import FrontendCache
+            cache = FrontendCache(self.config.cache_dir)
+            analyzer = cache.create_analyzer(list(verilog_files), topmodule,
+                                             self.config.include_paths, self.config.defines)
+            self.cache_stats = dict(cache.stats)
+        else:
+            analyzer = VerilogDataflowAnalyzer(list(verilog_files), topmodule,
+                                               preprocess_include=self.config.include_paths,
+                                               preprocess_define=self.config.defines)
+        analyzer.generate()
+        directives = sorted(analyzer.get_directives(), key=lambda x: str(x)) \
+            if hasattr(analyzer, 'get_directives') else []
+        return DataflowResult(
+            topmodule=topmodule,
+            terms=analyzer.getTerms(),
+            binddict=analyzer.getBinddict(),
+            instances=sorted(analyzer.getInstances(), key=lambda x: str(x[1])),
+            directives=directives,
+            analysis_time=time.time() - start_time,
+            verilog_files=list(verilog_files)
+        )
+
+    def build_graph(self, result: DataflowResult, parser: DFGParser = None) -> nx.DiGraph:
+        """由数据流对象直接构建DFG，parser可传入带选项的解析器"""
+        parser = parser or DFGParser()
+        start_time = time.time()
+
+        for path, module in result.instances:
+            parser.add_instance(str(path), str(module))
+        for term in result.sorted_terms():
+            parser.add_term(str(term.name), set(term.termtype), _const_text(term.msb), _const_text(term.lsb))
+
+        # 与文本解析一致：只取整体赋值（无msb/lsb/ptr）的Bind
+        bind_count = 0
+        for bind in result.sorted_binds():
+            if bind.tree is None or bind.msb is not None or bind.lsb is not None or bind.ptr is not None:
+                continue
+            parser.add_bind(str(bind.dest), tree_from_dataflow(bind.tree))
+            bind_count += 1
+
+        graph = parser.build()
+        self.stats = {
+            'analysis_seconds': result.analysis_time,
+            'build_seconds': time.time() - start_time,
+            'terms': len(result.terms),
+            'binds': bind_count
+        }
+        parser.parse_stats = dict(self.stats)
+        return graph
+
+    def build_hierarchy(self, result: DataflowResult, hierarchy: HierarchicalDFG = None,
+                        flatten: Optional[List[str]] = None) -> nx.DiGraph:
+        """由数据流对象构建层次化DFG：每个唯一模块只转换一次语法树，子实例为黑盒超节点"""
+        hierarchy = hierarchy or HierarchicalDFG()
+        start_time = time.time()
+
+        for path, module in result.instances:
+            hierarchy.add_instance(str(path), str(module))
+        for term in result.sorted_terms():
+            hierarchy.add_term(str(term.name), set(term.termtype), _const_text(term.msb), _const_text(term.lsb))
+
+        binds = [bind for bind in result.sorted_binds()
+                 if bind.tree is not None and bind.msb is None and bind.lsb is None and bind.ptr is None]
+        # 先登记全部Bind的文本划分模板，再只转换模板实例的语法树
+        for bind in binds:
+            hierarchy.note_bind(str(bind.dest), bind.tree.tostr())
+        bind_count = 0
+        skipped = 0
+        for bind in binds:
+            if hierarchy.needs_bind(str(bind.dest)):
+                hierarchy.add_bind(str(bind.dest), tree_from_dataflow(bind.tree))
+                bind_count += 1
+            else:
+                skipped += 1
+
+        graph = hierarchy.build(flatten)
+        self.stats = {
+            'analysis_seconds': result.analysis_time,
+            'build_seconds': time.time() - start_time,
+            'terms': len(result.terms),
+            'binds': bind_count
+        }
+        hierarchy.parse_stats.update(self.stats, skipped_binds=skipped)
+        return graph
+
+    def write_dfg_text(self, result: DataflowResult, output_path: str):
+        """写出文本DFG（与 generate_dfg.py 的格式相同）"""
+        directory = os.path.dirname(os.path.abspath(output_path))
+        os.makedirs(directory, exist_ok=True)
+        with open(output_path, 'w', encoding='utf-8') as fout:
+            fout.write('Directive:\n')
+            for directive in result.directives:
+                fout.write(str(directive) + '\n')
+            fout.write('Instance:\n')
+            for module, instname in result.instances:
+                fout.write(str((module, instname)) + '\n')
+            fout.write('Term:\n')
+            for term in result.sorted_terms():
+                fout.write(term.tostr() + '\n')
+            fout.write('Bind:\n')
+            for bind in result.sorted_binds():
+                fout.write(bind.tostr() + '\n')
+
+    def write_dot(self, result: DataflowResult, output_dot: str, output_png: Optional[str] = None,
+                  options: DotOptions = None) -> Optional[str]:
+        """由分析结果生成DOT数据流图（可选转为PNG），返回DOT文本；需要pygraphviz"""
+        from pyverilog.dataflow.graphgen import VerilogGraphGenerator
+
+        options = options or DotOptions()
+        resolved_terms, resolved_binddict, constlist = result.resolved()
+        generator = VerilogGraphGenerator(result.topmodule, result.terms, result.binddict,
+                                          resolved_terms, resolved_binddict, constlist,
+                                          result.verilog_files[0] if result.verilog_files else '')
+
+        # 提升可读性：设置图、节点、边的样式
+        graph = generator.graph
+        graph.graph_attr.update(rankdir='LR', splines='spline', concentrate='true', bgcolor='white')
+        graph.node_attr.update(shape='box', style='rounded,filled', fillcolor='white', color='black',
+                               fontname='Helvetica', fontsize='10')
+        graph.edge_attr.update(color='#555555', arrowsize='0.6')
+
+        for signal in options.signals or self._default_signals(result):
+            # 未带作用域的信号名加上顶层模块前缀（t0 -> top.t0）
+            signal = signal if '.' in signal else f"{result.topmodule}.{signal}"
+            generator.generate(signal, walk=options.walk, identical=options.identical,
+                               step=options.step, do_reorder=options.reorder, delay=options.delay)
+
+        directory = os.path.dirname(os.path.abspath(output_dot))
+        os.makedirs(directory, exist_ok=True)
+        graph.write(output_dot)
+
+        if output_png:
+            if shutil.which('dot') is None:
+                print('Warning: graphviz 未安装或找不到 dot，可通过 `sudo apt install graphviz` 安装。')
+            else:
+                os.makedirs(os.path.dirname(os.path.abspath(output_png)), exist_ok=True)
+                try:
+                    graph.layout(prog='dot')
+                    graph.draw(output_png)
+                except Exception as e:
+                    print(f'Warning: 生成 PNG 失败: {e}')
+        return graph.string()
+
+    @staticmethod
+    def _default_signals(result: DataflowResult) -> List[str]:
+        """默认目标信号：被赋值的线网/寄存器/端口，不含参数、genvar和函数"""
+        from pyverilog.utils import signaltype
+
+        signals = []
+        for name in result.binddict.keys():
+            term = result.terms.get(name)
+            if term is None:
+                continue
+            termtype = term.termtype
+            if signaltype.isParameter(termtype) or signaltype.isLocalparam(termtype) or \
+                    signaltype.isGenvar(termtype) or signaltype.isFunction(termtype):
+                continue
+            if signaltype.isWire(termtype) or signaltype.isReg(termtype) or signaltype.isInput(termtype) or \
+                    signaltype.isOutput(termtype) or signaltype.isInout(termtype) or signaltype.isInteger(termtype):
+                signals.append(str(name))
+        return signals or [str(name) for name in result.binddict.keys()]
+
+    def emit(self, result: DataflowResult, dfg_text_file: Optional[str] = None, dot_file: Optional[str] = None,
+             png_file: Optional[str] = None, dot_options: DotOptions = None,
+             parser: DFGParser = None) -> Dict[str, Any]:
+        """由同一次分析结果输出所需的各种视图，返回 {视图: 路径或图} 及各步耗时"""
+        outputs: Dict[str, Any] = {'timings': {'analysis': result.analysis_time}}
+
+        if dfg_text_file:
+            start_time = time.time()
+            self.write_dfg_text(result, dfg_text_file)
+            outputs['text'] = dfg_text_file
+            outputs['timings']['text'] = time.time() - start_time
+
+        if dot_file or png_file:
+            start_time = time.time()
+            dot_file = dot_file or os.path.splitext(png_file)[0] + '.dot'
+            self.write_dot(result, dot_file, png_file, dot_options)
+            outputs['dot'] = dot_file
+            if png_file and shutil.which('dot') is not None and os.path.exists(png_file):
+                outputs['png'] = png_file
+            outputs['timings']['dot'] = time.time() - start_time
+
+        if parser is not None:
+            outputs['graph'] = self.build_graph(result, parser)
+            outputs['timings']['graph'] = self.stats['build_seconds']
+        return outputs
+
+    def run(self, verilog_files: List[str], topmodule: str, parser: DFGParser = None) -> nx.DiGraph:
+        """分析Verilog并构建DFG；配置了dfg_text_file时同时写出文本DFG"""
+        result = self.analyze(verilog_files, topmodule)
+        return self.emit(result, dfg_text_file=self.config.dfg_text_file, parser=parser or DFGParser())['graph']
+
+
+def main():
+    """测试函数"""
+    if not PYVERILOG_AVAILABLE:
+        print("未安装pyverilog，跳过Verilog前端示例")
+        return
+
+    frontend = VerilogFrontend()
+    parser = DFGParser()
+    graph = frontend.run(['verilogcode/4004.v'], 'alu', parser)
+
+    print("Verilog前端结果:")
+    for key, value in frontend.stats.items():
+        print(f"  {key}: {value}")
+    print(f"  节点类型统计: {parser.get_node_statistics()}")
+    print(f"  图结构: {len(graph.nodes)} 个节点, {len(graph.edges)} 条边")
+
+
+if __name__ == "__main__":
+    main()
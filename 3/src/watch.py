@@ -0,0 +1,341 @@
+"""
+监视模式模块
+轮询Verilog源文件（或文本DFG）的修改时间，变化后重新构建DFG并与当前图比较，
+将新增/删除/修改的节点和边原地打补丁到现有图上；随后以上一次的最优分区热启动，
+只在受影响节点的邻域内做模拟退火，重新生成分区结果与接口
+"""
+
+import os
+import time
+import networkx as nx
+from collections import Counter
+from typing import Dict, List, Optional, Set, Tuple, Any
+from dataclasses import dataclass, field
+
+from dfg_parser import DFGParser, index_graph
+
+
+# 参与比较的节点属性（对应Term的位宽与Bind的运算符、操作数）
+NODE_FIELDS = ('operator_type', 'is_linear', 'inputs', 'outputs', 'bit_width', 'value')
+
+
+@dataclass
+class WatchConfig:
+    """监视模式配置参数"""
+    poll_interval: float = 1.0        # 轮询间隔（秒）
+    debounce: float = 0.5             # 文件连续变化时等待其稳定的时间（秒）
+    neighborhood_hops: int = 2        # 受影响节点向外扩展的跳数
+    max_affected_ratio: float = 0.5   # 受影响节点超过该比例时在全图上搜索
+    iterations_per_node: int = 20     # 局部搜索的迭代预算：每个可移动节点的迭代数（不超过max_iterations）
+    # 增量重新分区使用的模拟退火参数（覆盖 optimization.simulated_annealing）
+    annealing: Dict[str, Any] = field(default_factory=lambda: {
+        'initial_temperature': 0.05,
+        'final_temperature': 0.0001,
+        'cooling_rate': 0.9,
+        'iterations_per_temp': 20,
+        'max_iterations': 2000
+    })
+    visualize: bool = False
+
+
+@dataclass
+class GraphDelta:
+    """两次构建的DFG之间的差异"""
+    added_nodes: List[str] = field(default_factory=list)
+    removed_nodes: List[str] = field(default_factory=list)
+    changed_nodes: List[str] = field(default_factory=list)
+    added_edges: List[Tuple[str, str]] = field(default_factory=list)
+    removed_edges: List[Tuple[str, str]] = field(default_factory=list)
+
+    @property
+    def is_empty(self) -> bool:
+        return not (self.added_nodes or self.removed_nodes or self.changed_nodes or
+                    self.added_edges or self.removed_edges)
+
+    def touched_nodes(self) -> Set[str]:
+        """新图中直接受影响的节点：新增、修改的节点和增删边的端点"""
+        touched = set(self.added_nodes) | set(self.changed_nodes)
+        for source, target in self.added_edges + self.removed_edges:
+            touched.update((source, target))
+        return touched - set(self.removed_nodes)
+
+    def summary(self) -> str:
+        return (f"节点 +{len(self.added_nodes)} -{len(self.removed_nodes)} ~{len(self.changed_nodes)}, "
+                f"边 +{len(self.added_edges)} -{len(self.removed_edges)}")
+
+
+@dataclass
+class WatchUpdate:
+    """一次增量更新的结果"""
+    delta: GraphDelta
+    changed_files: List[str]
+    affected_nodes: int               # 搜索图中参与搜索的节点数（0表示无需重新分区）
+    search_nodes: int
+    previous_cost: Optional[float]
+    best_cost: Optional[float]
+    seconds: float
+
+
+def tree_signatures(parser: DFGParser) -> Dict[str, Tuple]:
+    """各节点赋值树的结构签名（先序的类型、值与字段），用于发现根运算符以下的修改"""
+    return {
+        name: tuple((node.kind, node.value, tuple((label, len(children)) for label, children in node.fields.items()))
+                    for node in root.walk())
+        for name, root in parser.operator_trees.items()
+    }
+
+
+def diff_graphs(old: nx.DiGraph, new: nx.DiGraph, old_trees: Optional[Dict[str, Tuple]] = None,
+                new_trees: Optional[Dict[str, Tuple]] = None) -> GraphDelta:
+    """比较两张DFG的节点属性与边；给出赋值树签名时，树有变化的节点也视为修改"""
+    old_trees = old_trees or {}
+    new_trees = new_trees or {}
+    delta = GraphDelta()
+    for node, data in new.nodes(data=True):
+        if node not in old:
+            delta.added_nodes.append(node)
+        elif any(old.nodes[node].get(name) != data.get(name) for name in NODE_FIELDS) or \
+                (node in old_trees and node in new_trees and old_trees[node] != new_trees[node]):
+            delta.changed_nodes.append(node)
+    delta.removed_nodes = [node for node in old if node not in new]
+    delta.added_edges = [edge for edge in new.edges() if not old.has_edge(*edge)]
+    delta.removed_edges = [edge for edge in old.edges() if not new.has_edge(*edge)]
+    return delta
+
+
+def apply_delta(graph: nx.DiGraph, new_graph: nx.DiGraph, delta: GraphDelta) -> nx.DiGraph:
+    """将差异原地应用到graph，未变化节点的顺序与属性保持不变"""
+    graph.remove_nodes_from(delta.removed_nodes)
+    graph.remove_edges_from(delta.removed_edges)
+    for node in delta.added_nodes + delta.changed_nodes:
+        graph.add_node(node, **new_graph.nodes[node])
+    graph.add_edges_from(delta.added_edges)
+    # 图级属性（如层次化DFG的实例信息）取新图的
+    graph.graph.update({key: value for key, value in new_graph.graph.items()
+                        if key not in ('node_ids', 'bit_widths', 'edge_arrays', 'version')})
+
+    # 与DFGParser相同的稠密编号与位宽数组，更新版本号使边数组与成本项上下文失效
+    index_graph(graph)
+    return graph
+
+
+def neighborhood(graph: nx.DiGraph, seeds: Set[str], hops: int) -> Set[str]:
+    """种子节点沿无向邻接扩展hops跳后的节点集合"""
+    region = {node for node in seeds if node in graph}
+    frontier = set(region)
+    for _ in range(hops):
+        frontier = {neighbor for node in frontier
+                    for neighbor in list(graph.successors(node)) + list(graph.predecessors(node))} - region
+        if not frontier:
+            break
+        region |= frontier
+    return region
+
+
+def warm_start_partition(search_graph: nx.DiGraph, previous: Dict[str, int], reduction=None) -> Dict[str, int]:
+    """由原图上的上一次分区得到搜索图上的初始分区
+
+    超节点取成员中的多数分区；新节点取已分配邻居的多数分区，没有时为0
+    """
+    partition = {}
+    unassigned = []
+    for node in search_graph.nodes():
+        members = reduction.members.get(node, [node]) if reduction else [node]
+        votes = [previous[member] for member in members if member in previous]
+        if votes:
+            partition[node] = Counter(votes).most_common(1)[0][0]
+        else:
+            unassigned.append(node)
+
+    for node in unassigned:
+        votes = [partition[neighbor] for neighbor in
+                 list(search_graph.predecessors(node)) + list(search_graph.successors(node))
+                 if neighbor in partition]
+        partition[node] = Counter(votes).most_common(1)[0][0] if votes else 0
+    return partition
+
+
+class DesignWatcher:
+    """监视设计文件并增量重新分区"""
+
+    def __init__(self, partitioner, config: WatchConfig = None):
+        # partitioner为 main.VerilogPartitioner
+        self.partitioner = partitioner
+        self.config = config or WatchConfig()
+        self.updates: List[WatchUpdate] = []
+        self._snapshot: Dict[str, Tuple[int, int]] = {}
+        self._trees: Dict[str, Tuple] = {}
+
+    def watched_files(self) -> List[str]:
+        """Verilog前端开启时监视源文件，否则监视文本DFG"""
+        settings = self.partitioner.config.get('verilog_frontend', {})
+        if settings.get('enabled', False):
+            return list(settings.get('verilog_files') or [])
+        return [self.partitioner.config['dfg_file']]
+
+    def snapshot(self) -> Dict[str, Tuple[int, int]]:
+        """各文件的 (修改时间, 大小)，不存在的文件记为 (0, -1)"""
+        snapshot = {}
+        for path in self.watched_files():
+            try:
+                stat = os.stat(path)
+                snapshot[path] = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                snapshot[path] = (0, -1)
+        return snapshot
+
+    def changed_files(self) -> List[str]:
+        current = self.snapshot()
+        return sorted(path for path, state in current.items() if self._snapshot.get(path) != state)
+
+    def start(self):
+        """首次完整运行：解析、优化并保存结果"""
+        self._parse()
+        self._trees = tree_signatures(self.partitioner.dfg_parser)
+        self.partitioner.optimize_partition()
+        self.partitioner.save_results()
+        if self.config.visualize:
+            self.partitioner.visualize_results()
+        self._snapshot = self.snapshot()
+
+    def update(self, changed_files: Optional[List[str]] = None) -> WatchUpdate:
+        """重新构建DFG、打补丁并在受影响邻域内重新分区"""
+        start_time = time.time()
+        partitioner = self.partitioner
+        changed_files = changed_files if changed_files is not None else self.changed_files()
+        self._snapshot = self.snapshot()
+        graph = partitioner.graph
+        previous = dict(partitioner.best_partition or {})
+        previous_cost = partitioner.best_cost
+
+        # 解析器会累积节点，每次使用新的解析器
+        partitioner.dfg_parser = DFGParser(expand_operators=partitioner.dfg_parser.expand_operators)
+        self._parse()
+        new_graph = partitioner.graph
+        trees = tree_signatures(partitioner.dfg_parser)
+        delta = diff_graphs(graph, new_graph, self._trees, trees)
+        self._trees = trees
+
+        # 补丁后的图与新图内容相同，化简结果（按节点名）可直接沿用
+        apply_delta(graph, new_graph, delta)
+        partitioner.graph = graph
+        if partitioner.search_graph is new_graph:
+            partitioner.search_graph = graph
+        if partitioner.reduction:
+            partitioner.reduction.original = graph
+        print(f"\nDFG变化: {delta.summary()}")
+
+        search_graph = partitioner.search_graph
+        if delta.is_empty and previous:
+            update = WatchUpdate(delta, changed_files, 0, len(search_graph), previous_cost, previous_cost,
+                                 time.time() - start_time)
+            self.updates.append(update)
+            print("DFG没有变化，保留上一次的分区")
+            return update
+
+        # 受影响节点映射到搜索图（化简后的超节点），再向外扩展邻域
+        touched = delta.touched_nodes()
+        if partitioner.reduction:
+            touched = {partitioner.reduction.representative.get(node, node) for node in touched}
+        affected = neighborhood(search_graph, touched, self.config.neighborhood_hops)
+        movable = sorted(affected) if len(affected) <= self.config.max_affected_ratio * len(search_graph) else None
+        print(f"重新分区: {len(affected)}/{len(search_graph)} 个受影响节点"
+              f"{'' if movable is not None else '（超过阈值，全图搜索）'}")
+
+        initial_partition = warm_start_partition(search_graph, previous, partitioner.reduction) if previous else None
+        saved = self._use_incremental_optimization(len(movable) if movable is not None else None)
+        try:
+            partitioner.optimize_partition(initial_partition, movable)
+        finally:
+            partitioner.config['optimization'], partitioner.config['pattern_cache'] = saved
+        partitioner.save_results()
+        if self.config.visualize:
+            partitioner.visualize_results()
+
+        update = WatchUpdate(delta, changed_files, len(affected) if movable is not None else len(search_graph),
+                             len(search_graph), previous_cost, partitioner.best_cost, time.time() - start_time)
+        self.updates.append(update)
+        print(f"增量更新完成，耗时 {update.seconds:.2f}秒，成本 {update.best_cost:.6f}"
+              + (f" (上一次 {previous_cost:.6f})" if previous_cost is not None else ""))
+        return update
+
+    def _parse(self):
+        """解析当前设计；绕过图缓存，命中缓存时解析器没有赋值树，无法发现根运算符以下的修改"""
+        graph_cache = self.partitioner.graph_cache
+        self.partitioner.graph_cache = None
+        try:
+            self.partitioner.parse_dfg()
+        finally:
+            self.partitioner.graph_cache = graph_cache
+
+    def _use_incremental_optimization(self, num_movable: Optional[int]):
+        """增量更新只运行热启动的模拟退火，迭代预算随可移动节点数缩放；
+        结构模式缓存会覆盖热启动分区，暂时关闭"""
+        config = self.partitioner.config
+        saved = (config['optimization'], config.get('pattern_cache', {}))
+        optimization = {name: dict(settings, enabled=False) for name, settings in saved[0].items()}
+        annealing = dict(saved[0].get('simulated_annealing', {}), **self.config.annealing, enabled=True)
+        if num_movable is not None:
+            annealing['max_iterations'] = max(1, min(annealing.get('max_iterations', 10000),
+                                                     self.config.iterations_per_node * num_movable))
+        optimization['simulated_annealing'] = annealing
+        config['optimization'] = optimization
+        config['pattern_cache'] = dict(saved[1], enabled=False)
+        return saved
+
+    def run(self, max_updates: Optional[int] = None):
+        """首次完整运行后持续监视，Ctrl+C退出"""
+        self.start()
+        print(f"\n监视中: {', '.join(self.watched_files())} (Ctrl+C退出)")
+        try:
+            while max_updates is None or len(self.updates) < max_updates:
+                time.sleep(self.config.poll_interval)
+                changed = self.changed_files()
+                if not changed:
+                    continue
+                # 等待编辑器写完
+                while True:
+                    state = self.snapshot()
+                    time.sleep(self.config.debounce)
+                    if self.snapshot() == state:
+                        break
+                print(f"\n检测到修改: {', '.join(changed)}")
+                try:
+                    self.update(changed)
+                except Exception as e:
+                    # 编辑中的文件可能暂时无法解析，等待下一次修改
+                    print(f"增量更新失败: {e}")
+                    self._snapshot = self.snapshot()
+        except KeyboardInterrupt:
+            print("\n退出监视模式")
+
+
+def main():
+    """测试函数"""
+    import shutil
+    import tempfile
+    from main import VerilogPartitioner
+
+    directory = tempfile.mkdtemp()
+    dfg_file = os.path.join(directory, '4004.txt')
+    shutil.copy('dfg_files/4004.txt', dfg_file)
+
+    partitioner = VerilogPartitioner('config.json')
+    partitioner.config.update(dfg_file=dfg_file, output_dir=os.path.join(directory, 'output'))
+    partitioner.config['verilog_frontend']['enabled'] = False
+    watcher = DesignWatcher(partitioner)
+    watcher.start()
+
+    # 修改一条赋值：或改为与
+    with open(dfg_file, 'r', encoding='utf-8') as f:
+        text = f.read()
+    with open(dfg_file, 'w', encoding='utf-8') as f:
+        f.write(text.replace('(Operator Or', '(Operator And', 1))
+    update = watcher.update()
+
+    print(f"\n监视模式示例: {update.delta.summary()}, 搜索 {update.affected_nodes}/{update.search_nodes} 个节点, "
+          f"耗时 {update.seconds:.2f}秒")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,237 @@
+"""
+权重标定模块
+以历史流片中带实测指标的参考分区为样本，一次批量计算全部样本的成本项矩阵，
+用非负最小二乘（拟合实测值）或成对排序损失（拟合实测优劣顺序）标定成本权重
+"""
+
+import json
+import time
+import numpy as np
+import networkx as nx
+from typing import Dict, List, Optional, Any, Tuple
+from dataclasses import dataclass, field
+from scipy.optimize import lsq_linear, minimize
+from scipy.special import expit
+
+from cost_function import CostFunction, CostWeights
+from cost_terms import BUILTIN_TERM_NAMES
+
+
+@dataclass
+class CalibrationConfig:
+    """权重标定配置参数"""
+    method: str = 'least_squares'  # 'least_squares' 或 'ranking'
+    max_pairs: int = 20000         # 排序损失采样的样本对上限
+    temperature: float = 0.1       # 排序损失的logistic温度（按成本项平均差归一化）
+    l2: float = 1e-4               # 排序损失的权重正则
+    seed: int = 0
+
+
+@dataclass
+class CalibrationResult:
+    """权重标定结果"""
+    weights: CostWeights
+    extra_weights: Dict[str, float]
+    term_names: List[str]
+    fixed_terms: List[str]          # 与分区无关（各样本取值相同）而保留原权重的成本项
+    rank_correlation: float         # 标定后成本与实测值的Spearman相关系数
+    pairwise_accuracy: float        # 实测优劣顺序被正确预测的样本对比例
+    rmse: Optional[float]           # 最小二乘拟合的均方根误差
+    num_samples: int
+    fit_time: float
+    term_matrix: np.ndarray = field(repr=False, default=None)
+
+    def apply(self, cost_function: CostFunction):
+        """将标定后的权重写入成本函数"""
+        cost_function.weights = self.weights
+        cost_function.extra_terms = [(term, self.extra_weights.get(term.name, weight))
+                                     for term, weight in cost_function.extra_terms]
+
+
+def load_reference_samples(path: str, target: str = 'score') -> Tuple[List[Dict[str, int]], np.ndarray]:
+    """读取参考样本文件
+
+    文件为JSON列表，每项形如 {"partition": {节点: 域}, "measured": {"score": 实测值, ...}}，
+    target 指定用作标定目标的实测指标（越小越好）
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        records = json.load(f)
+
+    partitions, measured = [], []
+    for record in records:
+        value = record.get('measured')
+        if isinstance(value, dict):
+            value = value.get(target)
+        if value is None or 'partition' not in record:
+            continue
+        partitions.append({node: int(part) for node, part in record['partition'].items()})
+        measured.append(float(value))
+    return partitions, np.array(measured, dtype=float)
+
+
+class WeightCalibrator:
+    """成本权重标定器"""
+
+    def __init__(self, config: CalibrationConfig = None, cost_function: CostFunction = None):
+        self.config = config or CalibrationConfig()
+        self.cost_function = cost_function or CostFunction()
+
+    def fit(self, graph: nx.DiGraph, partitions: List[Dict[str, int]], measured) -> CalibrationResult:
+        """标定权重，measured为各参考分区的实测值（越小越好）"""
+        start_time = time.time()
+        measured = np.asarray(measured, dtype=float)
+        if len(partitions) != len(measured) or len(partitions) < 2:
+            raise ValueError("至少需要两个参考分区，且实测值与分区一一对应")
+
+        # 一次批量计算全部样本的成本项矩阵
+        nodes = list(graph.nodes())
+        samples = np.array([[partition.get(node, -1) for node in nodes] for partition in partitions],
+                           dtype=np.int64)
+        matrix = self.cost_function.term_matrix(graph, nodes, samples)
+        names = self.cost_function.term_names()
+        current = self.cost_function.term_weights()
+
+        # 与分区无关的成本项（如延迟）无法由样本区分，保留原权重
+        variable = np.ptp(matrix, axis=0) > 1e-12
+        if not variable.any():
+            raise ValueError("参考分区的成本项没有差异，无法标定")
+
+        if self.config.method == 'least_squares':
+            fitted, rmse = self._fit_least_squares(matrix[:, variable], measured)
+        elif self.config.method == 'ranking':
+            fitted, rmse = self._fit_ranking(matrix[:, variable], measured), None
+        else:
+            raise ValueError(f"未知的标定方法: {self.config.method}")
+
+        # 保持可变成本项的权重总和不变，使标定结果与固定项及退火温度的尺度一致
+        total = fitted.sum()
+        scale = current[variable].sum() / total if total > 0 else 0.0
+        weights = current.copy()
+        weights[variable] = fitted * scale if total > 0 else current[variable]
+
+        predicted = matrix @ weights
+        return CalibrationResult(
+            weights=CostWeights(**{name.replace('_cost', '_weight'): float(w)
+                                   for name, w in zip(BUILTIN_TERM_NAMES, weights)}),
+            extra_weights={name: float(w) for name, w in zip(names[len(BUILTIN_TERM_NAMES):],
+                                                              weights[len(BUILTIN_TERM_NAMES):])},
+            term_names=names,
+            fixed_terms=[name for name, flag in zip(names, variable) if not flag],
+            rank_correlation=self._rank_correlation(predicted, measured),
+            pairwise_accuracy=self._pairwise_accuracy(predicted, measured),
+            rmse=rmse,
+            num_samples=len(measured),
+            fit_time=time.time() - start_time,
+            term_matrix=matrix
+        )
+
+    def _fit_least_squares(self, matrix: np.ndarray, measured: np.ndarray) -> Tuple[np.ndarray, float]:
+        """非负最小二乘：measured ≈ 截距 + matrix @ w，w ≥ 0"""
+        design = np.hstack([matrix, np.ones((len(matrix), 1))])
+        lower = np.append(np.zeros(matrix.shape[1]), -np.inf)
+        result = lsq_linear(design, measured, bounds=(lower, np.inf))
+        residual = design @ result.x - measured
+        return result.x[:-1], float(np.sqrt(np.mean(residual ** 2)))
+
+    def _fit_ranking(self, matrix: np.ndarray, measured: np.ndarray) -> np.ndarray:
+        """成对logistic排序损失，权重经softmax参数化（非负且和为1）"""
+        diffs = self._pair_differences(matrix, measured)
+        num_terms = matrix.shape[1]
+        if len(diffs) == 0:
+            return np.full(num_terms, 1.0 / num_terms)
+
+        # 按各成本项的平均差归一化，使温度对各项一致
+        scales = np.maximum(np.abs(diffs).mean(axis=0), 1e-12)
+        normalized = diffs / scales
+        temperature = self.config.temperature
+
+        def loss(theta):
+            w = np.exp(theta - theta.max())
+            w /= w.sum()
+            margin = normalized @ w / temperature
+            # log(1 + exp(-margin)) 及其对w的梯度
+            value = np.logaddexp(0.0, -margin).mean() + self.config.l2 * theta @ theta
+            grad_w = -(normalized * expit(-margin)[:, None]).mean(axis=0) / temperature
+            grad_theta = w * (grad_w - w @ grad_w) + 2.0 * self.config.l2 * theta
+            return value, grad_theta
+
+        result = minimize(loss, np.zeros(num_terms), jac=True, method='L-BFGS-B')
+        w = np.exp(result.x - result.x.max())
+        return w / w.sum() / scales
+
+    def _pair_differences(self, matrix: np.ndarray, measured: np.ndarray) -> np.ndarray:
+        """实测较差样本减去较好样本的成本项差（采样不超过max_pairs对）"""
+        first, second = self._sample_pairs(len(measured))
+        keep = measured[first] != measured[second]
+        first, second = first[keep], second[keep]
+        worse = np.where(measured[first] > measured[second], first, second)
+        better = np.where(measured[first] > measured[second], second, first)
+        return matrix[worse] - matrix[better]
+
+    @staticmethod
+    def _rank_correlation(predicted: np.ndarray, measured: np.ndarray) -> float:
+        """Spearman秩相关系数（秩的Pearson相关）"""
+        if np.ptp(predicted) == 0 or np.ptp(measured) == 0:
+            return 0.0
+        ranks = [np.argsort(np.argsort(values, kind='stable'), kind='stable') for values in (predicted, measured)]
+        return float(np.corrcoef(ranks[0], ranks[1])[0, 1])
+
+    def _sample_pairs(self, num_samples: int) -> Tuple[np.ndarray, np.ndarray]:
+        """全部样本对，数量超过max_pairs时改为随机采样"""
+        if num_samples * (num_samples - 1) // 2 <= self.config.max_pairs:
+            return np.triu_indices(num_samples, k=1)
+        rng = np.random.default_rng(self.config.seed)
+        return (rng.integers(0, num_samples, self.config.max_pairs),
+                rng.integers(0, num_samples, self.config.max_pairs))
+
+    def _pairwise_accuracy(self, predicted: np.ndarray, measured: np.ndarray) -> float:
+        first, second = self._sample_pairs(len(measured))
+        keep = measured[first] != measured[second]
+        if not keep.any():
+            return 1.0
+        agree = np.sign(predicted[first] - predicted[second]) == np.sign(measured[first] - measured[second])
+        return float(agree[keep].mean())
+
+    def analyze_result(self, result: CalibrationResult) -> Dict[str, Any]:
+        """分析标定结果"""
+        return {
+            'num_samples': result.num_samples,
+            'weights': {name: float(w) for name, w in zip(result.term_names, self._weight_vector(result))},
+            'fixed_terms': result.fixed_terms,
+            'rank_correlation': result.rank_correlation,
+            'pairwise_accuracy': result.pairwise_accuracy,
+            'rmse': result.rmse,
+            'fit_time': result.fit_time
+        }
+
+    @staticmethod
+    def _weight_vector(result: CalibrationResult) -> List[float]:
+        builtin = [getattr(result.weights, name.replace('_cost', '_weight')) for name in BUILTIN_TERM_NAMES]
+        return builtin + [result.extra_weights[name] for name in result.term_names[len(BUILTIN_TERM_NAMES):]]
+
+
+def main():
+    """测试函数"""
+    # 随机图与随机参考分区，用已知权重合成"实测值"
+    graph = nx.gnp_random_graph(60, 0.08, seed=1, directed=True)
+    graph = nx.relabel_nodes(graph, {i: f'n{i}' for i in graph.nodes()})
+    nodes = list(graph.nodes())
+
+    cost_func = CostFunction()
+    rng = np.random.default_rng(0)
+    partitions = [dict(zip(nodes, rng.integers(0, 2, len(nodes)).tolist())) for _ in range(2000)]
+
+    true_weights = CostFunction(CostWeights(0.6, 0.25, 0.05, 0.05, 0.05))
+    samples = np.array([[p[node] for node in nodes] for p in partitions])
+    measured = true_weights.batch_total_cost(graph, nodes, samples) + rng.normal(0, 1e-4, len(partitions))
+
+    for method in ('least_squares', 'ranking'):
+        calibrator = WeightCalibrator(CalibrationConfig(method=method), cost_func)
+        result = calibrator.fit(graph, partitions, measured)
+        print(f"权重标定结果 ({method}):")
+        for key, value in calibrator.analyze_result(result).items():
+            print(f"  {key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
@@ -42,107 +42,1419 @@ def test_dfg_parser():
         traceback.print_exc()
         return False
 
+def test_bit_width_inference():
+    """测试位宽推断"""
+    print("\n" + "=" * 50)
+    print("测试位宽推断")
+    print("=" * 50)
+    
+    try:
+        from dfg_parser import DFGParser
+        from cost_function import CostFunction
+        import tempfile
+        
+        dfg_text = "\n".join([
+            "(Term name:top.data type:['Wire'] msb:(IntConst 7) lsb:(IntConst 0))",
+            "(Term name:top.sum type:['Wire'] msb:(IntConst 7) lsb:(IntConst 0))",
+            "(Term name:top.bit type:['Wire'] msb:(IntConst 0) lsb:(IntConst 0))",
+            "(Bind dest:top.sum tree:(Operator Plus Next:(Terminal top.data),(Terminal top.data)))",
+            "(Bind dest:top.bit tree:(Partselect Var:(Terminal top.sum) MSB:(IntConst 2) LSB:(IntConst 2)))",
+            "(Bind dest:top.nib tree:(Partselect Var:(Terminal top.sum) MSB:(IntConst 3) LSB:(IntConst 0)))",
+        ])
+        with tempfile.NamedTemporaryFile('w', suffix='.txt', delete=False, encoding='utf-8') as f:
+            f.write(dfg_text)
+            dfg_file = f.name
+        
+        try:
+            graph = DFGParser().parse_dfg_file(dfg_file)
+        finally:
+            os.remove(dfg_file)
+        
+        widths = {node: data['bit_width'] for node, data in graph.nodes(data=True)}
+        print(f"推断位宽: {widths}")
+        if widths != {'top.data': 8, 'top.sum': 8, 'top.bit': 1, 'top.nib': 4}:
+            print("✗ 位宽推断结果错误")
+            return False
+        
+        # 接口成本按驱动位宽统计跨分区数据量
+        cost_func = CostFunction()
+        partition = {'top.data': 0, 'top.sum': 1, 'top.bit': 1, 'top.nib': 0}
+        interface_cost = cost_func._calculate_interface_cost(graph, partition, [], [])
+        if abs(interface_cost - (8 + 8) * 0.01 / 100.0) > 1e-12:
+            print(f"✗ 接口成本未使用实际位宽: {interface_cost}")
+            return False
+        
+        print("✓ 位宽推断测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 位宽推断测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_streaming_parser():
+    """测试流式DFG解析"""
+    print("\n" + "=" * 50)
+    print("测试流式DFG解析")
+    print("=" * 50)
+    
+    try:
+        from dfg_parser import DFGParser
+        import gzip
+        import lzma
+        import tempfile
+        
+        dfg_text = "\n".join([
+            "Directive:",
+            "(1, '`timescale 1ns / 1ps\\n')",
+            "Instance:",
+            "(top, 'top')",
+            "Term:",
+            "(Term name:top.a type:['Input', 'Wire'] msb:(IntConst 3) lsb:(IntConst 0))",
+            "(Term name:top.b type:['Input', 'Wire'] msb:(IntConst 3) lsb:(IntConst 0))",
+            "(Term name:top.y type:['Output', 'Wire'] msb:(IntConst 0) lsb:(IntConst 0))",
+            "Bind:",
+            "(Bind dest:top.s tree:(Operator Plus Next:(Terminal top.a),(Terminal top.b)))",
+            "(Bind dest:top.y tree:(Operator Eq Next:(Terminal top.s),(IntConst 4'b0000)))",
+        ]) + "\n"
+        
+        with tempfile.TemporaryDirectory() as directory:
+            paths = {
+                'text': os.path.join(directory, 'top.txt'),
+                'gz': os.path.join(directory, 'top.txt.gz'),
+                'xz': os.path.join(directory, 'top.txt.xz')
+            }
+            with open(paths['text'], 'w', encoding='utf-8') as f:
+                f.write(dfg_text)
+            with gzip.open(paths['gz'], 'wt', encoding='utf-8') as f:
+                f.write(dfg_text)
+            with lzma.open(paths['xz'], 'wt', encoding='utf-8') as f:
+                f.write(dfg_text)
+            
+            results = {}
+            for kind, path in paths.items():
+                parser = DFGParser()
+                graph = parser.parse_dfg_file(path)
+                results[kind] = (sorted(graph.nodes(data='bit_width')), sorted(graph.edges()))
+                print(f"{kind}: {parser.parse_stats['lines']} 行, {parser.parse_stats['mb_per_s']:.2f} MB/s")
+        
+        if not (results['text'] == results['gz'] == results['xz']):
+            print("✗ 压缩输入的解析结果不一致")
+            return False
+        nodes, edges = results['text']
+        if edges != [('top.a', 'top.s'), ('top.b', 'top.s'), ('top.s', 'top.y')] or \
+                dict(nodes)['top.s'] != 4 or dict(nodes)['top.y'] != 1:
+            print(f"✗ 解析结果错误: {results['text']}")
+            return False
+        
+        print("✓ 流式DFG解析测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 流式DFG解析测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_bind_tree_parser():
+    """测试Bind树解析与运算符展开"""
+    print("\n" + "=" * 50)
+    print("测试Bind树解析")
+    print("=" * 50)
+    
+    try:
+        from bind_tree import parse_bind_tree, TreeSyntaxError
+        from dfg_parser import DFGParser, OperatorType
+        import tempfile
+        
+        tree = ("(Operator Unot Next:(Operator Plus Next:(Terminal top.a),"
+                "(Partselect Var:(Terminal top.b) MSB:(IntConst 3) LSB:(IntConst 0))))")
+        root = parse_bind_tree(tree)
+        labels = [node.label for node in root.walk() if not node.is_leaf]
+        if labels != ['Unot', 'Plus', 'Partselect']:
+            print(f"✗ 语法树结构错误: {labels}")
+            return False
+        
+        # 深层嵌套不受递归深度限制
+        depth = 5000
+        deep = "(Operator Unot Next:" * depth + "(Terminal top.a)" + ")" * depth
+        if sum(1 for _ in parse_bind_tree(deep).walk()) != depth + 1:
+            print("✗ 深层嵌套解析错误")
+            return False
+        try:
+            parse_bind_tree("(Operator Plus Next:(Terminal top.a)")
+            print("✗ 括号不匹配未报错")
+            return False
+        except TreeSyntaxError:
+            pass
+        
+        dfg_text = "\n".join([
+            "Term:",
+            "(Term name:top.a type:['Input', 'Wire'] msb:(IntConst 3) lsb:(IntConst 0))",
+            "(Term name:top.b type:['Input', 'Wire'] msb:(IntConst 7) lsb:(IntConst 0))",
+            "Bind:",
+            f"(Bind dest:top.y tree:{tree})",
+        ]) + "\n"
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'top.txt')
+            with open(path, 'w', encoding='utf-8') as f:
+                f.write(dfg_text)
+            
+            flat = DFGParser().parse_dfg_file(path)
+            parser = DFGParser(expand_operators=True)
+            expanded = parser.parse_dfg_file(path)
+        
+        # 树根决定操作符类型，而不是文本中最先匹配的运算符
+        if flat.nodes['top.y']['operator_type'] != OperatorType.NOT:
+            print(f"✗ 根运算符识别错误: {flat.nodes['top.y']['operator_type']}")
+            return False
+        
+        plus, select = 'top.y._op1_Plus', 'top.y._op2_Partselect'
+        expected_edges = {('top.a', plus), ('top.b', select), (select, plus), (plus, 'top.y')}
+        if set(expanded.edges()) != expected_edges:
+            print(f"✗ 展开后的边错误: {sorted(expanded.edges())}")
+            return False
+        if expanded.nodes[select]['bit_width'] != 4 or expanded.nodes[plus]['bit_width'] != 4 or \
+                not expanded.nodes[plus]['is_linear']:
+            print(f"✗ 子节点属性错误: {dict(expanded.nodes(data='bit_width'))}")
+            return False
+        
+        print(f"展开后: {expanded.number_of_nodes()} 个节点, {expanded.number_of_edges()} 条边")
+        print(f"节点类型: {parser.get_node_statistics()}")
+        print("✓ Bind树解析测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Bind树解析测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_graph_cache():
+    """测试DFG图缓存"""
+    print("\n" + "=" * 50)
+    print("测试DFG图缓存")
+    print("=" * 50)
+    
+    try:
+        from dfg_parser import DFGParser
+        from graph_cache import GraphCache
+        import tempfile
+        import shutil
+        
+        with tempfile.TemporaryDirectory() as directory:
+            dfg_file = os.path.join(directory, '4004.txt')
+            shutil.copy('dfg_files/4004.txt', dfg_file)
+            cache = GraphCache(os.path.join(directory, 'cache'))
+            
+            parsed = cache.parse(DFGParser(), dfg_file)
+            parser = DFGParser()
+            loaded = cache.parse(parser, dfg_file)
+            if not parser.parse_stats.get('cache_hit') or cache.hits != 1 or cache.misses != 1:
+                print(f"✗ 缓存未命中: {parser.parse_stats}")
+                return False
+            
+            # 节点属性、边与邻接顺序与直接解析一致
+            if list(parsed.nodes(data='operator_type')) != list(loaded.nodes(data='operator_type')) or \
+                    list(parsed.edges()) != list(loaded.edges()) or \
+                    [list(parsed.pred[n]) for n in parsed] != [list(loaded.pred[n]) for n in loaded] or \
+                    list(parsed.graph['bit_widths']) != list(loaded.graph['bit_widths']):
+                print("✗ 缓存加载的图与解析结果不一致")
+                return False
+            reference = DFGParser()
+            reference.parse_dfg_file(dfg_file)
+            if parser.get_node_statistics() != reference.get_node_statistics() or \
+                    parser.get_linearity_analysis() != reference.get_linearity_analysis():
+                print("✗ 解析器节点表未恢复")
+                return False
+            
+            # 解析选项或文件内容变化时使用新的键
+            keys = {cache.key(dfg_file, DFGParser().cache_options()),
+                    cache.key(dfg_file, DFGParser(expand_operators=True).cache_options())}
+            with open(dfg_file, 'a', encoding='utf-8') as f:
+                f.write("(Bind dest:top.extra tree:(Terminal alu.acc_out))\n")
+            keys.add(cache.key(dfg_file, DFGParser().cache_options()))
+            if len(keys) != 3:
+                print("✗ 缓存键未区分选项或内容")
+                return False
+            
+            compiled = cache.load(cache.key(dfg_file, DFGParser().cache_options()))
+            if compiled is not None:
+                print("✗ 修改后的文件不应命中旧缓存")
+                return False
+        
+        print(f"加载耗时: {parser.parse_stats['seconds'] * 1000:.1f} ms")
+        print("✓ DFG图缓存测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ DFG图缓存测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_verilog_frontend():
+    """测试进程内Verilog前端"""
+    print("\n" + "=" * 50)
+    print("测试Verilog前端")
+    print("=" * 50)
+    
+    try:
+        from bind_tree import parse_bind_tree
+        from dfg_parser import DFGParser
+        from verilog_frontend import VerilogFrontend, PYVERILOG_AVAILABLE
+        
+        # 对象接口与文本解析得到相同的图
+        text_parser = DFGParser()
+        text_graph = text_parser.parse_dfg_file('dfg_files/4004.txt')
+        parser = DFGParser()
+        for name, data in text_parser.nodes.items():
+            if name in text_parser.term_widths:
+                parser.add_term(name, {'Wire'}, str(text_parser.term_widths[name] - 1), '0')
+        for dest, tree in text_parser.bind_trees.items():
+            parser.add_bind(dest, parse_bind_tree(tree))
+        graph = parser.build()
+        if sorted(graph.edges()) != sorted(text_graph.edges()) or \
+                dict(graph.nodes(data='bit_width')) != dict(text_graph.nodes(data='bit_width')):
+            print("✗ 对象接口构建的图与文本解析不一致")
+            return False
+        
+        if not PYVERILOG_AVAILABLE:
+            print("未安装pyverilog，跳过Verilog分析部分")
+            print("✓ Verilog前端测试通过")
+            return True
+        
+        import tempfile
+        frontend = VerilogFrontend()
+        direct = frontend.run(['verilogcode/4004.v'], 'alu')
+        if list(direct.nodes(data=True)) != list(text_graph.nodes(data=True)) or \
+                list(direct.edges()) != list(text_graph.edges()):
+            print("✗ 进程内构建的图与文本DFG不一致")
+            return False
+        
+        # 同一次分析结果输出文本DFG与分区图
+        result = frontend.analyze(['verilogcode/4004.v'], 'alu')
+        with tempfile.TemporaryDirectory() as directory:
+            text_file = os.path.join(directory, '4004.txt')
+            outputs = frontend.emit(result, dfg_text_file=text_file, parser=DFGParser())
+            with open(text_file, 'r', encoding='utf-8') as f, open('dfg_files/4004.txt', 'r', encoding='utf-8') as g:
+                if f.read() != g.read():
+                    print("✗ 输出的文本DFG与generate_dfg.py不一致")
+                    return False
+        if sorted(outputs['graph'].edges()) != sorted(text_graph.edges()):
+            print("✗ emit构建的图不一致")
+            return False
+        print(f"分析: {frontend.stats['analysis_seconds']:.3f}秒, 构建: {frontend.stats['build_seconds']:.3f}秒")
+        print("✓ Verilog前端测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ Verilog前端测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_batch_frontend():
+    """测试批量Verilog前端"""
+    print("\n" + "=" * 50)
+    print("测试批量Verilog前端")
+    print("=" * 50)
+    
+    try:
+        from batch_frontend import BatchFrontend, BatchConfig, ModuleJob, load_manifest
+        from verilog_frontend import PYVERILOG_AVAILABLE
+        import tempfile
+        
+        jobs = [
+            ModuleJob(topmodule='alu', verilog_files=['verilogcode/4004.v']),
+            ModuleJob(topmodule='alu', verilog_files=['verilogcode/missing.v'], name='missing')
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            batch = BatchFrontend(BatchConfig(output_dir=directory, num_workers=2, timeout=300))
+            result = batch.run(jobs)
+            modules = {module.name: module for module in result.modules}
+            
+            # 失败的模块不影响其他模块，并记录在清单中
+            if modules['missing'].status != 'error' or not modules['missing'].error:
+                print(f"✗ 缺失文件的模块未报告错误: {modules['missing']}")
+                return False
+            expected = 'ok' if PYVERILOG_AVAILABLE else 'error'
+            if modules['alu'].status != expected:
+                print(f"✗ alu模块状态错误: {modules['alu']}")
+                return False
+            if PYVERILOG_AVAILABLE and (modules['alu'].num_nodes != 107 or
+                                        not os.path.exists(modules['alu'].outputs['text'])):
+                print(f"✗ alu模块产物错误: {modules['alu']}")
+                return False
+            
+            loaded = load_manifest(result.manifest_path, only_ok=False)
+            if [module.name for module in loaded] != ['alu', 'missing'] or \
+                    len(load_manifest(result.manifest_path)) != len(result.succeeded):
+                print("✗ 清单读取错误")
+                return False
+            
+            try:
+                batch.run([jobs[0], jobs[0]])
+                print("✗ 重复的输出名未报错")
+                return False
+            except ValueError:
+                pass
+        
+        for module in result.modules:
+            print(f"{module.name}: {module.status} ({module.timings['total']:.2f}秒) {module.error or ''}")
+        print("✓ 批量Verilog前端测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 批量Verilog前端测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_frontend_cache():
+    """测试前端解析表与预处理缓存"""
+    print("\n" + "=" * 50)
+    print("测试前端缓存")
+    print("=" * 50)
+    
+    try:
+        from verilog_frontend import VerilogFrontend, FrontendConfig, PYVERILOG_AVAILABLE
+        import tempfile
+        
+        if not PYVERILOG_AVAILABLE:
+            print("未安装pyverilog，跳过前端缓存测试")
+            return True
+        
+        from frontend_cache import FrontendCache
+        with tempfile.TemporaryDirectory() as directory:
+            # 预处理键随源文件内容与宏定义变化
+            source = os.path.join(directory, 'top.v')
+            with open(source, 'w') as f:
+                f.write('module top(input a, output b); assign b = a; endmodule\n')
+            key = FrontendCache.preprocess_key([source], [], [])
+            if FrontendCache.preprocess_key([source], [], ['FOO']) == key:
+                print("✗ 宏定义未参与预处理键")
+                return False
+            with open(source, 'a') as f:
+                f.write('// changed\n')
+            if FrontendCache.preprocess_key([source], [], []) == key:
+                print("✗ 源文件内容未参与预处理键")
+                return False
+            
+            cache_dir = os.path.join(directory, 'cache')
+            graphs = []
+            for _ in range(2):
+                frontend = VerilogFrontend(FrontendConfig(cache_dir=cache_dir))
+                graphs.append(frontend.build_graph(frontend.analyze(['verilogcode/4004.v'], 'alu')))
+            stats = frontend.cache_stats
+            if stats['table_hits'] != 1 or stats['preprocess_hits'] != 1:
+                print(f"✗ 第二次运行未命中缓存: {stats}")
+                return False
+            if sorted(graphs[0].edges) != sorted(graphs[1].edges):
+                print("✗ 命中缓存时构建的图不一致")
+                return False
+        
+        print(f"缓存统计: {stats}")
+        print("✓ 前端缓存测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 前端缓存测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+
+def test_hierarchy():
+    """测试层次化DFG"""
+    print("\n" + "=" * 50)
+    print("测试层次化DFG")
+    print("=" * 50)
+    
+    try:
+        from dfg_parser import DFGParser, OperatorType
+        from hierarchy import HierarchicalDFG
+        import tempfile
+        
+        # 顶层中两个adder实例: s0 = p + q, s1 = s0 + q, r = s0 ^ s1
+        lines = [
+            "Instance:", "(top.u0, 'adder')", "(top.u1, 'adder')", "(top, 'top')", "Term:"
+        ] + [
+            f"(Term name:top.{name} type:['{kind}'] msb:(IntConst 3) lsb:(IntConst 0))"
+            for name, kind in [('p', 'Input'), ('q', 'Input'), ('r', 'Output'), ('s0', 'Wire'), ('s1', 'Wire'),
+                               ('u0.a', 'Input'), ('u0.b', 'Input'), ('u0.s', 'Output'),
+                               ('u1.a', 'Input'), ('u1.b', 'Input'), ('u1.s', 'Output')]
+        ] + [
+            "Bind:",
+            "(Bind dest:top.r tree:(Operator Xor Next:(Terminal top.s0),(Terminal top.s1)))",
+            "(Bind dest:top.s0 tree:(Terminal top.u0.s))",
+            "(Bind dest:top.s1 tree:(Terminal top.u1.s))",
+            "(Bind dest:top.u0.a tree:(Terminal top.p))",
+            "(Bind dest:top.u0.b tree:(Terminal top.q))",
+            "(Bind dest:top.u0.s tree:(Operator Plus Next:(Terminal top.u0.a),(Terminal top.u0.b)))",
+            "(Bind dest:top.u1.a tree:(Terminal top.s0))",
+            "(Bind dest:top.u1.b tree:(Terminal top.q))",
+            "(Bind dest:top.u1.s tree:(Operator Plus Next:(Terminal top.u1.a),(Terminal top.u1.b)))",
+        ]
+        with tempfile.TemporaryDirectory() as directory:
+            dfg_file = os.path.join(directory, 'adders.txt')
+            with open(dfg_file, 'w') as f:
+                f.write('\n'.join(lines) + '\n')
+            
+            flat_parser = DFGParser()
+            flat = flat_parser.parse_dfg_file(dfg_file)
+            hierarchy = HierarchicalDFG()
+            graph = hierarchy.parse_dfg_file(dfg_file)
+        
+        if flat_parser.instances.get('top.u1') != 'adder':
+            print(f"✗ Instance段解析错误: {flat_parser.instances}")
+            return False
+        
+        # adder只构建一次，第二个实例的内部赋值被跳过
+        stats = hierarchy.parse_stats
+        if stats['modules'] != 2 or stats['skipped_binds'] != 1 or stats['flat_nodes'] != len(flat):
+            print(f"✗ 层次统计错误: {stats}")
+            return False
+        supernodes = {name for name, data in graph.nodes(data=True)
+                      if data['operator_type'] == OperatorType.INSTANCE}
+        if supernodes != {'top.u0', 'top.u1'} or graph.nodes['top.u1']['value'] != 'adder' or \
+                graph.graph['instances']['top.u1']['ports']['s']['bit_width'] != 4:
+            print(f"✗ 实例超节点错误: {supernodes}")
+            return False
+        if not graph.has_edge('top.u1.a', 'top.u1') or not graph.has_edge('top.u1', 'top.u1.s'):
+            print("✗ 超节点端口边缺失")
+            return False
+        
+        # 按实例路径展开一个，按模块名展开全部
+        partial = hierarchy.build(['top.u0'])
+        if set(partial.graph['instances']) != {'top.u1'}:
+            print(f"✗ 按实例展开错误: {sorted(partial.graph['instances'])}")
+            return False
+        expanded = hierarchy.build(['adder'])
+        if set(expanded.nodes) != set(flat.nodes) or set(expanded.edges) != set(flat.edges) or \
+                any(expanded.nodes[name] != flat.nodes[name] for name in flat):
+            print("✗ 全部展开后与平坦解析的图不一致")
+            return False
+
+        # 端口相同但内部赋值不同的实例不能共用模板
+        divergent_lines = [line.replace("(Bind dest:top.u1.s tree:(Operator Plus",
+                                        "(Bind dest:top.u1.s tree:(Operator Times") for line in lines]
+        with tempfile.TemporaryDirectory() as directory:
+            dfg_file = os.path.join(directory, 'divergent.txt')
+            with open(dfg_file, 'w') as f:
+                f.write('\n'.join(divergent_lines) + '\n')
+            divergent_flat = DFGParser().parse_dfg_file(dfg_file)
+            divergent = HierarchicalDFG()
+            divergent.parse_dfg_file(dfg_file)
+        if divergent.module_key('top.u0') == divergent.module_key('top.u1') or \
+                divergent.parse_stats['skipped_binds'] != 0:
+            print(f"✗ 内容不同的实例被合并: {divergent.module_key('top.u1')}")
+            return False
+        divergent_expanded = divergent.build(['*'])
+        node = divergent_expanded.nodes['top.u1.s']
+        if node['operator_type'] != divergent_flat.nodes['top.u1.s']['operator_type'] or \
+                node['operator_type'] != OperatorType.MUL or node['is_linear'] or \
+                any(divergent_expanded.nodes[name] != divergent_flat.nodes[name] for name in divergent_flat):
+            print(f"✗ 内容不同的实例展开错误: {node['operator_type']}, is_linear={node['is_linear']}")
+            return False
+        if divergent.build().nodes['top.u1']['is_linear']:
+            print("✗ 内容不同的实例超节点线性标记错误")
+            return False
+
+        # 单模块设计与平坦解析相同
+        single = HierarchicalDFG().parse_dfg_file('dfg_files/4004.txt')
+        if list(single.nodes) != list(DFGParser().parse_dfg_file('dfg_files/4004.txt').nodes):
+            print("✗ 单模块设计的层次解析结果与平坦解析不同")
+            return False
+        
+        print(f"层次统计: {stats['instances']} 个实例, {stats['modules']} 个唯一模块, "
+              f"顶层图 {len(graph)} 个节点 (展开后 {stats['flat_nodes']})")
+        print("✓ 层次化DFG测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 层次化DFG测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+
 def test_cost_function():
     """测试成本函数"""
     print("\n" + "=" * 50)
-    print("测试成本函数模块")
+    print("测试成本函数模块")
+    print("=" * 50)
+    
+    try:
+        from cost_function import CostFunction, CostWeights
+        import networkx as nx
+        
+        # 创建测试图
+        graph = nx.DiGraph()
+        graph.add_nodes_from(['A', 'B', 'C', 'D'])
+        graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D')])
+        
+        # 测试分区
+        partition = {'A': 0, 'B': 1, 'C': 0, 'D': 1}
+        
+        # 创建成本函数
+        cost_func = CostFunction()
+        metrics = cost_func.calculate_total_cost(
+            graph=graph,
+            partition=partition,
+            onn_outputs=['B', 'D'],
+            electronic_outputs=['A', 'C']
+        )
+        
+        print(f"成本计算结果: {metrics}")
+        print("✓ 成本函数测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 成本函数测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_cost_terms():
+    """测试成本项注册"""
+    print("\n" + "=" * 50)
+    print("测试成本项注册模块")
+    print("=" * 50)
+    
+    try:
+        from cost_terms import EdgeTerm, register_term, TERM_REGISTRY
+        from cost_function import CostFunction, PartitionDomains
+        import numpy as np
+        import networkx as nx
+        
+        # 自定义按边成本项：只需给出系数，完整、增量与批量评估自动可用
+        @register_term
+        class WideCutTerm(EdgeTerm):
+            name = 'test_wide_cut'
+            
+            def edge_costs(self, context):
+                return (context.edge_widths > 1).astype(float)
+        
+        graph = nx.DiGraph()
+        graph.add_node('A', bit_width=4)
+        graph.add_edges_from([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D'), ('D', 'E')])
+        nodes = list(graph.nodes())
+        
+        cost_func = CostFunction(domains=PartitionDomains(kinds=['electronic', 'onn', 'onn']))
+        cost_func.add_term('test_wide_cut', 0.5)
+        cost_func.add_term('onn_power', 0.2)
+        
+        # 批量结果与逐个评估一致
+        samples = np.random.default_rng(0).integers(0, 3, size=(30, len(nodes)))
+        batch = cost_func.batch_total_cost(graph, nodes, samples)
+        domains = cost_func.domains
+        for row, expected in zip(samples, batch):
+            partition = dict(zip(nodes, row.tolist()))
+            metrics = cost_func.calculate_total_cost(
+                graph, partition,
+                [n for n, p in partition.items() if domains.is_onn(p)],
+                [n for n, p in partition.items() if domains.is_electronic(p)])
+            if abs(metrics.total_cost - expected) > 1e-12:
+                print(f"✗ 批量成本不一致: {metrics.total_cost} != {expected}")
+                return False
+        print(f"成本项: {cost_func.term_names()}")
+        
+        # 增量与两次完整评估之差一致
+        partition = dict(zip(nodes, samples[0].tolist()))
+        changes = {'A': (partition['A'] + 1) % 3, 'D': (partition['D'] + 2) % 3}
+        matrix = cost_func.term_matrix(graph, nodes, np.array([
+            [partition[n] for n in nodes], [changes.get(n, partition[n]) for n in nodes]]))
+        expected = float(np.diff(matrix @ cost_func.term_weights())[0])
+        delta = cost_func.delta_cost(graph, partition, changes)
+        if abs(delta - expected) > 1e-12:
+            print(f"✗ 增量成本不一致: {delta} != {expected}")
+            return False
+        print(f"增量成本: {delta:.6f}")
+
+        # 内置成本项的增量只更新域累加量与关联边，不调用完整评估
+        from cost_terms import CostTerm, DomainTerm
+        def forbidden(self, context, parts):
+            raise AssertionError(f"{self.name} 的增量调用了完整评估")
+        originals = (CostTerm.evaluate, DomainTerm.batch)
+        CostTerm.evaluate, DomainTerm.batch = forbidden, forbidden
+        try:
+            current = dict(partition)
+            rng = np.random.default_rng(1)
+            for _ in range(50):
+                move = {nodes[i]: int(rng.integers(0, 3)) for i in rng.integers(0, len(nodes), size=2)}
+                rows = np.array([[current[n] for n in nodes], [move.get(n, current[n]) for n in nodes]])
+                CostTerm.evaluate, DomainTerm.batch = originals
+                expected = float(np.diff(cost_func.term_matrix(graph, nodes, rows) @ cost_func.term_weights())[0])
+                CostTerm.evaluate, DomainTerm.batch = forbidden, forbidden
+                delta = cost_func.delta_cost(graph, current, move)
+                if abs(delta - expected) > 1e-12:
+                    print(f"✗ 连续移动的增量成本不一致: {delta} != {expected}")
+                    return False
+                current.update(move)
+        finally:
+            CostTerm.evaluate, DomainTerm.batch = originals
+
+        # 节点数与边数不变的原地修改（改接一条边、改变位宽）后，index_graph使缓存失效
+        from dfg_parser import index_graph
+        before = cost_func.batch_total_cost(graph, nodes, samples[:5])
+        graph.remove_edge('D', 'E')
+        graph.add_edge('B', 'E')
+        graph.nodes['B']['bit_width'] = 8
+        index_graph(graph)
+        after = cost_func.batch_total_cost(graph, nodes, samples[:5])
+        fresh = CostFunction(domains=cost_func.domains)
+        fresh.add_term('test_wide_cut', 0.5)
+        fresh.add_term('onn_power', 0.2)
+        expected = fresh.batch_total_cost(graph.copy(), nodes, samples[:5])
+        if not np.allclose(after, expected) or np.allclose(before, after):
+            print(f"✗ 原地修改后沿用了过期的缓存: {after} != {expected}")
+            return False
+        
+        del TERM_REGISTRY['test_wide_cut']
+        print("✓ 成本项注册测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 成本项注册测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_weight_calibration():
+    """测试权重标定"""
+    print("\n" + "=" * 50)
+    print("测试权重标定模块")
+    print("=" * 50)
+    
+    try:
+        from weight_calibration import WeightCalibrator, CalibrationConfig
+        from cost_function import CostFunction, CostWeights
+        import numpy as np
+        import networkx as nx
+        import time
+        
+        graph = nx.gnp_random_graph(40, 0.1, seed=3, directed=True)
+        graph = nx.relabel_nodes(graph, {i: f'n{i}' for i in graph.nodes()})
+        nodes = list(graph.nodes())
+        
+        # 用已知权重合成实测值，标定应恢复其排序
+        rng = np.random.default_rng(1)
+        samples = rng.integers(0, 2, size=(3000, len(nodes)))
+        partitions = [dict(zip(nodes, row.tolist())) for row in samples]
+        reference = CostFunction(CostWeights(0.1, 0.25, 0.4, 0.05, 0.2))
+        measured = reference.batch_total_cost(graph, nodes, samples)
+        
+        for method in ('least_squares', 'ranking'):
+            start_time = time.time()
+            result = WeightCalibrator(CalibrationConfig(method=method), CostFunction()).fit(
+                graph, partitions, measured)
+            elapsed = time.time() - start_time
+            print(f"{method}: 秩相关 {result.rank_correlation:.4f}, 耗时 {elapsed:.3f}秒, 固定项 {result.fixed_terms}")
+            if result.rank_correlation < 0.98 or elapsed > 1.0:
+                print(f"✗ {method} 标定效果或耗时不满足要求")
+                return False
+            if result.fixed_terms != ['delay_cost'] or result.weights.delay_weight != 0.25:
+                print("✗ 与分区无关的成本项应保留原权重")
+                return False
+        
+        # 成本函数入口返回标定后的权重
+        weights = CostFunction().optimize_weights(graph, partitions[:200], measured[:200])
+        if not isinstance(weights, CostWeights):
+            print("✗ optimize_weights 未返回CostWeights")
+            return False
+        
+        print("✓ 权重标定测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 权重标定测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_net_model():
+    """测试线网模型"""
+    print("\n" + "=" * 50)
+    print("测试线网模型模块")
+    print("=" * 50)
+    
+    try:
+        from net_model import NetModel
+        from cost_function import CostFunction
+        import networkx as nx
+        
+        # 驱动A扇出到三个负载
+        graph = nx.DiGraph()
+        graph.add_edges_from([('A', 'B'), ('A', 'C'), ('A', 'D'), ('D', 'E')])
+        
+        model = NetModel(graph)
+        model.set_partition({'A': 0, 'B': 1, 'C': 1, 'D': 1, 'E': 1})
+        print(f"线网统计: {model.analyze()}")
+        
+        if model.cut_width != 1.0:
+            print("✗ 同一驱动的扇出应只计一次")
+            return False
+        
+        # 增量翻转与整体重算一致
+        model.sync({'A': 0, 'B': 1, 'C': 0, 'D': 1, 'E': 0})
+        reference = NetModel(graph)
+        reference.set_partition({'A': 0, 'B': 1, 'C': 0, 'D': 1, 'E': 0})
+        if model.cut_width != reference.cut_width:
+            print("✗ 增量更新结果与重算不一致")
+            return False
+        
+        cost_func = CostFunction()
+        cost_func.set_net_model(model)
+        partition = {'A': 0, 'B': 1, 'C': 1, 'D': 1, 'E': 1}
+        print(f"依赖误差: {cost_func._calculate_dependency_error(graph, partition):.4f}")
+        
+        print("✓ 线网模型测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 线网模型测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_simulated_annealing():
+    """测试模拟退火算法"""
+    print("\n" + "=" * 50)
+    print("测试模拟退火算法模块")
+    print("=" * 50)
+    
+    try:
+        from simulated_annealing import SimulatedAnnealing, AnnealingConfig
+        import networkx as nx
+        
+        # 创建测试图
+        graph = nx.DiGraph()
+        graph.add_nodes_from(['A', 'B', 'C', 'D', 'E'])
+        graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E')])
+        
+        # 定义成本函数
+        def cost_function(g, partition):
+            cross_edges = 0
+            for edge in g.edges():
+                src, dst = edge
+                if partition[src] != partition[dst]:
+                    cross_edges += 1
+            return cross_edges
+        
+        # 配置模拟退火
+        config = AnnealingConfig(
+            initial_temperature=100.0,
+            final_temperature=0.1,
+            cooling_rate=0.95,
+            iterations_per_temp=20,
+            max_iterations=200
+        )
+        
+        # 执行优化
+        sa = SimulatedAnnealing(config)
+        sa.set_random_seed(42)
+        
+        start_time = time.time()
+        result = sa.optimize(graph, cost_function)
+        execution_time = time.time() - start_time
+        
+        print(f"优化结果: {result.best_cost}")
+        print(f"执行时间: {execution_time:.2f}秒")
+        print(f"收敛原因: {result.convergence_reason}")
+        
+        # 成本函数提供增量评估时，大部分移动不做完整评估，最优成本仍为精确值
+        from dfg_parser import DFGParser
+        from graph_reduction import GraphReducer
+        from cost_function import CostFunction, PartitionCost
+        
+        class CountingCost(PartitionCost):
+            calls = 0
+            
+            def __call__(self, graph, partition):
+                CountingCost.calls += 1
+                return super().__call__(graph, partition)
+        
+        reduced = GraphReducer().reduce(DFGParser().parse_dfg_file('dfg_files/4004.txt'))
+        counting = CountingCost(CostFunction(), reduced)
+        sa = SimulatedAnnealing(AnnealingConfig(initial_temperature=0.05, final_temperature=0.001,
+                                                cooling_rate=0.8, iterations_per_temp=50, max_iterations=500))
+        sa.set_random_seed(42)
+        delta_result = sa.optimize(reduced.graph, counting)
+        exact = PartitionCost(CostFunction(), reduced)(reduced.graph, delta_result.best_partition)
+        print(f"增量评估: {delta_result.iteration_count} 次迭代, {CountingCost.calls} 次完整评估, "
+              f"最优成本 {delta_result.best_cost:.6f}")
+        if abs(exact - delta_result.best_cost) > 1e-9 or CountingCost.calls >= delta_result.iteration_count:
+            print(f"✗ 增量评估结果错误: {delta_result.best_cost} != {exact}")
+            return False
+        nodes = list(reduced.graph.nodes())
+        partition = dict(delta_result.best_partition)
+        for node in nodes[:10]:
+            changes = {node: 1 - partition[node]}
+            moved = dict(partition, **changes)
+            expected = counting(reduced.graph, moved) - counting(reduced.graph, partition)
+            if abs(counting.delta(reduced.graph, partition, changes) - expected) > 1e-9:
+                print(f"✗ 增量成本与两次完整评估之差不一致: {node}")
+                return False
+        
+        # 分析结果
+        analysis = sa.analyze_result(result)
+        print(f"结果分析: {analysis}")
+        
+        print("✓ 模拟退火算法测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 模拟退火算法测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_k_way_partitioning():
+    """测试多域分区"""
+    print("\n" + "=" * 50)
+    print("测试多域分区")
+    print("=" * 50)
+    
+    try:
+        from cost_function import CostFunction, PartitionDomains
+        from simulated_annealing import SimulatedAnnealing, AnnealingConfig
+        from net_model import NetModel
+        from interface_generator import InterfaceGenerator
+        import networkx as nx
+        
+        graph = nx.DiGraph()
+        graph.add_edges_from([('A', 'B'), ('A', 'C'), ('A', 'D'), ('D', 'E'), ('E', 'F')])
+        
+        domains = PartitionDomains(kinds=['electronic', 'onn', 'onn'], capacities=[None, 2, 2])
+        cost_func = CostFunction(domains=domains)
+        
+        def cost_wrapper(g, partition):
+            onn_outputs = [node for node, part in partition.items() if domains.is_onn(part)]
+            electronic_outputs = [node for node, part in partition.items() if domains.is_electronic(part)]
+            return cost_func.calculate_total_cost(g, partition, onn_outputs, electronic_outputs).total_cost
+        
+        sa = SimulatedAnnealing(AnnealingConfig(max_iterations=200, iterations_per_temp=20, num_domains=3))
+        sa.set_random_seed(42)
+        result = sa.optimize(graph, cost_wrapper)
+        print(f"三域分区: {result.best_partition}, 成本: {result.best_cost:.4f}")
+        
+        if not set(result.best_partition.values()) <= {0, 1, 2}:
+            print("✗ 分区取值超出域范围")
+            return False
+        
+        # 驱动A跨越三个域时连通度减一为2
+        model = NetModel(graph, num_domains=3)
+        model.set_partition({'A': 0, 'B': 1, 'C': 2, 'D': 0, 'E': 0, 'F': 0})
+        if model.cut_width != 2.0:
+            print(f"✗ 三域线网割值错误: {model.cut_width}")
+            return False
+        model.move('C', 1)
+        if model.cut_width != 1.0:
+            print(f"✗ 移动后线网割值错误: {model.cut_width}")
+            return False
+        
+        generator = InterfaceGenerator(domains=domains)
+        analysis = generator.analyze_partition_interface(graph, {'A': 0, 'B': 1, 'C': 2, 'D': 0, 'E': 0, 'F': 0})
+        code = generator.generate_domain_interface(analysis, 2)
+        if 'module onn2_interface' not in code:
+            print("✗ 未生成域接口模块")
+            return False
+
+        # NAS架构分析按域类型统计：两个ONN核的节点都计为ONN节点
+        from neural_architecture_search import NeuralArchitectureSearch, NASConfig, Architecture
+        nas = NeuralArchitectureSearch(NASConfig(num_domains=3), domains)
+        architecture = Architecture(partition={'A': 0, 'B': 1, 'C': 2, 'D': 2, 'E': 0, 'F': 2},
+                                    connectivity={}, layer_config={})
+        analysis = nas.analyze_architecture(architecture)
+        if analysis['onn_nodes'] != 4 or analysis['electronic_nodes'] != 2 or \
+                analysis['domain_counts'] != [2, 1, 3] or abs(analysis['balance_ratio'] - 1 / 3) > 1e-12:
+            print(f"✗ 多域架构分析错误: {analysis}")
+            return False
+        
+        print("✓ 多域分区测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 多域分区测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_population_annealing():
+    """测试种群退火算法"""
+    print("\n" + "=" * 50)
+    print("测试种群退火算法")
+    print("=" * 50)
+    
+    try:
+        from simulated_annealing import PopulationAnnealing, PopulationAnnealingConfig
+        import networkx as nx
+        
+        # 创建测试图
+        graph = nx.DiGraph()
+        graph.add_nodes_from(['A', 'B', 'C', 'D', 'E'])
+        graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E')])
+        
+        # 定义成本函数
+        def cost_function(g, partition):
+            cross_edges = 0
+            for edge in g.edges():
+                src, dst = edge
+                if partition[src] != partition[dst]:
+                    cross_edges += 1
+            return cross_edges
+        
+        # 配置种群退火
+        config = PopulationAnnealingConfig(
+            initial_temperature=10.0,
+            final_temperature=0.1,
+            cooling_rate=0.8,
+            iterations_per_temp=5,
+            max_iterations=200,
+            num_replicas=8
+        )
+        
+        pa = PopulationAnnealing(config)
+        pa.set_random_seed(42)
+        
+        start_time = time.time()
+        result = pa.optimize(graph, cost_function)
+        execution_time = time.time() - start_time
+        
+        print(f"优化结果: {result.best_cost}")
+        print(f"执行时间: {execution_time:.2f}秒")
+        print(f"收敛原因: {result.convergence_reason}")
+        
+        # 多进程评估与串行结果一致（成本函数须可序列化）
+        from cost_function import CostFunction, PartitionCost
+        cost_wrapper = PartitionCost(CostFunction())
+        results = []
+        for num_workers in (1, 2):
+            pa = PopulationAnnealing(PopulationAnnealingConfig(
+                initial_temperature=1.0, final_temperature=0.1, cooling_rate=0.8,
+                iterations_per_temp=5, max_iterations=50, num_replicas=4, num_workers=num_workers
+            ))
+            pa.set_random_seed(42)
+            results.append(pa.optimize(graph, cost_wrapper))
+        print(f"串行/并行成本: {results[0].best_cost} / {results[1].best_cost}")
+        if results[0].best_partition != results[1].best_partition or results[0].best_cost != results[1].best_cost:
+            print("✗ 并行种群退火与串行结果不一致")
+            return False
+
+        # 副本使用各自的随机数生成器：串行执行时调用方的全局随机状态只被取走一个种子
+        import random
+        pa = PopulationAnnealing(config)
+        pa.set_random_seed(7)
+        pa.optimize(graph, cost_function, initial_partition={node: 0 for node in graph.nodes()})
+        state_after = random.getstate()
+        random.seed(7)
+        random.getrandbits(32)
+        if state_after != random.getstate():
+            print("✗ 副本扫描改变了全局随机状态")
+            return False
+
+        print("✓ 种群退火算法测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 种群退火算法测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_neural_architecture_search():
+    """测试神经网络架构搜索"""
+    print("\n" + "=" * 50)
+    print("测试神经网络架构搜索模块")
+    print("=" * 50)
+    
+    try:
+        from neural_architecture_search import NeuralArchitectureSearch, NASConfig
+        import networkx as nx
+        
+        # 创建测试图
+        graph = nx.DiGraph()
+        graph.add_nodes_from(['A', 'B', 'C', 'D', 'E', 'F'])
+        graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E'), ('E', 'F')])
+        
+        # 定义成本函数
+        def cost_function(g, partition):
+            cross_edges = 0
+            for edge in g.edges():
+                src, dst = edge
+                if partition[src] != partition[dst]:
+                    cross_edges += 1
+            return cross_edges
+        
+        # 配置NAS
+        config = NASConfig(
+            population_size=20,
+            generations=30,
+            mutation_rate=0.15,
+            crossover_rate=0.8
+        )
+        
+        # 执行NAS
+        nas = NeuralArchitectureSearch(config)
+        
+        start_time = time.time()
+        nas.evolve(graph, cost_function)
+        execution_time = time.time() - start_time
+        
+        # 获取最佳架构
+        best_arch = nas.get_best_architecture()
+        if best_arch:
+            analysis = nas.analyze_architecture(best_arch)
+            print(f"最佳适应度: {best_arch.fitness}")
+            print(f"架构分析: {analysis}")
+        
+        print(f"执行时间: {execution_time:.2f}秒")
+        print("✓ 神经网络架构搜索测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 神经网络架构搜索测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_crossover_operators():
+    """测试图感知交叉算子"""
+    print("\n" + "=" * 50)
+    print("测试图感知交叉算子")
+    print("=" * 50)
+    
+    try:
+        import random
+        from neural_architecture_search import NeuralArchitectureSearch, NASConfig
+        import networkx as nx
+        
+        # 随机DAG：每个节点连到若干较早的节点
+        random.seed(0)
+        graph = nx.DiGraph()
+        nodes = [f'n{i}' for i in range(40)]
+        graph.add_nodes_from(nodes)
+        for i in range(1, len(nodes)):
+            for j in random.sample(range(i), min(i, 2)):
+                graph.add_edge(nodes[j], nodes[i])
+        
+        for operator in ('bfs', 'level', 'cone'):
+            nas = NeuralArchitectureSearch(NASConfig(crossover_operator=operator))
+            nas._prepare_graph(graph)
+            for _ in range(50):
+                region = nas._select_crossover_region(nodes)
+                if not region or len(region) >= len(nodes) or len(set(region)) != len(region):
+                    print(f"✗ {operator}: 区域大小 {len(region)} 不合法")
+                    return False
+                if operator == 'level':
+                    levels = sorted({nas._node_levels[node] for node in region})
+                    contiguous = levels == list(range(levels[0], levels[-1] + 1))
+                else:
+                    contiguous = nx.is_weakly_connected(graph.subgraph(region))
+                if not contiguous:
+                    print(f"✗ {operator}: 区域不连通/层级不连续")
+                    return False
+            print(f"{operator}: 50 个区域均连通且小于基因组")
+        
+        print("✓ 图感知交叉算子测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 图感知交叉算子测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_partition_only_genome():
+    """测试精简基因组模式"""
+    print("\n" + "=" * 50)
+    print("测试精简基因组模式")
+    print("=" * 50)
+    
+    try:
+        import random
+        from neural_architecture_search import NeuralArchitectureSearch, NASConfig, Architecture
+        import networkx as nx
+        
+        graph = nx.DiGraph()
+        graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E'), ('E', 'F')])
+        nas = NeuralArchitectureSearch(NASConfig(partition_only=True, mutation_rate=1.0, crossover_rate=1.0))
+        nas._prepare_graph(graph)
+        
+        layer_config = {'hidden_layers': 2, 'neurons_per_layer': 32, 'activation': 'relu', 'dropout_rate': 0.1}
+        connectivity = {'A': ['B'], 'B': ['C']}
+        random.seed(0)
+        parents = [Architecture(partition={node: random.randint(0, 1) for node in graph.nodes()},
+                                connectivity={node: list(n) for node, n in connectivity.items()},
+                                layer_config=dict(layer_config)) for _ in range(2)]
+        
+        # 复制不共享分区字典
+        copied = nas._copy_architecture(parents[0])
+        copied.partition['A'] = 1 - copied.partition['A']
+        if copied.partition is parents[0].partition or copied.partition['A'] == parents[0].partition['A']:
+            print("✗ 复制的架构与原架构共享分区")
+            return False
+        
+        # 变异与交叉只改变分区
+        for _ in range(20):
+            children = nas.crossover(*parents)
+            for child in children:
+                nas.mutation(child)
+                if child.layer_config != layer_config or child.connectivity != connectivity:
+                    print("✗ 精简模式下层配置或连接性基因被修改")
+                    return False
+            parents = list(children)
+        
+        print(f"20代后分区: {parents[0].partition}")
+        print("✓ 精简基因组模式测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 精简基因组模式测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_term_log():
+    """测试成本项日志"""
+    print("\n" + "=" * 50)
+    print("测试成本项日志模块")
     print("=" * 50)
     
     try:
+        from term_log import TermLog
         from cost_function import CostFunction, CostWeights
         import networkx as nx
+        import tempfile
         
-        # 创建测试图
         graph = nx.DiGraph()
-        graph.add_nodes_from(['A', 'B', 'C', 'D'])
         graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D')])
+        nodes = list(graph.nodes())
         
-        # 测试分区
-        partition = {'A': 0, 'B': 1, 'C': 0, 'D': 1}
+        with tempfile.TemporaryDirectory() as directory:
+            cost_func = CostFunction()
+            log = TermLog(nodes, directory, initial_capacity=4)
+            cost_func.set_term_log(log)
+            
+            for mask in range(2 ** len(nodes)):
+                partition = {node: (mask >> i) & 1 for i, node in enumerate(nodes)}
+                onn = [n for n, p in partition.items() if p == 1]
+                cost_func.calculate_total_cost(graph, partition, onn, [n for n in nodes if n not in onn])
+            log.flush()
+            print(f"日志统计: {log.analyze()}")
+            
+            # 重新打开后按新权重排序，与直接重算一致
+            reopened = TermLog(nodes, directory)
+            weights = CostWeights(area_weight=0.0, interface_weight=1.0)
+            cost, partition = reopened.rerank(weights, top_k=1)[0]
+            
+            cost_func = CostFunction(weights)
+            onn = [n for n, p in partition.items() if p == 1]
+            expected = cost_func.calculate_total_cost(graph, partition, onn,
+                                                      [n for n in nodes if n not in onn]).total_cost
+            if len(reopened) != 16 or abs(cost - expected) > 1e-12:
+                print(f"✗ 重新排序结果错误: {cost} != {expected}")
+                return False
+            del log, reopened
         
-        # 创建成本函数
+        # 启用扩展成本项时日志记录全部成本项，重新排序与总成本一致
         cost_func = CostFunction()
-        metrics = cost_func.calculate_total_cost(
-            graph=graph,
-            partition=partition,
-            onn_outputs=['B', 'D'],
-            electronic_outputs=['A', 'C']
-        )
+        cost_func.add_term('cut_edges', 0.5)
+        log = TermLog(nodes, term_names=cost_func.term_names())
+        cost_func.set_term_log(log)
+        totals = {}
+        for mask in range(2 ** len(nodes)):
+            partition = {node: (mask >> i) & 1 for i, node in enumerate(nodes)}
+            onn = [n for n, p in partition.items() if p == 1]
+            totals[mask] = cost_func.calculate_total_cost(graph, partition, onn,
+                                                          [n for n in nodes if n not in onn]).total_cost
+        cost, partition = log.rerank(cost_func.weights, top_k=1, extra_weights={'cut_edges': 0.5})[0]
+        if abs(cost - min(totals.values())) > 1e-12:
+            print(f"✗ 含扩展成本项的重新排序错误: {cost} != {min(totals.values())}")
+            return False
+        print(f"日志列: {log.term_names}")
         
-        print(f"成本计算结果: {metrics}")
-        print("✓ 成本函数测试通过")
+        print("✓ 成本项日志测试通过")
         return True
         
     except Exception as e:
-        print(f"✗ 成本函数测试失败: {e}")
+        print(f"✗ 成本项日志测试失败: {e}")
         traceback.print_exc()
         return False
 
-def test_simulated_annealing():
-    """测试模拟退火算法"""
+def test_constraints():
+    """测试资源预算约束"""
     print("\n" + "=" * 50)
-    print("测试模拟退火算法模块")
+    print("测试资源约束模块")
     print("=" * 50)
     
     try:
+        from constraints import ConstraintChecker, ResourceBudgets
+        from cost_function import CostFunction
         from simulated_annealing import SimulatedAnnealing, AnnealingConfig
         import networkx as nx
         
+        # 星形图：hub度数高，ONN功耗预算只够容纳少量连接
+        graph = nx.DiGraph()
+        graph.add_edges_from([('hub', f'n{i}') for i in range(8)] + [('a', 'b'), ('b', 'c')])
+        cost_func = CostFunction()
+        budgets = ResourceBudgets(onn_power=14.0)
+        checker = ConstraintChecker(graph, cost_func, budgets)
+        
+        # 增量累加量与整体重算一致
+        partition = {node: 0 for node in graph.nodes()}
+        checker.set_partition(partition)
+        moved = dict(partition, a=1, b=1)
+        if not checker.allows(moved, ['a', 'b']):
+            print("✗ 预算内的移动被拒绝")
+            return False
+        checker.commit(moved, ['a', 'b'])
+        if checker.allows(dict(moved, hub=1), ['hub']):
+            print("✗ 超出功耗预算的移动未被拒绝")
+            return False
+        incremental = checker.analyze()['usage']
+        checker.set_partition(moved)
+        if incremental != checker.analyze()['usage']:
+            print(f"✗ 增量累加量与重算不一致: {incremental}")
+            return False
+        
+        # 不可行分区可被修复
+        repaired = checker.repair({node: 1 for node in graph.nodes()})
+        if not checker.is_feasible(repaired):
+            print(f"✗ 修复失败: {checker.violations(repaired)}")
+            return False
+        
+        # 偏好ONN的成本下，模拟退火的结果仍满足预算，且被拒绝的移动不计算成本
+        evaluations = []
+        def cost_function(graph, partition):
+            evaluations.append(partition)
+            return -sum(partition.values())
+        
+        sa = SimulatedAnnealing(AnnealingConfig(initial_temperature=1.0, final_temperature=0.1,
+                                                iterations_per_temp=20, max_iterations=500))
+        sa.set_random_seed(0)
+        sa.set_constraints(checker)
+        result = sa.optimize(graph, cost_function)
+        if not checker.is_feasible(result.best_partition):
+            print(f"✗ 模拟退火结果超出预算: {checker.violations(result.best_partition)}")
+            return False
+        if any(not checker.is_feasible(partition) for partition in evaluations):
+            print("✗ 超出预算的分区仍被计算成本")
+            return False
+        print(f"最优ONN节点: {sorted(n for n, p in result.best_partition.items() if p == 1)}")
+        print(f"拒绝移动: {checker.rejected_moves}/{checker.checked_moves}")
+
+        # 化简图上的用量与展开到原图后的用量一致
+        import random
+        from dfg_parser import DFGParser
+        from graph_reduction import GraphReducer
+        original = DFGParser().parse_dfg_file('dfg_files/4004.txt')
+        reduction = GraphReducer().reduce(original)
+        reduced_checker = ConstraintChecker(reduction.graph, cost_func, budgets, reduction)
+        original_checker = ConstraintChecker(original, cost_func, budgets)
+        rng = random.Random(0)
+        reduced_partition = {node: rng.randint(0, 1) for node in reduction.graph.nodes()}
+        reduced_checker.set_partition(reduced_partition)
+        original_checker.set_partition(reduction.expand_partition(reduced_partition))
+        reduced_usage = reduced_checker.analyze()['usage']
+        original_usage = original_checker.analyze()['usage']
+        if any(abs(reduced_usage[domain][name] - value) > 1e-9
+               for domain, usage in original_usage.items() for name, value in usage.items()):
+            print(f"✗ 化简图用量与原图不一致: {reduced_usage} vs {original_usage}")
+            return False
+
+        print("✓ 资源约束测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 资源约束测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_pareto_archive():
+    """测试帕累托存档"""
+    print("\n" + "=" * 50)
+    print("测试帕累托前沿模块")
+    print("=" * 50)
+    
+    try:
+        from pareto import ParetoArchive, fast_non_dominated_sort, crowding_distance
+        from cost_function import CostFunction
+        import numpy as np
+        import networkx as nx
+        
+        points = np.array([[1.0, 4.0], [2.0, 2.0], [4.0, 1.0], [3.0, 3.0], [4.0, 4.0]])
+        fronts = fast_non_dominated_sort(points)
+        print(f"非支配前沿: {fronts}")
+        if sorted(fronts[0]) != [0, 1, 2] or fronts[1] != [3] or fronts[2] != [4]:
+            print("✗ 非支配排序结果错误")
+            return False
+        
+        archive = ParetoArchive()
+        for i, point in enumerate(points):
+            archive.add(point, payload=i)
+        if sorted(payload for _, payload in archive.entries()) != [0, 1, 2]:
+            print("✗ 存档中保留了被支配解")
+            return False
+        
+        distances = crowding_distance(points[fronts[0]])
+        print(f"拥挤距离: {distances}")
+        
+        # 成本指标可转换为目标向量
+        graph = nx.DiGraph()
+        graph.add_edges_from([('A', 'B'), ('B', 'C')])
+        metrics = CostFunction().calculate_total_cost(graph, {'A': 0, 'B': 1, 'C': 0}, ['B'], ['A', 'C'])
+        print(f"目标向量: {metrics.objective_vector()}")
+        
+        print("✓ 帕累托前沿测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 帕累托前沿测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_estimation_of_distribution():
+    """测试分布估计算法"""
+    print("\n" + "=" * 50)
+    print("测试分布估计算法模块")
+    print("=" * 50)
+    
+    try:
+        from estimation_of_distribution import EstimationOfDistribution, EDAConfig
+        import networkx as nx
+        
         # 创建测试图
         graph = nx.DiGraph()
         graph.add_nodes_from(['A', 'B', 'C', 'D', 'E'])
         graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E')])
         
-        # 定义成本函数
+        # 定义成本函数（可分离项：偏好ONN）
         def cost_function(g, partition):
-            cross_edges = 0
-            for edge in g.edges():
-                src, dst = edge
-                if partition[src] != partition[dst]:
-                    cross_edges += 1
-            return cross_edges
-        
-        # 配置模拟退火
-        config = AnnealingConfig(
-            initial_temperature=100.0,
-            final_temperature=0.1,
-            cooling_rate=0.95,
-            iterations_per_temp=20,
-            max_iterations=200
-        )
+            return sum(1 for part in partition.values() if part == 0)
         
         # 执行优化
-        sa = SimulatedAnnealing(config)
-        sa.set_random_seed(42)
+        eda = EstimationOfDistribution(EDAConfig(batch_size=50, max_batches=20))
+        eda.set_random_seed(42)
         
         start_time = time.time()
-        result = sa.optimize(graph, cost_function)
+        result = eda.optimize(graph, cost_function)
         execution_time = time.time() - start_time
         
         print(f"优化结果: {result.best_cost}")
+        print(f"批次数: {result.batch_count}")
         print(f"执行时间: {execution_time:.2f}秒")
         print(f"收敛原因: {result.convergence_reason}")
         
-        # 分析结果
-        analysis = sa.analyze_result(result)
-        print(f"结果分析: {analysis}")
+        if result.best_cost != 0:
+            print("✗ 分布估计算法未找到最优解")
+            return False
         
-        print("✓ 模拟退火算法测试通过")
+        print("✓ 分布估计算法测试通过")
         return True
         
     except Exception as e:
-        print(f"✗ 模拟退火算法测试失败: {e}")
+        print(f"✗ 分布估计算法测试失败: {e}")
         traceback.print_exc()
         return False
 
-def test_neural_architecture_search():
-    """测试神经网络架构搜索"""
+def test_milp_partitioner():
+    """测试MILP精确分区"""
     print("\n" + "=" * 50)
-    print("测试神经网络架构搜索模块")
+    print("测试MILP精确分区模块")
     print("=" * 50)
     
     try:
-        from neural_architecture_search import NeuralArchitectureSearch, NASConfig
+        from milp_partitioner import MILPPartitioner, MILPConfig
         import networkx as nx
         
         # 创建测试图
@@ -150,43 +1462,184 @@ def test_neural_architecture_search():
         graph.add_nodes_from(['A', 'B', 'C', 'D', 'E', 'F'])
         graph.add_edges_from([('A', 'B'), ('B', 'C'), ('C', 'D'), ('D', 'E'), ('E', 'F')])
         
-        # 定义成本函数
-        def cost_function(g, partition):
-            cross_edges = 0
-            for edge in g.edges():
-                src, dst = edge
-                if partition[src] != partition[dst]:
-                    cross_edges += 1
-            return cross_edges
+        partitioner = MILPPartitioner(MILPConfig(time_limit=10.0))
+        result = partitioner.optimize(graph)
         
-        # 配置NAS
-        config = NASConfig(
-            population_size=20,
-            generations=30,
-            mutation_rate=0.15,
-            crossover_rate=0.8
-        )
+        print(f"最优分区: {result.best_partition}")
+        print(f"模型成本: {result.best_cost}, 下界: {result.lower_bound}")
+        print(f"求解时间: {result.solve_time:.3f}秒")
         
-        # 执行NAS
-        nas = NeuralArchitectureSearch(config)
+        if not result.is_optimal:
+            print("✗ MILP未证明最优")
+            return False
+
+        # 在化简图上求解时模型与原图一致：模型成本与实际成本都和原图上的求解相同
+        from dfg_parser import DFGParser
+        from graph_reduction import GraphReducer
+        from cost_function import PartitionCost
+        original = DFGParser().parse_dfg_file('dfg_files/4004.txt')
+        reduction = GraphReducer().reduce(original)
+        original_result = partitioner.optimize(original)
+        reduced_result = partitioner.optimize(reduction.graph, reduction=reduction)
+        original_cost = PartitionCost(partitioner.cost_function)(original, original_result.best_partition)
+        reduced_cost = PartitionCost(partitioner.cost_function, reduction)(reduction.graph,
+                                                                          reduced_result.best_partition)
+        print(f"4004: 原图模型成本 {original_result.best_cost:.6f}, 化简图模型成本 {reduced_result.best_cost:.6f}")
+        if abs(original_result.best_cost - reduced_result.best_cost) > 1e-6 or \
+                abs(original_cost - reduced_cost) > 1e-6:
+            print(f"✗ 化简图上的MILP目标与原图不一致: {reduced_cost} vs {original_cost}")
+            return False
         
-        start_time = time.time()
-        nas.evolve(graph, cost_function)
-        execution_time = time.time() - start_time
+        print("✓ MILP精确分区测试通过")
+        return True
         
-        # 获取最佳架构
-        best_arch = nas.get_best_architecture()
-        if best_arch:
-            analysis = nas.analyze_architecture(best_arch)
-            print(f"最佳适应度: {best_arch.fitness}")
-            print(f"架构分析: {analysis}")
+    except Exception as e:
+        print(f"✗ MILP精确分区测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_min_cut_partitioner():
+    """测试最小割分区"""
+    print("\n" + "=" * 50)
+    print("测试最小割分区模块")
+    print("=" * 50)
+    
+    try:
+        from min_cut_partitioner import MinCutPartitioner, MinCutConfig
+        import networkx as nx
         
-        print(f"执行时间: {execution_time:.2f}秒")
-        print("✓ 神经网络架构搜索测试通过")
+        # 创建测试图
+        graph = nx.DiGraph()
+        graph.add_nodes_from(['A', 'B', 'C', 'D'], is_linear=True)
+        graph.nodes['D']['is_linear'] = False
+        graph.add_edges_from([('A', 'B'), ('A', 'C'), ('B', 'D'), ('C', 'D')])
+        
+        partitioner = MinCutPartitioner(MinCutConfig(onn_seeds=['A']))
+        result = partitioner.optimize(graph)
+        
+        print(f"分区: {result.best_partition}")
+        print(f"割容量: {result.cut_value}")
+        
+        if result.best_partition['A'] != 1 or result.best_partition['D'] != 0 or result.cut_value != 2:
+            print("✗ 最小割结果不正确")
+            return False
+        
+        print("✓ 最小割分区测试通过")
         return True
         
     except Exception as e:
-        print(f"✗ 神经网络架构搜索测试失败: {e}")
+        print(f"✗ 最小割分区测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_graph_reduction():
+    """测试图化简"""
+    print("\n" + "=" * 50)
+    print("测试图化简模块")
+    print("=" * 50)
+    
+    try:
+        from graph_reduction import GraphReducer
+        from dfg_parser import OperatorType
+        import networkx as nx
+        
+        # 创建测试图：Rename -> 直连线 -> 比较，外加一个孤立常量
+        graph = nx.DiGraph()
+        graph.add_node('top._rn0_x', operator_type=OperatorType.PLUS, is_linear=True)
+        graph.add_node('top.w', operator_type=OperatorType.TERMINAL, is_linear=True)
+        graph.add_node('top.eq', operator_type=OperatorType.EQ, is_linear=False)
+        graph.add_node('top.k', operator_type=OperatorType.INT_CONST, is_linear=False)
+        graph.add_edges_from([('top._rn0_x', 'top.w'), ('top.w', 'top.eq')])
+        
+        reducer = GraphReducer()
+        reduced = reducer.reduce(graph)
+        stats = reducer.analyze_reduction(reduced)
+        print(f"化简统计: {stats}")
+        
+        expanded = reduced.expand_partition({node: 1 for node in reduced.graph.nodes()})
+        if set(expanded) != set(graph.nodes()):
+            print("✗ 分区展开后节点不完整")
+            return False
+        
+        # 化简图上的成本与展开到原图后的成本一致
+        import random
+        import numpy as np
+        from dfg_parser import DFGParser
+        from cost_function import CostFunction, PartitionCost
+        original = DFGParser().parse_dfg_file('dfg_files/4004.txt')
+        reduced = reducer.reduce(original)
+        cost_function = CostFunction()
+        reduced_cost = PartitionCost(cost_function, reduced)
+        original_cost = PartitionCost(cost_function)
+        random.seed(0)
+        nodes = list(reduced.graph.nodes())
+        samples = np.array([[random.randint(0, 1) for _ in nodes] for _ in range(5)])
+        batch = reduced_cost.batch(reduced.graph, nodes, samples)
+        for row, batch_cost in zip(samples, batch):
+            partition = dict(zip(nodes, row.tolist()))
+            cost = reduced_cost(reduced.graph, partition)
+            expanded_cost = original_cost(original, reduced.expand_partition(partition))
+            if not np.isclose(cost, expanded_cost) or not np.isclose(batch_cost, expanded_cost):
+                print(f"✗ 化简图成本 {cost} / 批量 {batch_cost} 与原图成本 {expanded_cost} 不一致")
+                return False
+        print(f"化简图与原图成本一致: {len(reduced.graph)}/{len(original)} 个节点")
+        
+        print("✓ 图化简测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 图化简测试失败: {e}")
+        traceback.print_exc()
+        return False
+
+def test_pattern_cache():
+    """测试结构模式缓存"""
+    print("\n" + "=" * 50)
+    print("测试结构模式缓存模块")
+    print("=" * 50)
+    
+    try:
+        from pattern_cache import PatternCache
+        import networkx as nx
+        
+        # 创建两个结构相同的加法-比较区域
+        graph = nx.DiGraph()
+        for prefix in ('u0', 'u1'):
+            graph.add_node(f'{prefix}.a', operator_type='Terminal', is_linear=True)
+            graph.add_node(f'{prefix}.b', operator_type='Terminal', is_linear=True)
+            graph.add_node(f'{prefix}.sum', operator_type='Plus', is_linear=True)
+            graph.add_edges_from([(f'{prefix}.a', f'{prefix}.sum'), (f'{prefix}.b', f'{prefix}.sum')])
+        
+        cache = PatternCache(depth=1, min_size=3)
+        partition = {node: 0 for node in graph.nodes()}
+        partition.update({'u0.a': 1, 'u0.b': 1, 'u0.sum': 1})
+        cache.record(graph.subgraph(['u0.a', 'u0.b', 'u0.sum']), partition)
+        
+        assigned, matches = cache.apply(graph, {node: 0 for node in graph.nodes()})
+        print(f"匹配区域: {[(m.root, m.members) for m in matches]}")
+        
+        if len(matches) != 2 or any(assigned[node] != 1 for node in graph.nodes()):
+            print("✗ 模板未正确匹配或预分配")
+            return False
+        
+        # 模板按局部得分比较：小设计中记录的较差子分区会被大设计中更好的子分区替换
+        cache = PatternCache(depth=1, min_size=3)
+        cache.record(graph.subgraph(['u0.a', 'u0.b', 'u0.sum']), {'u0.a': 0, 'u0.b': 1, 'u0.sum': 1})
+        large = nx.union(graph, nx.path_graph([f'w{i}' for i in range(20)], create_using=nx.DiGraph))
+        large_partition = {node: i % 2 for i, node in enumerate(large.nodes())}
+        large_partition.update({'u1.a': 1, 'u1.b': 1, 'u1.sum': 1})
+        cache.record(large, large_partition)
+        entry = next(iter(cache.templates.values()))
+        print(f"模板子分区: {entry['assignment']}, 局部得分 {entry['score']}")
+        if len(cache.templates) != 1 or entry['score'] != 0.0:
+            print("✗ 更好的子分区没有替换已记录的模板")
+            return False
+        
+        print("✓ 结构模式缓存测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 结构模式缓存测试失败: {e}")
         traceback.print_exc()
         return False
 
@@ -234,6 +1687,84 @@ def test_interface_generator():
         traceback.print_exc()
         return False
 
+def test_watch():
+    """测试监视模式的增量更新"""
+    print("\n" + "=" * 50)
+    print("测试监视模式模块")
+    print("=" * 50)
+    
+    try:
+        import tempfile
+        import networkx as nx
+        from dfg_parser import DFGParser
+        from simulated_annealing import SimulatedAnnealing, AnnealingConfig
+        from watch import tree_signatures, diff_graphs, apply_delta, neighborhood, warm_start_partition
+        
+        # 修改4004中的一个嵌套运算符后重新解析
+        with open('dfg_files/4004.txt', 'r', encoding='utf-8') as f:
+            text = f.read()
+        with tempfile.TemporaryDirectory() as directory:
+            dfg_file = os.path.join(directory, '4004.txt')
+            with open(dfg_file, 'w', encoding='utf-8') as f:
+                f.write(text.replace('(Operator Or', '(Operator And', 1))
+            old_parser, new_parser = DFGParser(), DFGParser()
+            old_graph = old_parser.parse_dfg_file('dfg_files/4004.txt')
+            new_graph = new_parser.parse_dfg_file(dfg_file)
+        
+        delta = diff_graphs(old_graph, new_graph, tree_signatures(old_parser), tree_signatures(new_parser))
+        print(f"DFG变化: {delta.summary()}")
+        if not delta.changed_nodes:
+            print("✗ 未检测到修改的节点")
+            return False
+        
+        apply_delta(old_graph, new_graph, delta)
+        if set(old_graph.edges()) != set(new_graph.edges()) or \
+                any(old_graph.nodes[node] != new_graph.nodes[node] for node in new_graph):
+            print("✗ 打补丁后的图与新图不一致")
+            return False
+        
+        # 受影响邻域内的局部搜索不移动邻域外的节点
+        affected = neighborhood(new_graph, delta.touched_nodes(), 2)
+        previous = {node: i % 2 for i, node in enumerate(new_graph.nodes())}
+        initial = warm_start_partition(new_graph, previous)
+        print(f"受影响节点: {len(affected)}/{len(new_graph)}")
+        
+        def cost_function(g, partition):
+            return sum(partition[src] != partition[dst] for src, dst in g.edges())
+        
+        sa = SimulatedAnnealing(AnnealingConfig(initial_temperature=1.0, final_temperature=0.01,
+                                                cooling_rate=0.9, iterations_per_temp=20, max_iterations=200))
+        sa.set_random_seed(42)
+        sa.set_movable_nodes(sorted(affected))
+        result = sa.optimize(new_graph, cost_function, initial)
+        moved = [node for node in new_graph if result.best_partition[node] != initial[node]]
+        print(f"移动节点: {len(moved)}, 成本 {cost_function(new_graph, initial)} -> {result.best_cost}")
+        if any(node not in affected for node in moved):
+            print("✗ 邻域外的节点被移动")
+            return False
+        
+        # 图缓存命中时解析器没有赋值树，监视模式绕过图缓存解析
+        from main import VerilogPartitioner
+        from graph_cache import GraphCache
+        from watch import DesignWatcher
+        with tempfile.TemporaryDirectory() as directory:
+            partitioner = VerilogPartitioner()
+            partitioner.config['dfg_file'] = 'dfg_files/4004.txt'
+            partitioner.graph_cache = GraphCache(directory)
+            partitioner.graph_cache.parse(DFGParser(), 'dfg_files/4004.txt')
+            DesignWatcher(partitioner)._parse()
+            if partitioner.graph_cache.hits != 0 or not partitioner.dfg_parser.operator_trees:
+                print("✗ 监视模式的解析命中了图缓存，赋值树为空")
+                return False
+        
+        print("✓ 监视模式测试通过")
+        return True
+        
+    except Exception as e:
+        print(f"✗ 监视模式测试失败: {e}")
+        traceback.print_exc()
+        return False
+
 def test_integration():
     """测试系统集成"""
     print("\n" + "=" * 50)
@@ -270,10 +1801,34 @@ def run_all_tests():
     
     tests = [
         test_dfg_parser,
+        test_bit_width_inference,
+        test_streaming_parser,
+        test_bind_tree_parser,
+        test_graph_cache,
+        test_verilog_frontend,
+        test_batch_frontend,
+        test_frontend_cache,
+        test_hierarchy,
         test_cost_function,
+        test_cost_terms,
+        test_weight_calibration,
+        test_net_model,
         test_simulated_annealing,
+        test_k_way_partitioning,
+        test_population_annealing,
         test_neural_architecture_search,
+        test_crossover_operators,
+        test_partition_only_genome,
+        test_pareto_archive,
+        test_term_log,
+        test_constraints,
+        test_estimation_of_distribution,
+        test_milp_partitioner,
+        test_min_cut_partitioner,
+        test_graph_reduction,
+        test_pattern_cache,
         test_interface_generator,
+        test_watch,
         test_integration
     ]
     